@@ -0,0 +1,150 @@
+# Built-in imports
+from typing import Iterator, Optional
+
+# External imports
+from aws_lambda_powertools import Logger
+
+# Own imports
+from access_patterns.recipes import Recipes
+from helpers.async_dynamodb_helper import run_in_executor
+from models.recipes import (
+    RecipeBatchCreateResultModel,
+    RecipeModel,
+    RecipesBatchGetModel,
+    RecipesDeltaModel,
+    RecipesPageModel,
+)
+
+
+class AsyncRecipes:
+    """
+    Async version of the <Recipes> access pattern for the "async def" routes.
+    Each access pattern (cache lookups, DynamoDB calls and models) runs as a
+    single unit in the bounded thread pool, so the event loop is never blocked.
+    """
+
+    def __init__(
+        self,
+        user_email: str,
+        logger: Optional[Logger] = None,
+        use_cache: bool = True,
+    ) -> None:
+        """
+        :param user_email (str): User email user to identify the RECIPE items.
+        :param logger (Optional(Logger)): Logger object.
+        :param use_cache (bool): Serve the reads from the cache (when it is enabled).
+        """
+        self.recipes = Recipes(
+            user_email=user_email, logger=logger, use_cache=use_cache
+        )
+
+    def iter_recipe_pages(
+        self, fields: Optional[list[str]] = None
+    ) -> Iterator[list[dict]]:
+        """
+        Same generator as <Recipes.iter_recipe_pages> (the streaming responses
+        already consume synchronous iterators from a thread pool).
+        """
+        return self.recipes.iter_recipe_pages(fields=fields)
+
+    async def get_all_recipes(
+        self, fields: Optional[list[str]] = None
+    ) -> list[RecipeModel]:
+        """
+        Async version of <Recipes.get_all_recipes>.
+        """
+        return await run_in_executor(self.recipes.get_all_recipes, fields=fields)
+
+    async def get_recipes_page(
+        self,
+        limit: int,
+        next_token: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> RecipesPageModel:
+        """
+        Async version of <Recipes.get_recipes_page>.
+        """
+        return await run_in_executor(
+            self.recipes.get_recipes_page,
+            limit=limit,
+            next_token=next_token,
+            fields=fields,
+        )
+
+    async def get_recipes_updated_since(
+        self, updated_since: str, fields: Optional[list[str]] = None
+    ) -> RecipesDeltaModel:
+        """
+        Async version of <Recipes.get_recipes_updated_since>.
+        """
+        return await run_in_executor(
+            self.recipes.get_recipes_updated_since,
+            updated_since=updated_since,
+            fields=fields,
+        )
+
+    async def get_recipes_by_date_range(self, **kwargs) -> RecipesPageModel:
+        """
+        Async version of <Recipes.get_recipes_by_date_range>.
+        """
+        return await run_in_executor(self.recipes.get_recipes_by_date_range, **kwargs)
+
+    async def get_recipe_by_ulid(
+        self, ulid: str, fields: Optional[list[str]] = None
+    ) -> Optional[RecipeModel]:
+        """
+        Async version of <Recipes.get_recipe_by_ulid>.
+        """
+        return await run_in_executor(
+            self.recipes.get_recipe_by_ulid, ulid=ulid, fields=fields
+        )
+
+    async def get_recipes_by_ulids(
+        self, ulids: list[str], fields: Optional[list[str]] = None
+    ) -> RecipesBatchGetModel:
+        """
+        Async version of <Recipes.get_recipes_by_ulids>.
+        """
+        return await run_in_executor(
+            self.recipes.get_recipes_by_ulids, ulids=ulids, fields=fields
+        )
+
+    async def get_collection_etag(self, *variant) -> Optional[str]:
+        """
+        Async version of <Recipes.get_collection_etag>.
+        """
+        return await run_in_executor(self.recipes.get_collection_etag, *variant)
+
+    async def create_recipe(
+        self, recipe_data: dict, validated: bool = False
+    ) -> Optional[RecipeModel]:
+        """
+        Async version of <Recipes.create_recipe>.
+        """
+        return await run_in_executor(
+            self.recipes.create_recipe, recipe_data=recipe_data, validated=validated
+        )
+
+    async def create_recipes(
+        self, recipes_data: list[dict], validated: bool = False
+    ) -> list[RecipeBatchCreateResultModel]:
+        """
+        Async version of <Recipes.create_recipes>.
+        """
+        return await run_in_executor(
+            self.recipes.create_recipes, recipes_data=recipes_data, validated=validated
+        )
+
+    async def patch_recipe(self, ulid: str, recipe_data: dict) -> Optional[RecipeModel]:
+        """
+        Async version of <Recipes.patch_recipe>.
+        """
+        return await run_in_executor(
+            self.recipes.patch_recipe, ulid=ulid, recipe_data=recipe_data
+        )
+
+    async def delete_recipe(self, ulid: str) -> Optional[RecipeModel]:
+        """
+        Async version of <Recipes.delete_recipe>.
+        """
+        return await run_in_executor(self.recipes.delete_recipe, ulid=ulid)
@@ -0,0 +1,185 @@
+# Built-in imports
+import hashlib
+import os
+from datetime import datetime
+from typing import Optional
+
+# External imports
+from ulid import ULID
+from aws_lambda_powertools import Logger
+
+# Own imports
+from access_patterns.recipes import dynamodb_helper
+from common.capacity import access_pattern
+from common.enums import DDBPrefixes, ImportFileFormat, ImportStatus
+from common.logger import custom_logger
+from common.runtime_hooks import before_snapshot
+from helpers.s3_helper import S3Helper
+from models.recipes import RecipesImportModel, deserialize_item
+
+# Initialize S3 helper for the uploaded import files
+IMPORTS_BUCKET = os.environ.get("IMPORTS_BUCKET")
+S3_ENDPOINT_URL = os.environ.get("S3_ENDPOINT_URL")
+s3_helper = S3Helper(IMPORTS_BUCKET, S3_ENDPOINT_URL)
+
+
+@before_snapshot
+def prewarm_s3_client() -> None:
+    """Create the S3 client before a SnapStart snapshot (no connections opened)."""
+    s3_helper.s3_client
+
+
+# Prefix of the import files in the bucket (also used as the trigger filter)
+IMPORTS_KEY_PREFIX = "imports/"
+UPLOAD_URL_EXPIRATION_SECONDS = 900
+CONTENT_TYPES = {
+    ImportFileFormat.CSV: "text/csv",
+    ImportFileFormat.JSONL: "application/x-ndjson",
+}
+
+
+def build_import_key(user_email: str, import_id: str, file_format: str) -> str:
+    """
+    Build the S3 key of an import file.
+    :param user_email (str): User email that owns the import.
+    :param import_id (str): ULID of the import.
+    :param file_format (str): Format of the file ("csv" or "jsonl").
+    """
+    return f"{IMPORTS_KEY_PREFIX}{user_email}/{import_id}.{file_format}"
+
+
+def parse_import_key(key: str) -> tuple[str, str, ImportFileFormat]:
+    """
+    Parse the S3 key of an import file (from <build_import_key>).
+    :param key (str): S3 key of the import file (already URL-decoded).
+    :raises ValueError: When the key does not belong to an import file.
+    :returns (tuple): user email, import ULID and file format.
+    """
+    if not key.startswith(IMPORTS_KEY_PREFIX):
+        raise ValueError(f"Invalid import key: {key}")
+
+    user_email, _, file_name = key[len(IMPORTS_KEY_PREFIX) :].rpartition("/")
+    import_id, _, file_format = file_name.partition(".")
+    if not user_email or not import_id:
+        raise ValueError(f"Invalid import key: {key}")
+    try:
+        ULID.from_str(import_id)
+    except ValueError as error:
+        raise ValueError(f"Invalid import key: {key}") from error
+
+    return user_email, import_id, ImportFileFormat(file_format)
+
+
+def build_imported_recipe_id(import_id: str, row_offset: int) -> str:
+    """
+    Build the ULID of the RECIPE item imported from a row. It only depends on the
+    import and the row, so a batch replayed after a crash, a retry or a chained
+    invocation overwrites the same RECIPE items instead of duplicating them.
+    :param import_id (str): ULID of the import (its timestamp is kept).
+    :param row_offset (int): Byte offset of the row in the file.
+    """
+    randomness = hashlib.sha256(f"{import_id}#{row_offset}".encode()).digest()
+    return str(ULID.from_bytes(ULID.from_str(import_id).bytes[:6] + randomness[:10]))
+
+
+class RecipeImports:
+    """Class to define the IMPORT items (checkpoints of the RECIPE imports)."""
+
+    def __init__(self, user_email: str, logger: Optional[Logger] = None) -> None:
+        """
+        :param user_email (str): User email user to identify the IMPORT items.
+        :param logger (Optional(Logger)): Logger object.
+        """
+        self.user_email = user_email
+        self.partition_key = f"{DDBPrefixes.PK_USER.value}{self.user_email}"
+        self.logger = logger or custom_logger()
+
+    @access_pattern("create_recipes_import")
+    def create_import(self, file_format: str) -> RecipesImportModel:
+        """
+        Method to create a new IMPORT item and the presigned URL to upload its file.
+        :param file_format (str): Format of the file ("csv" or "jsonl").
+        """
+        import_id = str(ULID())
+        self.logger.info(
+            f"Creating IMPORT item: {import_id} for user_email: {self.user_email}"
+        )
+
+        # The IMPORT items have no "updated_at", so they stay out of the index of
+        # the delta syncs (only the RECIPE items and the tombstones are there)
+        current_time = datetime.now().isoformat()
+        dynamodb_helper.update_item(
+            partition_key=self.partition_key,
+            sort_key=f"{DDBPrefixes.SK_IMPORT.value}{import_id}",
+            data_attributes_only={
+                "import_status": ImportStatus.PENDING.value,
+                "file_format": file_format,
+                "created_at": current_time,
+                "checkpointed_at": current_time,
+            },
+        )
+
+        upload_url = s3_helper.generate_presigned_put_url(
+            key=build_import_key(self.user_email, import_id, file_format),
+            expires_in=UPLOAD_URL_EXPIRATION_SECONDS,
+            content_type=CONTENT_TYPES[ImportFileFormat(file_format)],
+        )
+        return RecipesImportModel(
+            import_id=import_id,
+            file_format=file_format,
+            upload_url=upload_url,
+            expires_in=UPLOAD_URL_EXPIRATION_SECONDS,
+        )
+
+    @access_pattern("get_import_checkpoint")
+    def get_checkpoint(self, import_id: str) -> dict:
+        """
+        Method to get the checkpoint of an import (empty if it does not exist).
+        :param import_id (str): ULID of the import.
+        """
+        result = dynamodb_helper.get_item_by_pk_and_sk(
+            partition_key=self.partition_key,
+            sort_key=f"{DDBPrefixes.SK_IMPORT.value}{import_id}",
+        )
+        return deserialize_item(result) if result else {}
+
+    @access_pattern("save_import_checkpoint")
+    def save_checkpoint(
+        self,
+        import_id: str,
+        import_status: ImportStatus,
+        next_offset: int,
+        header: Optional[list[str]] = None,
+        rows_imported: int = 0,
+        rows_failed: int = 0,
+        errors: Optional[list[dict]] = None,
+    ) -> None:
+        """
+        Method to save the checkpoint of an import, so that an interrupted run can
+        resume from the last processed byte of the file.
+        :param import_id (str): ULID of the import.
+        :param import_status (ImportStatus): Status of the import.
+        :param next_offset (int): Byte offset of the first unprocessed row.
+        :param header (Optional(list[str])): Header of the file (only for CSV).
+        :param rows_imported (int): Total RECIPE items created so far.
+        :param rows_failed (int): Total rows that could not be imported so far.
+        :param errors (Optional(list[dict])): Details of the rows that failed.
+        """
+        self.logger.info(
+            f"Saving checkpoint for IMPORT item: {import_id} with status: "
+            f"{import_status.value} and next_offset: {next_offset}"
+        )
+
+        dynamodb_helper.update_item(
+            partition_key=self.partition_key,
+            sort_key=f"{DDBPrefixes.SK_IMPORT.value}{import_id}",
+            data_attributes_only={
+                "import_status": import_status.value,
+                "next_offset": next_offset,
+                "header": header,
+                "rows_imported": rows_imported,
+                "rows_failed": rows_failed,
+                "errors": errors or [],
+                "checkpointed_at": datetime.now().isoformat(),
+            },
+        )
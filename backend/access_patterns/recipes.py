@@ -1,75 +1,493 @@
 # Built-in imports
 import os
-from datetime import datetime
-from typing import Optional
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterator, Optional
 
 # External imports
-from fastapi import HTTPException
+from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
 from ulid import ULID
 from aws_lambda_powertools import Logger
 
 # Own imports
+from common.capacity import access_pattern
+from common.exceptions import HTTPError
 from common.logger import custom_logger
+from common.runtime_hooks import before_snapshot
+from common.timing import timed
+from helpers.cache_helper import get_cache_backend
 from helpers.dynamodb_helper import DynamoDBHelper
-from common.enums import DDBPrefixes
-from models.recipes import RecipeModel, RecipeModelUpdates
+from helpers.etag_helper import build_etag
+from helpers.pagination_helper import decode_next_token, encode_next_token
+from common.enums import DDBIndexes, DDBPrefixes
+from models.recipes import (
+    RecipeBatchCreateResultModel,
+    RecipeCodec,
+    RecipeModel,
+    RecipeModelUpdates,
+    RecipesBatchGetModel,
+    RecipesDeltaModel,
+    RecipesPageModel,
+    deserialize_item,
+)
 
 # Initialize DynamoDB helper for item's abstraction
 DYNAMODB_TABLE = os.environ.get("DYNAMODB_TABLE")
 ENDPOINT_URL = os.environ.get("ENDPOINT_URL")
 dynamodb_helper = DynamoDBHelper(DYNAMODB_TABLE, ENDPOINT_URL)
+before_snapshot(dynamodb_helper.prewarm)
+
+# Optional read-through cache for the RECIPE reads (see <get_cache_backend>)
+RECIPES_CACHE_TTL_SECONDS = float(os.environ.get("RECIPES_CACHE_TTL_SECONDS", "30"))
+recipes_cache = get_cache_backend("RECIPES_CACHE")
+
+# Deleted RECIPE items are tracked with tombstones (expired with TTL) for delta syncs
+TOMBSTONE_RETENTION = timedelta(days=30)
+
+# The "recipe_date" index is deployed after the "updated_at" one (one GSI per update)
+RECIPE_DATE_INDEX_ENABLED = (
+    os.environ.get("RECIPE_DATE_INDEX_ENABLED", "true").lower() == "true"
+)
+
+# Overlap between delta syncs, so recent writes not yet in the index are not missed
+SYNC_SAFETY_WINDOW = timedelta(seconds=5)
+
+
+def parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp to the naive UTC format of the "updated_at" values.
+    :param timestamp (str): ISO 8601 timestamp (with or without offset).
+    :raises ValueError: When the timestamp is not valid.
+    """
+    parsed_timestamp = datetime.fromisoformat(timestamp)
+    if parsed_timestamp.tzinfo:
+        parsed_timestamp = parsed_timestamp.astimezone(timezone.utc)
+    return parsed_timestamp.replace(tzinfo=None)
 
 
 class Recipes:
     """Class to define RECIPE items in a simple fashion."""
 
-    def __init__(self, user_email: str, logger: Optional[Logger] = None) -> None:
+    def __init__(
+        self,
+        user_email: str,
+        logger: Optional[Logger] = None,
+        use_cache: bool = True,
+    ) -> None:
         """
         :param user_email (str): User email user to identify the RECIPE items.
         :param logger (Optional(Logger)): Logger object.
+        :param use_cache (bool): Serve the reads from the container cache (when it
+            is enabled). If False, the reads go to DynamoDB and refresh the cache.
         """
         self.user_email = user_email
         self.partition_key = f"{DDBPrefixes.PK_USER.value}{self.user_email}"
         self.logger = logger or custom_logger()
+        self.use_cache = use_cache
+
+        # Version of the RECIPE items from the META item (once it has been read)
+        self.collection_version = None
 
-    def get_all_recipes(self) -> list:
+    def read_through_cache(self, key: tuple, read: Callable[[], Any]) -> Any:
+        """
+        Method to serve a read from the container cache, or to run it and cache
+        its result (when the cache is enabled).
+        :param key (tuple): Key of the read (without the partition key and version).
+        :param read (Callable): Function that reads the result from DynamoDB.
+        """
+        if recipes_cache is None:
+            return read()
+
+        # Keys are stamped with the version of the user (bumped by the writes)
+        version = recipes_cache.get_version(f"recipes:v:{self.partition_key}")
+        cache_key = ":".join(
+            ["recipes", self.partition_key, version, *(str(part) for part in key)]
+        )
+        with timed("cache"):
+            result = recipes_cache.get(cache_key) if self.use_cache else None
+        if result is None:
+            result = read()
+            with timed("cache"):
+                recipes_cache.set(cache_key, result, RECIPES_CACHE_TTL_SECONDS)
+            self.logger.info("Recipes cache miss", extra=recipes_cache.stats())
+        else:
+            self.logger.info("Recipes cache hit", extra=recipes_cache.stats())
+        return result
+
+    @access_pattern("get_all_recipes")
+    def get_all_recipes(self, fields: Optional[list[str]] = None) -> list[RecipeModel]:
         """
         Method to get all RECIPE items for a given user.
+        :param fields (Optional(list[str])): Sparse fieldset to read (all if None).
         """
         self.logger.info(
             f"Retrieving all RECIPE items for user_email: {self.user_email}"
         )
 
-        results = dynamodb_helper.query_by_pk_and_sk_begins_with(
-            partition_key=self.partition_key,
-            sort_key_portion="RECIPE#",
+        results = self.read_through_cache(
+            # The version keeps the cache consistent with writes of other containers
+            ("list", self.collection_version, ",".join(fields or ())),
+            lambda: dynamodb_helper.query_by_pk_and_sk_begins_with(
+                partition_key=self.partition_key,
+                sort_key_portion="RECIPE#",
+                projection=fields,
+            ),
         )
         self.logger.debug(results)
         self.logger.info(f"Items from query: {len(results)}")
-        return results
+        with timed("deserialization"):
+            return RecipeCodec.from_items(results)
+
+    @access_pattern("iter_recipe_pages")
+    def iter_recipe_pages(
+        self, fields: Optional[list[str]] = None
+    ) -> Iterator[list[dict]]:
+        """
+        Generator to lazily get all RECIPE items for a given user, one DynamoDB
+        page at a time (memory stays flat regardless of the partition size).
+        :param fields (Optional(list[str])): Sparse fieldset to read (all if None).
+        """
+        self.logger.info(
+            f"Streaming all RECIPE items for user_email: {self.user_email}"
+        )
+
+        total_items = 0
+        for items, _ in dynamodb_helper.iter_pages_by_pk_and_sk_begins_with(
+            partition_key=self.partition_key,
+            sort_key_portion="RECIPE#",
+            projection=fields,
+        ):
+            total_items += len(items)
+            yield items
+        self.logger.info(f"Items streamed from query: {total_items}")
+
+    @access_pattern("get_recipes_page")
+    def get_recipes_page(
+        self,
+        limit: int,
+        next_token: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> RecipesPageModel:
+        """
+        Method to get a single page of RECIPE items for a given user.
+        :param limit (int): Maximum number of RECIPE items to return in the page.
+        :param next_token (Optional(str)): Opaque token returned by the previous page.
+        :param fields (Optional(list[str])): Sparse fieldset to read (all if None).
+        """
+        self.logger.info(
+            f"Retrieving page of RECIPE items for user_email: {self.user_email} "
+            f"with limit: {limit}"
+        )
+
+        exclusive_start_key = self.decode_next_token(next_token)
+        items, last_evaluated_key = dynamodb_helper.query_page_by_pk_and_sk_begins_with(
+            partition_key=self.partition_key,
+            sort_key_portion="RECIPE#",
+            limit=limit,
+            exclusive_start_key=exclusive_start_key,
+            projection=fields,
+        )
+        self.logger.info(f"Items from query page: {len(items)}")
+        with timed("deserialization"):
+            recipes = RecipeCodec.from_items(items)
+        return RecipesPageModel.model_construct(
+            items=recipes,
+            next_token=encode_next_token(last_evaluated_key),
+        )
+
+    @access_pattern("get_recipes_updated_since")
+    def get_recipes_updated_since(
+        self, updated_since: str, fields: Optional[list[str]] = None
+    ) -> RecipesDeltaModel:
+        """
+        Method to get the RECIPE items created, updated or deleted after a timestamp
+        (delta sync), from the "updated_at" index instead of the whole partition.
+        :param updated_since (str): ISO 8601 timestamp (e.g. the last "sync_token").
+        :param fields (Optional(list[str])): Sparse fieldset to read (all if None).
+        """
+        self.logger.info(
+            f"Retrieving RECIPE items updated since: {updated_since} for "
+            f"user_email: {self.user_email}"
+        )
+
+        try:
+            since = parse_timestamp(updated_since)
+        except ValueError as error:
+            self.logger.error(f"get_recipes_updated_since failed due to {error}")
+            raise HTTPError(
+                status_code=400, detail=f"Invalid updated_since: {updated_since}"
+            )
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        sync_token = max(now - SYNC_SAFETY_WINDOW, since).isoformat()
+
+        # Tombstones older than the retention are gone, so deletions can be missed
+        if since < now - TOMBSTONE_RETENTION:
+            self.logger.info("updated_since is older than the tombstones retention")
+            return RecipesDeltaModel.model_construct(
+                items=self.get_all_recipes(fields=fields),
+                deleted=[],
+                sync_token=sync_token,
+                full_sync_required=True,
+            )
+
+        items, deleted = [], []
+        for page, _ in dynamodb_helper.iter_pages_by_index(
+            index_name=DDBIndexes.UPDATED_AT.value,
+            partition_key=self.partition_key,
+            sort_key_condition=Key("updated_at").gt(since.isoformat()),
+            projection=fields,
+        ):
+            for item in page:
+                if item["SK"].startswith(DDBPrefixes.SK_RECIPE_DATA.value):
+                    items.append(item)
+                elif item["SK"].startswith(DDBPrefixes.SK_TOMBSTONE.value):
+                    deleted.append(item["SK"].split("#", 1)[1])
+
+        self.logger.info(
+            f"RECIPE items updated: {len(items)} and deleted: {len(deleted)}"
+        )
+        with timed("deserialization"):
+            recipes = RecipeCodec.from_items(items)
+        return RecipesDeltaModel.model_construct(
+            items=recipes,
+            deleted=deleted,
+            sync_token=sync_token,
+            full_sync_required=False,
+        )
+
+    @access_pattern("get_recipes_by_date_range")
+    def get_recipes_by_date_range(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: int = 50,
+        order: str = "asc",
+        next_token: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> RecipesPageModel:
+        """
+        Method to get a page of RECIPE items by "recipe_date" (inclusive range),
+        sorted by DynamoDB from the "recipe_date" index (e.g. "latest N" with a
+        descending order), without reading the rest of the partition.
+        :param start (Optional(str)): First "recipe_date" of the range (YYYY-MM-DD).
+        :param end (Optional(str)): Last "recipe_date" of the range (YYYY-MM-DD).
+        :param limit (int): Maximum number of RECIPE items to return in the page.
+        :param order (str): "asc" (oldest first) or "desc" (latest first).
+        :param next_token (Optional(str)): Opaque token returned by the previous page.
+        :param fields (Optional(list[str])): Sparse fieldset to read (all if None).
+        """
+        self.logger.info(
+            f"Retrieving RECIPE items with recipe_date from: {start} to: {end} "
+            f"for user_email: {self.user_email} with limit: {limit} and order: {order}"
+        )
+
+        if not RECIPE_DATE_INDEX_ENABLED:
+            self.logger.error("get_recipes_by_date_range failed due to missing index")
+            raise HTTPError(
+                status_code=501,
+                detail="Queries by recipe_date (date_from, date_to, order) are not enabled",
+            )
+
+        if start and end and start > end:
+            self.logger.error("get_recipes_by_date_range failed due to invalid range")
+            raise HTTPError(
+                status_code=400, detail="date_from must not be after date_to"
+            )
+
+        if start and end:
+            sort_key_condition = Key("recipe_date").between(start, end)
+        elif start:
+            sort_key_condition = Key("recipe_date").gte(start)
+        elif end:
+            sort_key_condition = Key("recipe_date").lte(end)
+        else:
+            sort_key_condition = None
+
+        pages = dynamodb_helper.iter_pages_by_index(
+            index_name=DDBIndexes.RECIPE_DATE.value,
+            partition_key=self.partition_key,
+            sort_key_condition=sort_key_condition,
+            limit=limit,
+            exclusive_start_key=self.decode_next_token(next_token, "recipe_date"),
+            scan_index_forward=order != "desc",
+            projection=fields,
+        )
+        items, last_evaluated_key = next(pages)
+        self.logger.info(f"Items from recipe_date index page: {len(items)}")
+        with timed("deserialization"):
+            recipes = RecipeCodec.from_items(items)
+        return RecipesPageModel.model_construct(
+            items=recipes,
+            next_token=encode_next_token(last_evaluated_key),
+        )
+
+    def decode_next_token(
+        self, next_token: Optional[str], index_sort_key: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        Method to decode the "next_token" of a paginated read for the user.
+        :param next_token (Optional(str)): Opaque token returned by the previous page.
+        :param index_sort_key (Optional(str)): Sort key of the queried index (None
+            for the table), as the tokens of the indexes also include it.
+        """
+        try:
+            exclusive_start_key = decode_next_token(next_token)
+        except ValueError as error:
+            self.logger.error(f"decode_next_token failed due to {error}")
+            raise HTTPError(status_code=400, detail=str(error))
 
-    def get_recipe_by_ulid(self, ulid: str) -> dict:
+        # Tokens are only valid for the partition they were generated for
+        if exclusive_start_key and (
+            exclusive_start_key.get("PK") != self.partition_key
+        ):
+            self.logger.error("decode_next_token failed due to a foreign next_token")
+            raise HTTPError(
+                status_code=400,
+                detail="next_token is not valid for the requested user_email",
+            )
+
+        # Tokens of the table and of the indexes are not interchangeable
+        key_attributes = {"PK", "SK", *([index_sort_key] if index_sort_key else [])}
+        if exclusive_start_key and set(exclusive_start_key) != key_attributes:
+            self.logger.error("decode_next_token failed due to a token of other query")
+            raise HTTPError(
+                status_code=400,
+                detail="next_token is not valid for the requested query",
+            )
+        return exclusive_start_key
+
+    @access_pattern("get_recipe_by_ulid")
+    def get_recipe_by_ulid(self, ulid: str, fields: Optional[list[str]] = None) -> dict:
         """
         Method to get a RECIPE item by its ULID.
         :param ulid (str): ULID for a specific RECIPE item.
+        :param fields (Optional(list[str])): Sparse fieldset to read (all if None).
         """
         self.logger.info(
             f"Retrieving RECIPE item by ULID: {ulid} for user_email: {self.user_email}"
         )
 
-        result = dynamodb_helper.get_item_by_pk_and_sk(
-            partition_key=self.partition_key,
-            sort_key=f"RECIPE#{ulid}",
+        result = self.read_through_cache(
+            ("item", ulid, ",".join(fields or ())),
+            lambda: dynamodb_helper.get_item_by_pk_and_sk(
+                partition_key=self.partition_key,
+                sort_key=f"RECIPE#{ulid}",
+                projection=fields,
+            ),
         )
 
-        formatted_recipe = RecipeModel.from_dynamodb_item(result) if result else {}
+        with timed("deserialization"):
+            formatted_recipe = (
+                RecipeModel.from_dynamodb_item(result, trusted=True) if result else {}
+            )
         self.logger.debug(formatted_recipe)
         return formatted_recipe
 
-    def create_recipe(self, recipe_data: dict) -> Optional[RecipeModel]:
+    @access_pattern("get_recipes_by_ulids")
+    def get_recipes_by_ulids(
+        self, ulids: list[str], fields: Optional[list[str]] = None
+    ) -> RecipesBatchGetModel:
+        """
+        Method to get multiple RECIPE items by their ULIDs in batch.
+        :param ulids (list[str]): ULIDs of the RECIPE items (the order is kept).
+        :param fields (Optional(list[str])): Sparse fieldset to read (all if None).
+        """
+        self.logger.info(
+            f"Retrieving {len(ulids)} RECIPE items by ULID for user_email: "
+            f"{self.user_email}"
+        )
+
+        results = dynamodb_helper.batch_get_items(
+            keys=[{"PK": self.partition_key, "SK": f"RECIPE#{ulid}"} for ulid in ulids],
+            projection=fields,
+        )
+
+        not_found = [ulid for ulid, item in zip(ulids, results) if item is None]
+        self.logger.info(f"RECIPE items not found in batch: {len(not_found)}")
+        with timed("deserialization"):
+            recipes = RecipeCodec.from_items([item for item in results if item])
+        return RecipesBatchGetModel.model_construct(
+            items=recipes,
+            not_found=not_found,
+        )
+
+    @access_pattern("get_collection_etag")
+    def get_collection_etag(self, *variant) -> Optional[str]:
+        """
+        Method to get the ETag of the RECIPE items of the user from the META item
+        (single item read), without reading the RECIPE items.
+        :param variant: Parameters that change the representation (e.g. fields).
+        :returns (Optional(str)): ETag, or None if the META item does not exist yet.
+        """
+        result = dynamodb_helper.get_item_by_pk_and_sk(
+            partition_key=self.partition_key,
+            sort_key=DDBPrefixes.SK_META_RECIPES.value,
+        )
+        if not result:
+            return None
+
+        meta = deserialize_item(result)
+        self.collection_version = meta.get("recipes_version")
+        return build_etag(
+            self.partition_key,
+            meta.get("recipes_version"),
+            meta.get("recipes_count"),
+            meta.get("last_updated_at"),
+            *variant,
+        )
+
+    def invalidate_cached_reads(self) -> None:
+        """Method to invalidate the cached reads of the user (after every write)."""
+        if recipes_cache is not None:
+            recipes_cache.bump_version(f"recipes:v:{self.partition_key}")
+
+    @access_pattern("touch_collection")
+    def touch_collection(self, count_delta: int = 0) -> None:
+        """
+        Method to bump the version of the RECIPE items of the user in the META item
+        (called after every write, so that the collection ETag changes). The
+        cached reads of the user are also invalidated. A failed update is raised
+        (the request fails), so a stale ETag is never returned for the new data.
+        :param count_delta (int): Change in the number of RECIPE items.
+        """
+        dynamodb_helper.update_item(
+            partition_key=self.partition_key,
+            sort_key=DDBPrefixes.SK_META_RECIPES.value,
+            data_attributes_only={"last_updated_at": datetime.now().isoformat()},
+            increments={"recipes_version": 1, "recipes_count": count_delta},
+        )
+        self.invalidate_cached_reads()
+
+    @access_pattern("put_tombstone")
+    def put_tombstone(self, ulid: str) -> None:
+        """
+        Method to track a deleted RECIPE item for the delta syncs (the tombstone is
+        removed by the DynamoDB TTL after the retention period). A failed put is
+        raised, so the delta syncs never miss a delete.
+        :param ulid (str): ULID of the deleted RECIPE item.
+        """
+        dynamodb_helper.put_item(
+            {
+                "PK": {"S": self.partition_key},
+                "SK": {"S": f"{DDBPrefixes.SK_TOMBSTONE.value}{ulid}"},
+                "updated_at": {"S": datetime.now().isoformat()},
+                "ttl": {
+                    "N": str(int(time.time() + TOMBSTONE_RETENTION.total_seconds()))
+                },
+            }
+        )
+
+    @access_pattern("create_recipe")
+    def create_recipe(
+        self, recipe_data: dict, validated: bool = False
+    ) -> Optional[RecipeModel]:
         """
         Method to create a new RECIPE item.
         :param recipe_data (dict): Data for the new RECIPE item.
+        :param validated (bool): The data was already validated with the RECIPES
+            JSON Schema, so the model is built without a second validation pass.
         """
         recipe_data["PK"] = self.partition_key
         recipe_data["SK"] = f"RECIPE#{ULID()}"
@@ -77,73 +495,136 @@ class Recipes:
         recipe_data["created_at"] = current_time
         recipe_data["updated_at"] = current_time
 
-        recipe = RecipeModel(**recipe_data)
+        if validated:
+            recipe = RecipeModel.model_construct(**recipe_data)
+        else:
+            recipe = RecipeModel(**recipe_data)
 
         result = dynamodb_helper.put_item(recipe.to_dynamodb_dict())
         self.logger.debug(result)
+        self.touch_collection(count_delta=1)
+        return recipe
+
+    @access_pattern("create_recipes")
+    def create_recipes(
+        self,
+        recipes_data: list[dict],
+        validated: bool = False,
+        recipe_ids: Optional[list[str]] = None,
+    ) -> list[RecipeBatchCreateResultModel]:
+        """
+        Method to create multiple new RECIPE items in batch (a single failed item
+        does not fail the rest of the batch).
+        :param recipes_data (list[dict]): Data for the new RECIPE items.
+        :param validated (bool): The data was already validated with the RECIPES
+            JSON Schema, so the models are built without a second validation pass.
+        :param recipe_ids (Optional(list[str])): ULIDs of the new RECIPE items, so
+            that replayed batches overwrite the same items (new ULIDs if None).
+        :returns (list): status of each RECIPE item (in the order of the input).
+        """
+        self.logger.info(
+            f"Creating {len(recipes_data)} RECIPE items in batch for user_email: "
+            f"{self.user_email}"
+        )
+
+        current_time = datetime.now().isoformat()
+        recipes = []
+        for index, recipe_data in enumerate(recipes_data):
+            recipe_data["PK"] = self.partition_key
+            recipe_data["SK"] = f"RECIPE#{recipe_ids[index] if recipe_ids else ULID()}"
+            recipe_data["created_at"] = current_time
+            recipe_data["updated_at"] = current_time
+            if validated:
+                recipes.append(RecipeModel.model_construct(**recipe_data))
+            else:
+                recipes.append(RecipeModel(**recipe_data))
 
-        if result.get("ResponseMetadata", {}).get("HTTPStatusCode") == 200:
-            return recipe
+        errors = dynamodb_helper.batch_write_items(
+            [recipe.to_dynamodb_dict() for recipe in recipes]
+        )
 
-        return {}
+        results = [
+            RecipeBatchCreateResultModel(
+                index=index,
+                status_code=500 if error else 201,
+                recipe_id=None if error else recipe.SK.split("#", 1)[1],
+                error=error,
+            )
+            for index, (recipe, error) in enumerate(zip(recipes, errors))
+        ]
+        self.logger.info(
+            f"RECIPE items not created in batch: {len(errors) - errors.count(None)}"
+        )
+        if errors.count(None):
+            self.touch_collection(count_delta=errors.count(None))
+        return results
 
+    @access_pattern("patch_recipe")
     def patch_recipe(self, ulid: str, recipe_data: dict) -> Optional[RecipeModel]:
         """
         Method to patch an existing RECIPE item.
         :param ulid (str): ULID for a specific RECIPE item.
         :param recipe_data (dict): Data for the new RECIPE item.
         """
+        current_time = datetime.now().isoformat()
+        recipe_data["updated_at"] = current_time
 
-        # Validate that RECIPE item exists
-        existing_recipe_item = self.get_recipe_by_ulid(ulid)
-        if not existing_recipe_item:
+        # The existence validation happens in the same write (conditional update)
+        try:
+            result = dynamodb_helper.update_item(
+                partition_key=self.partition_key,
+                sort_key=f"RECIPE#{ulid}",
+                data_attributes_only=recipe_data,
+                must_exist=True,
+                return_values="ALL_NEW",
+            )
+        except ClientError as error:
+            if not dynamodb_helper.is_conditional_check_failed(error):
+                raise error
             self.logger.error(
                 f"patch_recipe failed due to non-existing RECIPE item to update: {ulid}"
             )
-            raise HTTPException(
+            raise HTTPError(
                 status_code=400,
                 detail=f"RECIPE patch request for ULID {ulid} "
                 "is not valid because item does not exist",
             )
-
-        current_time = datetime.now().isoformat()
-        recipe_data["updated_at"] = current_time
-
-        result = dynamodb_helper.update_item(
-            partition_key=self.partition_key,
-            sort_key=f"RECIPE#{ulid}",
-            data_attributes_only=recipe_data,
-        )
         self.logger.debug(result)
+        self.touch_collection()
 
-        if result.get("ResponseMetadata", {}).get("HTTPStatusCode") == 200:
-            return self.get_recipe_by_ulid(ulid)
-
-        return {}
+        with timed("deserialization"):
+            return RecipeCodec.from_items([result["Attributes"]])[0]
 
+    @access_pattern("delete_recipe")
     def delete_recipe(self, ulid: str) -> Optional[RecipeModel]:
         """
         Method to delete an existing RECIPE item.
         :param ulid (str): ULID for a specific RECIPE item.
-        :param recipe_data (dict): Data for the new RECIPE item.
+        :returns (RecipeModel): Deleted RECIPE item.
         """
-
-        # Validate that RECIPE item exists
-        existing_recipe_item = self.get_recipe_by_ulid(ulid)
-        if not existing_recipe_item:
+        # The existence validation happens in the same write (conditional delete)
+        try:
+            result = dynamodb_helper.delete_item(
+                partition_key=self.partition_key,
+                sort_key=f"RECIPE#{ulid}",
+                must_exist=True,
+                return_values="ALL_OLD",
+            )
+        except ClientError as error:
+            if not dynamodb_helper.is_conditional_check_failed(error):
+                raise error
             self.logger.error(
                 f"delete_recipe failed due to non-existing RECIPE item to delete: {ulid}"
             )
-            raise HTTPException(
+            raise HTTPError(
                 status_code=400,
                 detail=f"RECIPE delete request for ULID {ulid} "
                 "is not valid because item does not exist",
             )
-
-        result = dynamodb_helper.delete_item(
-            partition_key=self.partition_key,
-            sort_key=f"RECIPE#{ulid}",
-        )
         self.logger.debug(result)
+        self.put_tombstone(ulid)
+        self.touch_collection(count_delta=-1)
 
-        return {}
+        # The deleted RECIPE item is returned from the same write (ALL_OLD)
+        with timed("deserialization"):
+            return RecipeCodec.from_items([result["Attributes"]])[0]
@@ -4,17 +4,24 @@
 
 # Own imports
 import os
+from typing import Any
 
 # External imports
 from mangum import Mangum
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 
 # Own imports
+from api.v1.middlewares.server_timing import ServerTimingMiddleware
 from api.v1.routers import (
     recipes,
 )
+from common.capacity import log_capacity_metrics
+from common.exceptions import HTTPError
+from common.profiler import ProfilingMiddleware
+from common.responses import FastJSONResponse
+from common.timing import request_timer
 
 # Environment used to dynamically load the FastAPI docs with stages
 ENVIRONMENT = os.environ.get("ENVIRONMENT")
@@ -27,6 +34,7 @@ app = FastAPI(
     root_path=f"/{ENVIRONMENT}" if ENVIRONMENT else None,
     docs_url="/api/v1/docs",
     openapi_url="/api/v1/docs/openapi.json",
+    default_response_class=FastJSONResponse,
 )
 
 # Required to allow CORS for the API (for local development and external frontends)
@@ -37,9 +45,43 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
+# Latency breakdown of each request in the "Server-Timing" header
+app.add_middleware(ServerTimingMiddleware)
+
+# Opt-in sampling profiler of a fraction of the requests (outermost)
+app.add_middleware(ProfilingMiddleware)
+
 app.include_router(recipes.router, prefix="/api/v1")
 
+
+@app.exception_handler(HTTPError)
+async def http_error_handler(request: Request, error: HTTPError) -> FastJSONResponse:
+    """Render the errors of the access patterns as the FastAPI ones."""
+    return FastJSONResponse(
+        status_code=error.status_code, content={"detail": error.detail}
+    )
+
+
+mangum_handler = Mangum(app)
+
+
+def handle_event(event: dict, context: Any) -> dict:
+    """
+    Handle an API-GW proxy event with the FastAPI app (without the capacity
+    metrics, so the native handler can delegate to it inside its own invocation).
+    :param event (dict): API-GW proxy event.
+    :param context (Any): Lambda context.
+    """
+    route = f"{event.get('httpMethod')} {event.get('resource')}"
+    with request_timer(route) as timer:
+        response = mangum_handler(event, context)
+        # Time outside of the app is the API-GW event and response translation
+        timer.add("mangum", timer.elapsed_ms() - timer.stages.get("app", 0.0))
+    return response
+
+
 # This is the Lambda Function's entrypoint (handler)
-handler = Mangum(app)
+handler = log_capacity_metrics(handle_event)
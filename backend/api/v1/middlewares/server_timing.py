@@ -0,0 +1,50 @@
+# Built-in imports
+import time
+
+# External imports
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Own imports
+from common.timing import request_timer
+
+# Route of the metrics of the requests that do not match any route (e.g. 404)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class ServerTimingMiddleware:
+    """
+    Pure ASGI middleware that adds the "Server-Timing" header (duration of the
+    stages measured so far) to the responses. The time spent in the app is
+    measured as the "app" stage, so the entrypoint can derive the overhead of
+    the API-GW event translation from the total. The metrics are tagged with
+    the template of the matched route, not with the raw path.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        # The Lambda entrypoint already opened the timer (reused here)
+        with request_timer(f"{scope['method']} {UNMATCHED_ROUTE}") as timer:
+            start = time.perf_counter()
+
+            async def send_with_server_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    timer.add("app", (time.perf_counter() - start) * 1000)
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", timer.server_timing())
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_server_timing)
+            finally:
+                # The router adds the matched route to the scope (its path is the
+                # template, e.g. "/api/v1/recipes/{ulid}", so the metrics are not
+                # tagged with each ULID of the raw paths)
+                route = scope.get("route")
+                if route is not None:
+                    timer.route = f"{scope['method']} {route.path}"
@@ -0,0 +1,421 @@
+###############################################################################
+# Entrypoint for the hot RECIPE paths that handles the API-GW proxy events
+# directly (without Mangum, Starlette middlewares or FastAPI dependencies).
+# Requests that are not handled here (e.g. NDJSON streaming, delta syncs, the
+# docs or invalid parameters) are delegated to the FastAPI app, so both
+# entrypoints share the same contract.
+###############################################################################
+
+# Built-in imports
+import base64
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+from uuid import uuid4
+
+# Own imports
+from access_patterns.recipes import Recipes
+from api.v1.services.validator import build_validation_error_detail, validate_payload
+from common.capacity import log_capacity_metrics
+from common.enums import JSONSchemaType
+from common.exceptions import HTTPError
+from common.logger import custom_logger
+from common.profiler import profile_handler
+from common.runtime_hooks import preload
+from common.serialization import dumps
+from common.timing import request_timer, timed
+from helpers.etag_helper import (
+    ETAG_CACHE_CONTROL,
+    build_content_etag,
+    build_etag,
+    etag_matches,
+    use_cache,
+)
+from models.recipes import RecipeCodec, RecipeModel
+
+logger = custom_logger()
+
+# With SnapStart, the FastAPI app of the delegated requests is in the snapshot
+preload("api.v1.main")
+
+# Same page sizes as the FastAPI "GET /recipes" endpoint
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 100
+
+# Query parameters of the "GET /recipes" modes that are only served by FastAPI
+DELEGATED_LIST_PARAMETERS = ("updated_since", "date_from", "date_to", "order")
+
+# CORS headers of the FastAPI app (proxy integrations must return them as well)
+CORS_HEADERS = {
+    "access-control-allow-origin": "*",
+    "access-control-allow-credentials": "true",
+    "access-control-expose-headers": "ETag",
+}
+
+
+@dataclass
+class NativeRequest:
+    """Parsed API-GW proxy event (REST API, payload format 1.0)."""
+
+    method: str
+    resource: str
+    path_parameters: dict
+    query: dict
+    headers: dict
+    body: Optional[str]
+
+    @classmethod
+    def from_event(cls, event: dict) -> "NativeRequest":
+        body = event.get("body")
+        if body and event.get("isBase64Encoded"):
+            body = base64.b64decode(body).decode("utf-8")
+        return cls(
+            method=event.get("httpMethod", ""),
+            resource=event.get("resource", ""),
+            path_parameters=event.get("pathParameters") or {},
+            query=event.get("queryStringParameters") or {},
+            headers={
+                key.lower(): value
+                for key, value in (event.get("headers") or {}).items()
+            },
+            body=body,
+        )
+
+    def json_body(self) -> Optional[dict]:
+        """JSON object of the body (None if it is not a JSON object)."""
+        try:
+            body = json.loads(self.body or "")
+        except ValueError:
+            return None
+        return body if isinstance(body, dict) else None
+
+
+class DelegateToFastAPI(Exception):
+    """The request is not handled natively (the FastAPI app builds the response)."""
+
+
+def build_response(
+    request: NativeRequest,
+    status_code: int = 200,
+    content: Any = None,
+    headers: Optional[dict] = None,
+) -> dict:
+    """
+    Build the API-GW proxy response with the same headers as the FastAPI app.
+    :param request (NativeRequest): Request that is answered.
+    :param status_code (int): HTTP status code.
+    :param content (Any): Serialized body (bytes or str) or JSON content.
+    :param headers (Optional(dict)): Additional headers (e.g. "ETag").
+    """
+    if not isinstance(content, (bytes, str)):
+        with timed("serialization"):
+            content = dumps(content)
+    headers = {"content-type": "application/json", **(headers or {})}
+
+    # Same CORS headers of the FastAPI app for actual (not preflight) requests
+    origin = request.headers.get("origin")
+    if origin:
+        headers.update(CORS_HEADERS)
+        # Requests with cookies require the specific origin instead of "*"
+        if "cookie" in request.headers:
+            headers["access-control-allow-origin"] = origin
+            headers["vary"] = "Origin"
+
+    return {
+        "statusCode": status_code,
+        "headers": headers,
+        "body": content.decode("utf-8") if isinstance(content, bytes) else content,
+        "isBase64Encoded": False,
+    }
+
+
+def build_etag_response(
+    request: NativeRequest, content: Any, etag: str, if_none_match: Optional[str]
+) -> dict:
+    """
+    Build the response of a representation with an ETag, or an empty 304
+    response when the client already has it ("If-None-Match").
+    :param request (NativeRequest): Request that is answered.
+    :param content (Any): Serialized JSON body.
+    :param etag (str): ETag of the representation.
+    :param if_none_match (Optional(str)): Value of the "If-None-Match" header.
+    """
+    headers = {"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return build_response(request, 304, b"", headers)
+    return build_response(request, 200, content, headers)
+
+
+def get_user_email(request: NativeRequest) -> str:
+    """
+    Get the required "user_email" query parameter (FastAPI answers when missing).
+    :param request (NativeRequest): Request with the query parameters.
+    """
+    user_email = request.query.get("user_email")
+    if user_email is None:
+        raise DelegateToFastAPI()
+    user_email = user_email.replace(" ", "+")
+    logger.append_keys(
+        correlation_id=request.headers.get("correlation-id", str(uuid4())),
+        user_email=user_email,
+    )
+    return user_email
+
+
+def get_json_body(request: NativeRequest) -> dict:
+    """
+    Get the JSON object of the body (FastAPI answers when it is not valid).
+    :param request (NativeRequest): Request with the body.
+    """
+    body = request.json_body()
+    if body is None:
+        raise DelegateToFastAPI()
+    return body
+
+
+def parse_fields(fields: Optional[str]) -> Optional[list[str]]:
+    """
+    Parse the "fields" query parameter (sparse fieldset) of the RECIPE reads.
+    :param fields (Optional(str)): Comma-separated field names (all if empty).
+    """
+    try:
+        return RecipeModel.parse_fields(fields)
+    except ValueError as error:
+        logger.error(f"Invalid sparse fieldset: {error}")
+        raise HTTPError(status_code=400, detail=str(error))
+
+
+def validate(
+    data: dict, json_schema_type: JSONSchemaType, partial: bool = False
+) -> None:
+    """
+    Validate a payload with the precompiled JSON Schema validator.
+    :param data (dict): JSON payload of the request.
+    :param json_schema_type (JSONSchemaType): Enumeration for the JSON Schema type.
+    :param partial (bool): Do not enforce the "required" fields (e.g. for PATCH).
+    """
+    validation_result = validate_payload(
+        data=data, json_schema_type=json_schema_type, partial=partial, logger=logger
+    )
+    if isinstance(validation_result, Exception):
+        raise HTTPError(
+            status_code=400,
+            detail=build_validation_error_detail(data, validation_result),
+        )
+
+
+def read_all_recipes(request: NativeRequest) -> dict:
+    user_email = get_user_email(request)
+    if any(request.query.get(name) for name in DELEGATED_LIST_PARAMETERS):
+        raise DelegateToFastAPI()
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        raise DelegateToFastAPI()
+    logger.info("Starting native handler for read_all_recipes()")
+
+    limit, next_token = request.query.get("limit"), request.query.get("next_token")
+    if limit is not None:
+        if not limit.isdigit() or not 1 <= int(limit) <= MAX_PAGE_LIMIT:
+            raise DelegateToFastAPI()
+        limit = int(limit)
+
+    fields = request.query.get("fields")
+    projection = parse_fields(fields)
+    excluded_keys = RecipeModel.get_unrequested_keys(fields)
+    recipe = Recipes(
+        user_email=user_email,
+        logger=logger,
+        use_cache=use_cache(request.headers.get("cache-control")),
+    )
+
+    # Same ETag variants as the FastAPI endpoint (both entrypoints are interchangeable)
+    if_none_match = request.headers.get("if-none-match")
+    etag = recipe.get_collection_etag(fields, limit, next_token, None, None, None, None)
+    if etag and etag_matches(if_none_match, etag):
+        return build_etag_response(request, b"", etag, if_none_match)
+
+    if limit or next_token:
+        page = recipe.get_recipes_page(
+            limit=limit or DEFAULT_PAGE_LIMIT,
+            next_token=next_token,
+            fields=projection,
+        )
+        with timed("serialization"):
+            content = page.model_dump_json(
+                exclude_unset=bool(projection),
+                exclude={"items": {"__all__": excluded_keys}},
+            )
+    else:
+        recipes = recipe.get_all_recipes(fields=projection)
+        with timed("serialization"):
+            content = RecipeCodec.dump_json(
+                recipes, partial=bool(projection), exclude=excluded_keys
+            )
+    logger.info("Finished read_all_recipes() successfully")
+
+    if etag is None:
+        etag = build_content_etag(
+            content.encode("utf-8") if isinstance(content, str) else content
+        )
+    return build_etag_response(request, content, etag, if_none_match)
+
+
+def read_recipe_item(request: NativeRequest) -> dict:
+    user_email = get_user_email(request)
+    logger.info("Starting native handler for read_recipe_item()")
+
+    fields = request.query.get("fields")
+    projection = parse_fields(fields)
+    recipe = Recipes(
+        user_email=user_email,
+        logger=logger,
+        use_cache=use_cache(request.headers.get("cache-control")),
+    )
+
+    # The ETag is built from "updated_at", so it is always read
+    result = recipe.get_recipe_by_ulid(
+        ulid=request.path_parameters["recipe_id"],
+        fields=projection and [*projection, "updated_at"],
+    )
+    logger.info("Finished read_recipe_item() successfully")
+    if not result:
+        return build_response(request, 200, result)
+
+    etag = build_etag(result.SK, result.updated_at, fields)
+    if_none_match = request.headers.get("if-none-match")
+    if etag_matches(if_none_match, etag):
+        return build_etag_response(request, b"", etag, if_none_match)
+
+    # Partial items only contain the attributes of the sparse fieldset
+    with timed("serialization"):
+        if projection:
+            content = result.model_dump_json(
+                exclude_unset=True,
+                exclude=RecipeModel.get_unrequested_keys(fields)
+                | ({"updated_at"} - set(projection)),
+            )
+        else:
+            content = result.model_dump_json()
+    return build_etag_response(request, content, etag, None)
+
+
+def create_recipe_item(request: NativeRequest) -> dict:
+    recipe_details = get_json_body(request)
+    if not isinstance(recipe_details.get("user_email"), str):
+        raise DelegateToFastAPI()
+    user_email = recipe_details["user_email"].replace(" ", "+")
+    logger.append_keys(
+        correlation_id=request.headers.get("correlation-id", str(uuid4())),
+        user_email=user_email,
+    )
+
+    # Validate payload with JSON-Schema (precompiled validator)
+    validate(recipe_details, JSONSchemaType.RECIPES)
+    logger.info("Starting native handler for create_recipe_item()")
+
+    # After schema validation, it's safe to load the RECIPE element
+    recipes = Recipes(user_email=user_email, logger=logger)
+    result = recipes.create_recipe(recipe_details, validated=True)
+
+    logger.info("Finished create_recipe_item() successfully")
+    return build_response(request, 200, result)
+
+
+def patch_recipe_item(request: NativeRequest) -> dict:
+    user_email = get_user_email(request)
+    recipe_details = get_json_body(request)
+    logger.info("Starting native handler for patch_recipe_item()")
+
+    # For patch, do not enforce mandatory fields in schema
+    validate(recipe_details, JSONSchemaType.RECIPES, partial=True)
+
+    recipe = Recipes(user_email=user_email, logger=logger)
+    result = recipe.patch_recipe(
+        ulid=request.path_parameters["recipe_id"], recipe_data=recipe_details
+    )
+
+    logger.info("Finished patch_recipe_item() successfully")
+    return build_response(request, 200, result)
+
+
+def delete_recipe_item(request: NativeRequest) -> dict:
+    user_email = get_user_email(request)
+    logger.info("Starting native handler for delete_recipe_item()")
+
+    recipe = Recipes(user_email=user_email, logger=logger)
+    result = recipe.delete_recipe(ulid=request.path_parameters["recipe_id"])
+
+    logger.info("Finished delete_recipe_item() successfully")
+    return build_response(request, 200, result)
+
+
+# Routes by the API-GW method and resource (no path matching is required)
+ROUTES: dict[tuple[str, str], Callable[[NativeRequest], dict]] = {
+    ("GET", "/api/v1/recipes"): read_all_recipes,
+    ("POST", "/api/v1/recipes"): create_recipe_item,
+    ("GET", "/api/v1/recipes/{recipe_id}"): read_recipe_item,
+    ("PATCH", "/api/v1/recipes/{recipe_id}"): patch_recipe_item,
+    ("DELETE", "/api/v1/recipes/{recipe_id}"): delete_recipe_item,
+}
+
+
+def delegate_to_fastapi(event: dict, context: Any) -> dict:
+    """
+    Handle the event with the FastAPI app (only imported on the first delegation).
+    The capacity metrics of the invocation are emitted by the native handler.
+    :param event (dict): API-GW proxy event.
+    :param context (Any): Lambda context.
+    """
+    from api.v1.main import handle_event
+
+    return handle_event(event, context)
+
+
+def dispatch(request: NativeRequest, event: dict, context: Any) -> dict:
+    """
+    Handle the request with its native route, or delegate it to the FastAPI app.
+    :param request (NativeRequest): Parsed request of the event.
+    :param event (dict): API-GW proxy event.
+    :param context (Any): Lambda context.
+    """
+    route = ROUTES.get((request.method, request.resource))
+    if route is None:
+        return delegate_to_fastapi(event, context)
+
+    try:
+        return route(request)
+    except DelegateToFastAPI:
+        return delegate_to_fastapi(event, context)
+    except HTTPError as error:
+        logger.error(f"Error in {route.__name__}(): {error.detail}")
+        return build_response(request, error.status_code, {"detail": error.detail})
+    except Exception as error:
+        logger.exception(f"Error in {route.__name__}(): {error}")
+        return build_response(
+            request,
+            500,
+            b"Internal Server Error",
+            {"content-type": "text/plain; charset=utf-8"},
+        )
+
+
+def get_correlation_id(event: dict) -> Optional[str]:
+    """Correlation ID of the request (from the "correlation-id" header)."""
+    headers = event.get("headers") or {}
+    return next(
+        (value for key, value in headers.items() if key.lower() == "correlation-id"),
+        None,
+    )
+
+
+# This is the Lambda Function's entrypoint (handler)
+@log_capacity_metrics
+@profile_handler(get_correlation_id)
+def handler(event: dict, context: Any) -> dict:
+    request = NativeRequest.from_event(event)
+    with request_timer(f"{request.method} {request.resource}") as timer:
+        response = dispatch(request, event, context)
+        # Delegated responses already have it (added by the FastAPI middleware)
+        response.setdefault("headers", {}).setdefault(
+            "server-timing", timer.server_timing()
+        )
+    return response
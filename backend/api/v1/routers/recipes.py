@@ -1,17 +1,35 @@
 # Built-in imports
-from typing import Annotated
+from datetime import date
+from typing import Annotated, Iterator, Literal, Optional
 from uuid import uuid4
 
 # External imports
-from fastapi import APIRouter, Header
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from aws_lambda_powertools import Logger
 
 # Own imports
-from access_patterns.recipes import Recipes
-from api.v1.schemas.schema import Schema
+from access_patterns.async_recipes import AsyncRecipes
+from access_patterns.recipe_imports import RecipeImports
+from models.recipes import (
+    RecipeBatchCreateResultModel,
+    RecipeCodec,
+    RecipeModel,
+    RecipesBatchCreateModel,
+)
 from api.v1.services.exceptions import SchemaValidationException
-from api.v1.services.validator import validate_json
+from api.v1.services.validator import validate_payload
 from common.enums import JSONSchemaType
+from common.responses import FastJSONResponse, dumps
+from common.timing import timed
+from helpers.async_dynamodb_helper import run_in_executor
+from helpers.etag_helper import (
+    ETAG_CACHE_CONTROL,
+    build_content_etag,
+    build_etag,
+    etag_matches,
+    use_cache,
+)
 
 
 logger = Logger(
@@ -22,10 +40,74 @@ logger = Logger(
 
 router = APIRouter()
 
+# Page sizes for the paginated mode of the "GET /recipes" endpoint
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 100
+
+# Media type that enables the streaming mode of the "GET /recipes" endpoint
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def generate_ndjson(
+    pages: Iterator[list[dict]], exclude: Optional[set[str]] = None
+) -> Iterator[bytes]:
+    """
+    Generator that renders each page of items as NDJSON (one JSON document per
+    line) as soon as the page is available.
+    :param pages (Iterator[list[dict]]): Pages of items to render.
+    :param exclude (Optional(set[str])): Attributes to exclude from each item.
+    """
+    for items in pages:
+        if exclude:
+            items = [
+                {key: value for key, value in item.items() if key not in exclude}
+                for item in items
+            ]
+        if items:
+            yield b"".join(dumps(item) + b"\n" for item in items)
+
+
+def etag_response(
+    content: bytes | str, etag: str, if_none_match: Optional[str] = None
+) -> Response:
+    """
+    Build the JSON response of a representation with an ETag, or an empty 304
+    response when the client already has it ("If-None-Match").
+    :param content (bytes | str): Serialized JSON body.
+    :param etag (str): ETag of the representation.
+    :param if_none_match (Optional(str)): Value of the "If-None-Match" header.
+    """
+    headers = {"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def parse_fields(fields: Optional[str]) -> Optional[list[str]]:
+    """
+    Parse the "fields" query parameter (sparse fieldset) of the RECIPE reads.
+    :param fields (Optional(str)): Comma-separated field names (all if empty).
+    """
+    try:
+        return RecipeModel.parse_fields(fields)
+    except ValueError as error:
+        logger.error(f"Invalid sparse fieldset: {error}")
+        raise HTTPException(status_code=400, detail=str(error))
+
 
 @router.get("/recipes", tags=["recipes"])
 async def read_all_recipes(
     user_email: str,
+    limit: Annotated[Optional[int], Query(ge=1, le=MAX_PAGE_LIMIT)] = None,
+    next_token: Optional[str] = None,
+    updated_since: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    order: Optional[Literal["asc", "desc"]] = None,
+    fields: Optional[str] = None,
+    accept: Annotated[str | None, Header()] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+    cache_control: Annotated[str | None, Header()] = None,
     correlation_id: Annotated[str | None, Header()] = uuid4(),
 ):
     try:
@@ -33,20 +115,234 @@ async def read_all_recipes(
         logger.append_keys(correlation_id=correlation_id, user_email=user_email)
         logger.info("Starting recipes handler for read_all_recipes()")
 
-        recipe = Recipes(user_email=user_email, logger=logger)
-        result = recipe.get_all_recipes()
-        logger.info("Finished read_recipe_item() successfully")
-        return result
+        projection = parse_fields(fields)
+        # The "SK" is always read (identifies the items), but only returned if requested
+        excluded_keys = RecipeModel.get_unrequested_keys(fields)
+        recipe = AsyncRecipes(
+            user_email=user_email, logger=logger, use_cache=use_cache(cache_control)
+        )
+
+        # Streaming mode sends each DynamoDB page as soon as it is retrieved
+        if accept and NDJSON_MEDIA_TYPE in accept:
+            logger.info("Streaming read_all_recipes() response as NDJSON")
+            return StreamingResponse(
+                generate_ndjson(
+                    recipe.iter_recipe_pages(fields=projection), excluded_keys
+                ),
+                media_type=NDJSON_MEDIA_TYPE,
+            )
+
+        # The collection ETag comes from the META item (no RECIPE items are read)
+        etag = await recipe.get_collection_etag(
+            fields, limit, next_token, updated_since, date_from, date_to, order
+        )
+        if etag and etag_matches(if_none_match, etag):
+            logger.info("Finished read_all_recipes() with a not modified response")
+            return etag_response(b"", etag, if_none_match)
+
+        # Delta sync mode only returns the changes (and deletions) since a timestamp
+        if updated_since:
+            delta = await recipe.get_recipes_updated_since(
+                updated_since=updated_since, fields=projection
+            )
+            with timed("serialization"):
+                content = delta.model_dump_json(
+                    exclude_unset=bool(projection),
+                    exclude={"items": {"__all__": excluded_keys}},
+                )
+        # Date range mode is sorted and paginated by the "recipe_date" index
+        elif date_from or date_to or order:
+            page = await recipe.get_recipes_by_date_range(
+                start=date_from and date_from.isoformat(),
+                end=date_to and date_to.isoformat(),
+                limit=limit or DEFAULT_PAGE_LIMIT,
+                order=order or "asc",
+                next_token=next_token,
+                fields=projection,
+            )
+            with timed("serialization"):
+                content = page.model_dump_json(
+                    exclude_unset=bool(projection),
+                    exclude={"items": {"__all__": excluded_keys}},
+                )
+        # Paginated mode is only used when requested (keeps the list contract)
+        elif limit or next_token:
+            page = await recipe.get_recipes_page(
+                limit=limit or DEFAULT_PAGE_LIMIT,
+                next_token=next_token,
+                fields=projection,
+            )
+            with timed("serialization"):
+                content = page.model_dump_json(
+                    exclude_unset=bool(projection),
+                    exclude={"items": {"__all__": excluded_keys}},
+                )
+        else:
+            recipes = await recipe.get_all_recipes(fields=projection)
+            with timed("serialization"):
+                content = RecipeCodec.dump_json(
+                    recipes, partial=bool(projection), exclude=excluded_keys
+                )
+        logger.info("Finished read_all_recipes() successfully")
+
+        # Users without META item yet (items written before it existed)
+        if etag is None:
+            etag = build_content_etag(
+                content.encode("utf-8") if isinstance(content, str) else content
+            )
+
+        # Models are serialized in a single pass (skips the generic "jsonable_encoder")
+        return etag_response(content, etag, if_none_match)
 
     except Exception as e:
         logger.error(f"Error in read_all_recipes(): {e}")
         raise e
 
 
+@router.post("/recipes:batchGet", tags=["recipes"])
+async def batch_get_recipe_items(
+    request_details: dict,
+    fields: Optional[str] = None,
+    correlation_id: Annotated[str | None, Header()] = uuid4(),
+):
+    try:
+        # Validate payload with JSON-Schema (precompiled validator)
+        validation_result = validate_payload(
+            data=request_details,
+            json_schema_type=JSONSchemaType.RECIPES_BATCH_GET,
+            logger=logger,
+        )
+        if isinstance(validation_result, Exception):
+            raise SchemaValidationException(request_details, validation_result)
+
+        user_email = request_details["user_email"].replace(" ", "+")
+        logger.append_keys(correlation_id=correlation_id, user_email=user_email)
+        logger.info("Starting recipes handler for batch_get_recipe_items()")
+
+        projection = parse_fields(fields)
+        recipe = AsyncRecipes(user_email=user_email, logger=logger)
+        result = await recipe.get_recipes_by_ulids(
+            ulids=request_details["recipe_ids"], fields=projection
+        )
+        logger.info("Finished batch_get_recipe_items() successfully")
+
+        # The "PK" and "SK" are always read (to match the ULIDs), but only returned
+        # if requested
+        excluded_keys = RecipeModel.get_unrequested_keys(fields)
+        with timed("serialization"):
+            content = result.model_dump_json(
+                exclude_unset=bool(projection),
+                exclude={"items": {"__all__": excluded_keys}},
+            )
+        return Response(content=content, media_type="application/json")
+
+    except Exception as e:
+        logger.error(f"Error in batch_get_recipe_items(): {e}")
+        raise e
+
+
+@router.post("/recipes:batchCreate", tags=["recipes"])
+async def batch_create_recipe_items(
+    request_details: dict,
+    correlation_id: Annotated[str | None, Header()] = uuid4(),
+):
+    try:
+        # Validate payload with JSON-Schema (precompiled validator)
+        validation_result = validate_payload(
+            data=request_details,
+            json_schema_type=JSONSchemaType.RECIPES_BATCH_CREATE,
+            logger=logger,
+        )
+        if isinstance(validation_result, Exception):
+            raise SchemaValidationException(request_details, validation_result)
+
+        user_email = request_details["user_email"].replace(" ", "+")
+        logger.append_keys(correlation_id=correlation_id, user_email=user_email)
+        logger.info("Starting recipes handler for batch_create_recipe_items()")
+
+        # Each RECIPE is validated on its own, so invalid items do not fail the batch
+        results, valid_indexes, valid_recipes = {}, [], []
+        for index, recipe_details in enumerate(request_details["recipes"]):
+            recipe_details = {**recipe_details, "user_email": user_email}
+            validation_result = validate_payload(
+                data=recipe_details,
+                json_schema_type=JSONSchemaType.RECIPES,
+                logger=logger,
+            )
+            if isinstance(validation_result, Exception):
+                results[index] = RecipeBatchCreateResultModel(
+                    index=index,
+                    status_code=400,
+                    error=getattr(validation_result, "message", str(validation_result)),
+                )
+            else:
+                valid_indexes.append(index)
+                valid_recipes.append(recipe_details)
+
+        if valid_recipes:
+            recipes = AsyncRecipes(user_email=user_email, logger=logger)
+            created = await recipes.create_recipes(valid_recipes, validated=True)
+            for index, result in zip(valid_indexes, created):
+                result.index = index
+                results[index] = result
+
+        created_count = sum(result.status_code == 201 for result in results.values())
+        logger.info("Finished batch_create_recipe_items() successfully")
+
+        # Returned as a response, so it skips the "jsonable_encoder" of FastAPI
+        return FastJSONResponse(
+            RecipesBatchCreateModel(
+                created=created_count,
+                failed=len(results) - created_count,
+                results=[results[index] for index in range(len(results))],
+            )
+        )
+
+    except Exception as e:
+        logger.error(f"Error in batch_create_recipe_items(): {e}")
+        raise e
+
+
+@router.post("/recipes:import", tags=["recipes"])
+async def create_recipes_import(
+    request_details: dict,
+    correlation_id: Annotated[str | None, Header()] = uuid4(),
+):
+    try:
+        # Validate payload with JSON-Schema (precompiled validator)
+        validation_result = validate_payload(
+            data=request_details,
+            json_schema_type=JSONSchemaType.RECIPES_IMPORT,
+            logger=logger,
+        )
+        if isinstance(validation_result, Exception):
+            raise SchemaValidationException(request_details, validation_result)
+
+        user_email = request_details["user_email"].replace(" ", "+")
+        logger.append_keys(correlation_id=correlation_id, user_email=user_email)
+        logger.info("Starting recipes handler for create_recipes_import()")
+
+        # The file is uploaded directly to S3 and imported asynchronously
+        recipe_imports = RecipeImports(user_email=user_email, logger=logger)
+        result = await run_in_executor(
+            recipe_imports.create_import, request_details["file_format"]
+        )
+
+        logger.info("Finished create_recipes_import() successfully")
+        return FastJSONResponse(result)
+
+    except Exception as e:
+        logger.error(f"Error in create_recipes_import(): {e}")
+        raise e
+
+
 @router.get("/recipes/{recipe_id}", tags=["recipes"])
 async def read_recipe_item(
     user_email: str,
     recipe_id: str,
+    fields: Optional[str] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+    cache_control: Annotated[str | None, Header()] = None,
     correlation_id: Annotated[str | None, Header()] = uuid4(),
 ):
     try:
@@ -54,10 +350,35 @@ async def read_recipe_item(
         logger.append_keys(correlation_id=correlation_id, user_email=user_email)
         logger.info("Starting recipes handler for read_recipe_item()")
 
-        recipe = Recipes(user_email=user_email, logger=logger)
-        result = recipe.get_recipe_by_ulid(ulid=recipe_id)
+        projection = parse_fields(fields)
+        recipe = AsyncRecipes(
+            user_email=user_email, logger=logger, use_cache=use_cache(cache_control)
+        )
+
+        # The ETag is built from "updated_at", so it is always read
+        result = await recipe.get_recipe_by_ulid(
+            ulid=recipe_id,
+            fields=projection and [*projection, "updated_at"],
+        )
         logger.info("Finished read_recipe_item() successfully")
-        return result
+        if not result:
+            return FastJSONResponse(result)
+
+        etag = build_etag(result.SK, result.updated_at, fields)
+        if etag_matches(if_none_match, etag):
+            return etag_response(b"", etag, if_none_match)
+
+        # Partial items only contain the attributes of the sparse fieldset
+        with timed("serialization"):
+            if projection:
+                content = result.model_dump_json(
+                    exclude_unset=True,
+                    exclude=RecipeModel.get_unrequested_keys(fields)
+                    | ({"updated_at"} - set(projection)),
+                )
+            else:
+                content = result.model_dump_json()
+        return etag_response(content, etag)
 
     except Exception as e:
         logger.error(f"Error in read_recipe_item(): {e}")
@@ -74,21 +395,22 @@ async def create_recipe_item(
         user_email = recipe_details.get("user_email").replace(" ", "+")
         logger.append_keys(correlation_id=correlation_id, user_email=user_email)
 
-        # Validate payload with JSON-Schema
-        recipes_schema = Schema(JSONSchemaType.RECIPES, logger=logger).get_schema()
-        validation_result = validate_json(
-            data=recipe_details, json_schema=recipes_schema, logger=logger
+        # Validate payload with JSON-Schema (precompiled validator)
+        validation_result = validate_payload(
+            data=recipe_details,
+            json_schema_type=JSONSchemaType.RECIPES,
+            logger=logger,
         )
         if isinstance(validation_result, Exception):
             raise SchemaValidationException(recipe_details, validation_result)
         logger.info("Starting recipes handler for create_recipe_item()")
 
         # After schema validation, it's safe to load the RECIPE element
-        recipes = Recipes(user_email=user_email, logger=logger)
-        result = recipes.create_recipe(recipe_details)
+        recipes = AsyncRecipes(user_email=user_email, logger=logger)
+        result = await recipes.create_recipe(recipe_details, validated=True)
 
         logger.info("Finished create_recipe_item() successfully")
-        return result
+        return FastJSONResponse(result)
 
     except Exception as e:
         logger.error(f"Error in create_recipe_item(): {e}")
@@ -107,22 +429,21 @@ async def patch_recipe_item(
         logger.append_keys(correlation_id=correlation_id, user_email=user_email)
         logger.info("Starting recipes handler for patch_recipe_item()")
 
-        # Validate payload with JSON-Schema
-        recipes_schema = Schema(JSONSchemaType.RECIPES, logger=logger).get_schema()
-        recipes_schema.pop(
-            "required", None
-        )  # For patch, do not enforce mandatory fields in schema
-        validation_result = validate_json(
-            data=recipe_details, json_schema=recipes_schema, logger=logger
+        # Validate payload with JSON-Schema (precompiled validator)
+        validation_result = validate_payload(
+            data=recipe_details,
+            json_schema_type=JSONSchemaType.RECIPES,
+            partial=True,  # For patch, do not enforce mandatory fields in schema
+            logger=logger,
         )
         if isinstance(validation_result, Exception):
             raise SchemaValidationException(recipe_details, validation_result)
 
-        recipe = Recipes(user_email=user_email, logger=logger)
-        result = recipe.patch_recipe(ulid=recipe_id, recipe_data=recipe_details)
+        recipe = AsyncRecipes(user_email=user_email, logger=logger)
+        result = await recipe.patch_recipe(ulid=recipe_id, recipe_data=recipe_details)
 
         logger.info("Finished patch_recipe_item() successfully")
-        return result
+        return FastJSONResponse(result)
 
     except Exception as e:
         logger.error(f"Error in patch_recipe_item(): {e}")
@@ -140,11 +461,11 @@ async def delete_recipe_item(
         logger.append_keys(correlation_id=correlation_id, user_email=user_email)
         logger.info("Starting recipes handler for delete_recipe_item()")
 
-        recipe = Recipes(user_email=user_email, logger=logger)
-        result = recipe.delete_recipe(ulid=recipe_id)
+        recipe = AsyncRecipes(user_email=user_email, logger=logger)
+        result = await recipe.delete_recipe(ulid=recipe_id)
 
         logger.info("Finished delete_recipe_item() successfully")
-        return result
+        return FastJSONResponse(result)
 
     except Exception as e:
         logger.error(f"Error in delete_recipe_item(): {e}")
@@ -1,6 +1,8 @@
 # Built-in imports
 import os
+import copy
 import json
+from functools import lru_cache
 from typing import Optional
 
 # External imports
@@ -27,9 +29,19 @@ class Schema:
         self.logger = logger or custom_logger()
 
         self.logger.info(f"Loading schema for json_schema_type: {json_schema_type}")
-        file_path = os.path.join(os.path.dirname(__file__), json_schema_type.value)
-        with open(file_path, "r") as file:
-            self.json_schema = json.loads(file.read())
+        # Copy of the cached schema, so that callers can safely modify it
+        self.json_schema = copy.deepcopy(load_schema_file(json_schema_type))
 
     def get_schema(self) -> dict:
         return self.json_schema
+
+
+@lru_cache(maxsize=None)
+def load_schema_file(json_schema_type: JSONSchemaType) -> dict:
+    """
+    Read and parse the JSON Schema file only once per container (cached).
+    :param json_schema_type (JSONSchemaType): Enumeration for the JSON Schema type.
+    """
+    file_path = os.path.join(os.path.dirname(__file__), json_schema_type.value)
+    with open(file_path, "r") as file:
+        return json.loads(file.read())
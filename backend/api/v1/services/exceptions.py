@@ -1,9 +1,15 @@
 # Built-in imports
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 # External imports
 from fastapi import HTTPException
-import jsonschema
+
+# Own imports
+from api.v1.services.validator import build_validation_error_detail
+
+# Only for type hints ("jsonschema" is imported on the first validation)
+if TYPE_CHECKING:
+    import jsonschema
 
 
 class SchemaValidationException(HTTPException):
@@ -16,7 +22,7 @@ class SchemaValidationException(HTTPException):
         self,
         payload: str,
         base_exception: Optional[
-            Union[jsonschema.ValidationError, jsonschema.SchemaError, Exception]
+            Union["jsonschema.ValidationError", "jsonschema.SchemaError", Exception]
         ] = None,
         status_code=400,
     ):
@@ -25,11 +31,5 @@ class SchemaValidationException(HTTPException):
         :param base_exception: base_exception that could be from jsonschema or generic Exception.
         :param status_code (int): Status Code to send in the exception.
         """
-        detail = {
-            "error": "Input JSON body failed schema validation",
-            "input": payload,
-            "message": base_exception.message or base_exception,
-            "schema": base_exception.schema or None,
-            "json_path": base_exception.json_path or None,
-        }
+        detail = build_validation_error_detail(payload, base_exception)
         super().__init__(status_code=status_code, detail=detail)
@@ -1,14 +1,21 @@
 # Built-in imports
-from typing import Union, Literal, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Union, Literal, Optional
 
 # External imports
-import jsonschema
-from jsonschema._format import FormatChecker
-
 from aws_lambda_powertools import Logger
 
 # Own imports
+from api.v1.schemas.schema import Schema
+from common.enums import JSONSchemaType
 from common.logger import custom_logger
+from common.runtime_hooks import before_snapshot
+from common.timing import timed
+
+# "jsonschema" is only imported by the first validation (not all the requests
+# validate payloads, so it is kept out of the cold starts)
+if TYPE_CHECKING:
+    import jsonschema
 
 
 def validate_json(
@@ -23,6 +30,9 @@ def validate_json(
     :param json_schema (dict): JSON Schema to use for the validation.
     :param logger (Optional(Logger)): Logger object.
     """
+    import jsonschema
+    from jsonschema._format import FormatChecker
+
     logger = logger or custom_logger()
     try:
         jsonschema.validate(
@@ -30,22 +40,117 @@ def validate_json(
             schema=json_schema,
             format_checker=FormatChecker(),  # Required to also validate "format" fields in schema
         )
-    except jsonschema.ValidationError as validation_error:
+    except Exception as e:
+        return _log_validation_exception(e, logger)
+
+    return True
+
+
+@lru_cache(maxsize=None)
+def get_validator(
+    json_schema_type: JSONSchemaType, partial: bool = False
+) -> "jsonschema.protocols.Validator":
+    """
+    Registry of precompiled JSON Schema validators. Each schema is loaded, checked
+    and compiled only once per container (cached).
+
+    :param json_schema_type (JSONSchemaType): Enumeration for the JSON Schema type.
+    :param partial (bool): Variant without "required" fields (e.g. for PATCH requests).
+    """
+    import jsonschema
+    from jsonschema._format import FormatChecker
+
+    json_schema = Schema(json_schema_type).get_schema()
+    if partial:
+        json_schema.pop("required", None)
+
+    validator_class = jsonschema.validators.validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    return validator_class(
+        json_schema,
+        format_checker=FormatChecker(),  # Required to also validate "format" fields in schema
+    )
+
+
+@before_snapshot
+def precompile_validators() -> None:
+    """
+    Compile all the validators (and import "jsonschema") before a SnapStart
+    snapshot, so the restored environments never pay for them.
+    """
+    for json_schema_type in JSONSchemaType:
+        get_validator(json_schema_type)
+        get_validator(json_schema_type, partial=True)
+
+
+@timed("validation")
+def validate_payload(
+    data: dict,
+    json_schema_type: JSONSchemaType,
+    partial: bool = False,
+    logger: Optional[Logger] = None,
+) -> Union[Literal[True], Exception]:
+    """
+    Validation function that applies the precompiled JSON Schema validator from
+    the registry to the payload (without re-reading or re-checking the schema).
+
+    :param data (dict): JSON object.
+    :param json_schema_type (JSONSchemaType): Enumeration for the JSON Schema type.
+    :param partial (bool): Do not enforce the "required" fields (e.g. for PATCH requests).
+    :param logger (Optional(Logger)): Logger object.
+    """
+    from jsonschema.exceptions import best_match
+
+    logger = logger or custom_logger()
+    try:
+        validator = get_validator(json_schema_type, partial)
+        validation_error = best_match(validator.iter_errors(data))
+        if validation_error is not None:
+            raise validation_error
+    except Exception as e:
+        return _log_validation_exception(e, logger)
+
+    return True
+
+
+def _log_validation_exception(exception: Exception, logger: Logger) -> Exception:
+    """
+    Log the details of a JSON Schema validation failure and return the exception.
+    :param exception (Exception): Exception raised during the validation.
+    :param logger (Logger): Logger object.
+    """
+    import jsonschema
+
+    if isinstance(exception, jsonschema.ValidationError):
         logger.error(
             "JSONSchema ValidationError occurred. "
-            f"message: {validation_error.message}."
-            f"json_path: {validation_error.json_path}"
+            f"message: {exception.message}."
+            f"json_path: {exception.json_path}"
         )
-        return validation_error
-    except jsonschema.SchemaError as schema_error:
+    elif isinstance(exception, jsonschema.SchemaError):
         logger.error(
             "JSONSchema SchemaError occured. "
-            f"message: {schema_error.message}."
-            f"json_path: {schema_error.json_path}"
+            f"message: {exception.message}."
+            f"json_path: {exception.json_path}"
         )
-        return schema_error
-    except Exception as e:
-        logger.error("Unknown error for JSONSchema validation. " f"message: {str(e)}")
-        return e
+    else:
+        logger.error(
+            "Unknown error for JSONSchema validation. " f"message: {str(exception)}"
+        )
+    return exception
 
-    return True
+
+def build_validation_error_detail(payload: dict, base_exception: Exception) -> dict:
+    """
+    Build the details of the error response for a payload that failed the JSON
+    Schema validation (same body for all the API entry points).
+    :param payload (dict): JSON payload of the request that failed validation.
+    :param base_exception (Exception): Exception returned by the validation.
+    """
+    return {
+        "error": "Input JSON body failed schema validation",
+        "input": payload,
+        "message": base_exception.message or base_exception,
+        "schema": base_exception.schema or None,
+        "json_path": base_exception.json_path or None,
+    }
@@ -0,0 +1,201 @@
+################################################################################
+# Consumed capacity accounting of the DynamoDB calls per access pattern. The
+# <DynamoDBHelper> requests "ReturnConsumedCapacity" in every call and records
+# the capacity units, items and pages of the responses under the name of the
+# current access pattern (e.g. "get_all_recipes"), set with <access_pattern>.
+# The entrypoints account each invocation with <log_capacity_metrics> and emit
+# its totals as EMF metrics (stdout). Outside of an invocation nothing is recorded.
+################################################################################
+
+# Built-in imports
+import functools
+import inspect
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
+
+# External imports
+from aws_lambda_powertools.metrics import EphemeralMetrics, MetricUnit
+
+# Own imports
+from common.timing import METRICS_NAMESPACE, METRICS_SERVICE
+
+# "TOTAL" includes the capacity of the indexes (use "INDEXES" for the breakdown)
+RETURN_CONSUMED_CAPACITY = "TOTAL"
+
+_current_access_pattern: ContextVar[Optional[str]] = ContextVar(
+    "access_pattern", default=None
+)
+
+# Totals of the current invocation (the thread pools copy the context, so they
+# are recorded from their threads too)
+_current_usage: ContextVar[Optional[dict[str, "CapacityUsage"]]] = ContextVar(
+    "capacity_usage", default=None
+)
+_lock = threading.Lock()
+
+
+@dataclass
+class CapacityUsage:
+    """Consumed capacity of an access pattern during the invocation."""
+
+    read_capacity_units: float = 0.0
+    write_capacity_units: float = 0.0
+    items: int = 0
+    pages: int = 0
+    requests: int = 0
+
+
+class access_pattern:
+    """
+    Name the DynamoDB calls made inside (usable as context manager or decorator,
+    also for generators). Nested access patterns are accounted to the outermost
+    one (e.g. the META item update of "patch_recipe").
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        :param name (str): Name of the access pattern (e.g. "get_all_recipes").
+        """
+        self.name = name
+        self._token = None
+
+    def __enter__(self) -> "access_pattern":
+        if _current_access_pattern.get() is None:
+            self._token = _current_access_pattern.set(self.name)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._token is not None:
+            _current_access_pattern.reset(self._token)
+            self._token = None
+
+    def __call__(self, function: Callable) -> Callable:
+        name = self.name
+
+        # Generators run their calls on each step (e.g. in the streaming responses)
+        if inspect.isgeneratorfunction(function):
+
+            @functools.wraps(function)
+            def generator_wrapper(*args, **kwargs):
+                generator = function(*args, **kwargs)
+                while True:
+                    with access_pattern(name):
+                        try:
+                            value = next(generator)
+                        except StopIteration as stop:
+                            return stop.value
+                    yield value
+
+            return generator_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with access_pattern(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+
+def record_consumed_capacity(
+    operation: str,
+    response: dict,
+    items: int = 0,
+    write: bool = False,
+    page: bool = False,
+) -> None:
+    """
+    Record the "ConsumedCapacity" of a DynamoDB response for the current access
+    pattern (or the operation, if the call is not in an access pattern).
+    :param operation (str): Name of the operation (e.g. "put_item").
+    :param response (dict): Response of the DynamoDB call.
+    :param items (int): Items read or written by the call.
+    :param write (bool): Write operation (WCU) instead of a read (RCU).
+    :param page (bool): The response is a page of a query.
+    """
+    consumed_capacity = response.get("ConsumedCapacity") or []
+    if isinstance(consumed_capacity, dict):
+        consumed_capacity = [consumed_capacity]
+    capacity_units = sum(
+        capacity.get("CapacityUnits", 0.0) for capacity in consumed_capacity
+    )
+
+    usage_by_access_pattern = _current_usage.get()
+    if usage_by_access_pattern is None:
+        return
+
+    name = _current_access_pattern.get() or operation
+    with _lock:
+        usage = usage_by_access_pattern.setdefault(name, CapacityUsage())
+        if write:
+            usage.write_capacity_units += capacity_units
+        else:
+            usage.read_capacity_units += capacity_units
+        usage.items += items
+        usage.pages += int(page)
+        usage.requests += 1
+
+
+def get_capacity_usage() -> dict[str, CapacityUsage]:
+    """Consumed capacity of each access pattern in the current invocation."""
+    with _lock:
+        return dict(_current_usage.get() or {})
+
+
+def emit_capacity_metrics(usage_by_access_pattern: dict[str, CapacityUsage]) -> None:
+    """
+    Print an EMF record with the totals of each access pattern of an invocation
+    (one record per access pattern, as it is the dimension).
+    :param usage_by_access_pattern (dict): Consumed capacity of each access pattern.
+    """
+    for name, usage in usage_by_access_pattern.items():
+        metrics = EphemeralMetrics(namespace=METRICS_NAMESPACE, service=METRICS_SERVICE)
+        metrics.add_dimension(name="access_pattern", value=name)
+        for metric_name, unit, value in (
+            ("consumed_rcu", MetricUnit.Count, usage.read_capacity_units),
+            ("consumed_wcu", MetricUnit.Count, usage.write_capacity_units),
+            ("items", MetricUnit.Count, usage.items),
+            ("pages", MetricUnit.Count, usage.pages),
+            ("requests", MetricUnit.Count, usage.requests),
+        ):
+            metrics.add_metric(name=metric_name, unit=unit, value=value)
+        metrics.flush_metrics()
+
+
+@contextmanager
+def capacity_accounting() -> Iterator[dict[str, CapacityUsage]]:
+    """
+    Account the consumed capacity of an invocation and emit its metrics at the
+    end (even if it fails). Nested entrypoints share the outer accounting.
+    """
+    usage_by_access_pattern = _current_usage.get()
+    if usage_by_access_pattern is not None:
+        yield usage_by_access_pattern
+        return
+
+    usage_by_access_pattern = {}
+    token = _current_usage.set(usage_by_access_pattern)
+    try:
+        yield usage_by_access_pattern
+    finally:
+        _current_usage.reset(token)
+        with _lock:
+            usage_by_access_pattern = dict(usage_by_access_pattern)
+        emit_capacity_metrics(usage_by_access_pattern)
+
+
+def log_capacity_metrics(handler: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorator for the Lambda handlers that accounts the consumed capacity of
+    each invocation and emits its metrics at the end.
+    :param handler (Callable): Lambda handler.
+    """
+
+    @functools.wraps(handler)
+    def wrapper(event: Any, context: Any) -> Any:
+        with capacity_accounting():
+            return handler(event, context)
+
+    return wrapper
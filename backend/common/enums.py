@@ -8,6 +8,9 @@ class JSONSchemaType(Enum):
     """
 
     RECIPES = "schema-recipes.json"
+    RECIPES_BATCH_GET = "schema-recipes-batch-get.json"
+    RECIPES_BATCH_CREATE = "schema-recipes-batch-create.json"
+    RECIPES_IMPORT = "schema-recipes-import.json"
 
 
 class DDBPrefixes(Enum):
@@ -18,3 +21,35 @@ class DDBPrefixes(Enum):
 
     PK_USER = "USER#"
     SK_RECIPE_DATA = "RECIPE#"
+    SK_TOMBSTONE = "TOMBSTONE#"
+    SK_IMPORT = "IMPORT#"
+    SK_META_RECIPES = "META#RECIPES"
+
+
+class DDBIndexes(Enum):
+    """
+    Enumerations for the DynamoDB secondary indexes (all of them use "PK" as
+    partition key).
+    """
+
+    UPDATED_AT = "GSI-UpdatedAt"
+    RECIPE_DATE = "GSI-RecipeDate"
+
+
+class ImportFileFormat(Enum):
+    """
+    Enumerations for the supported file formats of the RECIPE imports.
+    """
+
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+class ImportStatus(Enum):
+    """
+    Enumerations for the status of the RECIPE imports (saved in the checkpoint).
+    """
+
+    PENDING = "PENDING"
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETED = "COMPLETED"
@@ -0,0 +1,40 @@
+# Built-in imports
+from typing import Any
+
+
+class HTTPError(Exception):
+    """
+    Error with an HTTP status code raised by the access patterns. It does not
+    depend on FastAPI (e.g. the imports Lambda Function never loads it), and the
+    API renders it as an <HTTPException> ({"detail": ...}).
+    """
+
+    def __init__(self, status_code: int, detail: Any = None) -> None:
+        """
+        :param status_code (int): HTTP status code of the error (e.g. 400).
+        :param detail (Any): Details of the error for the response body.
+        """
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class UnprocessedKeysError(Exception):
+    """
+    Error raised when a DynamoDB batch read still has "UnprocessedKeys" after
+    all its attempts (e.g. the table is throttled).
+    """
+
+    def __init__(self, table_name: str, keys: list[dict], attempts: int) -> None:
+        """
+        :param table_name (str): Name of the DynamoDB table.
+        :param keys (list[dict]): Primary keys that were not processed.
+        :param attempts (int): Attempts made for the keys.
+        """
+        super().__init__(
+            f"batch_get_item could not process {len(keys)} keys for "
+            f"table_name: {table_name} after {attempts} attempts"
+        )
+        self.table_name = table_name
+        self.keys = keys
+        self.attempts = attempts
@@ -0,0 +1,34 @@
+# Built-in imports
+from decimal import Decimal
+from typing import Any
+
+# External imports
+import orjson
+from pydantic import BaseModel
+from ulid import ULID
+
+
+def json_default(value: Any) -> Any:
+    """
+    Serializer for the types that "orjson" does not support natively, such as
+    "Decimal" (boto3 resource reads), ULIDs, sets and pydantic models.
+    Datetimes and UUIDs are already handled natively by "orjson".
+    """
+    if isinstance(value, Decimal):
+        # "NaN" and "Infinity" are serialized as null (like the floats in orjson)
+        return int(value) if value.is_finite() and value % 1 == 0 else float(value)
+    if isinstance(value, ULID):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize the content to JSON bytes with "orjson".
+    :param content (Any): Content to serialize.
+    """
+    return orjson.dumps(content, default=json_default, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,128 @@
+################################################################################
+# Per-request latency breakdown. The entrypoints open a <request_timer> for each
+# invocation and the stages (validation, DynamoDB calls, (de)serialization...)
+# are measured with <timed>. At the end of the invocation the durations are:
+#  - Returned to the clients in the "Server-Timing" header.
+#  - Emitted as CloudWatch Embedded Metric Format (EMF) records to stdout (the
+#    Lambda logs), tagged by route and cold/warm start.
+# Outside of a request (e.g. the other Lambda Functions) <timed> does nothing.
+################################################################################
+
+# Built-in imports
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# External imports
+from aws_lambda_powertools.metrics import EphemeralMetrics, MetricUnit
+
+METRICS_NAMESPACE = os.environ.get("POWERTOOLS_METRICS_NAMESPACE", "RecipeApp")
+METRICS_SERVICE = "recipe-app"
+
+# Only the first invocation of each execution environment is a cold start
+_cold_start = True
+
+_current_timer: ContextVar[Optional["RequestTimer"]] = ContextVar(
+    "request_timer", default=None
+)
+
+
+class RequestTimer:
+    """Accumulated duration (milliseconds) of each stage of a request."""
+
+    def __init__(self, route: str, cold_start: bool = False) -> None:
+        """
+        :param route (str): Route of the request (e.g. "GET /api/v1/recipes").
+        :param cold_start (bool): First invocation of the execution environment.
+        """
+        self.route = route
+        self.cold_start = cold_start
+        self.start = time.perf_counter()
+        self.stages: dict[str, float] = {}
+        # The stages can be measured from the threads of the thread pools
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, duration_ms: float) -> None:
+        """
+        Add the duration of a stage (stages measured multiple times are summed).
+        :param stage (str): Name of the stage (e.g. "dynamodb").
+        :param duration_ms (float): Duration in milliseconds.
+        """
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + duration_ms
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the start of the request."""
+        return (time.perf_counter() - self.start) * 1000
+
+    def server_timing(self) -> str:
+        """Value of the "Server-Timing" header (stages and the total so far)."""
+        with self._lock:
+            stages = list(self.stages.items())
+        return ", ".join(
+            f"{stage};dur={duration_ms:.1f}"
+            for stage, duration_ms in [*stages, ("total", self.elapsed_ms())]
+        )
+
+    def emit_metrics(self) -> None:
+        """Print the EMF record with the duration of each stage and the total."""
+        metrics = EphemeralMetrics(namespace=METRICS_NAMESPACE, service=METRICS_SERVICE)
+        metrics.add_dimension(name="route", value=self.route)
+        metrics.add_dimension(name="start", value="cold" if self.cold_start else "warm")
+        with self._lock:
+            stages = list(self.stages.items())
+        for stage, duration_ms in [*stages, ("total", self.elapsed_ms())]:
+            metrics.add_metric(
+                name=f"{stage}_latency", unit=MetricUnit.Milliseconds, value=duration_ms
+            )
+        metrics.flush_metrics()
+
+
+def get_timer() -> Optional[RequestTimer]:
+    """Timer of the current request (None outside of a request)."""
+    return _current_timer.get()
+
+
+@contextmanager
+def request_timer(route: str) -> Iterator[RequestTimer]:
+    """
+    Measure a request and emit its metrics at the end. Nested entrypoints (e.g.
+    the native handler delegating to the FastAPI app) share the outer timer.
+    :param route (str): Route of the request (e.g. "GET /api/v1/recipes").
+    """
+    global _cold_start
+
+    timer = _current_timer.get()
+    if timer is not None:
+        yield timer
+        return
+
+    timer = RequestTimer(route, cold_start=_cold_start)
+    _cold_start = False
+    token = _current_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _current_timer.reset(token)
+        timer.emit_metrics()
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """
+    Measure a stage of the current request (usable as decorator).
+    :param stage (str): Name of the stage (e.g. "dynamodb").
+    """
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(stage, (time.perf_counter() - start) * 1000)
@@ -0,0 +1,33 @@
+# Built-in imports
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+# Own imports
+from helpers.aws_clients import MAX_POOL_CONNECTIONS
+
+# Threads for the blocking boto3 calls (matches the connection pool size of the
+# clients, so the workers never wait for a connection of the pool)
+ASYNC_MAX_WORKERS = int(os.environ.get("ASYNC_MAX_WORKERS", MAX_POOL_CONNECTIONS))
+
+executor = ThreadPoolExecutor(
+    max_workers=ASYNC_MAX_WORKERS, thread_name_prefix="blocking-io"
+)
+
+
+async def run_in_executor(function: Callable, *args, **kwargs) -> Any:
+    """
+    Run a blocking function (e.g. a boto3 call) in the bounded thread pool, so
+    the event loop keeps serving other requests while it waits for the I/O.
+    The context variables of the caller (e.g. request timers) are propagated.
+    :param function (Callable): Blocking function to run.
+    :param args: Positional arguments of the function.
+    :param kwargs: Keyword arguments of the function.
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, functools.partial(context.run, function, *args, **kwargs)
+    )
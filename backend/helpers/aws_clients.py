@@ -0,0 +1,147 @@
+# Built-in imports
+import os
+import threading
+from typing import Any, Optional
+
+# External imports
+import boto3
+from botocore.config import Config
+
+# Own imports
+from common.runtime_hooks import after_restore
+
+# Connection pool, timeouts and retries shared by all the boto3 clients
+MAX_POOL_CONNECTIONS = int(os.environ.get("AWS_MAX_POOL_CONNECTIONS", "25"))
+CONNECT_TIMEOUT_SECONDS = float(os.environ.get("AWS_CONNECT_TIMEOUT_SECONDS", "2"))
+READ_TIMEOUT_SECONDS = float(os.environ.get("AWS_READ_TIMEOUT_SECONDS", "10"))
+MAX_ATTEMPTS = int(os.environ.get("AWS_MAX_ATTEMPTS", "3"))
+
+CLIENT_CONFIG = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+    connect_timeout=CONNECT_TIMEOUT_SECONDS,
+    read_timeout=READ_TIMEOUT_SECONDS,
+    # Adaptive mode also rate-limits the client when DynamoDB throttles
+    retries={"mode": "adaptive", "total_max_attempts": MAX_ATTEMPTS},
+)
+
+# Creating clients from a boto3 session is not thread-safe (using them is)
+_lock = threading.Lock()
+_session: Optional[boto3.session.Session] = None
+_clients: dict[tuple, Any] = {}
+_resources: dict[tuple, Any] = {}
+
+
+def get_session() -> boto3.session.Session:
+    """
+    Get the boto3 session shared by all the clients (the botocore session loads
+    the credentials, endpoints and service models only once per container).
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = boto3.session.Session()
+    return _session
+
+
+def get_config_key(config: Optional[Config]) -> Optional[str]:
+    """
+    Key of the settings of a config in the clients cache (the configs with the
+    same settings share one client, even if they are different objects).
+    :param config (Optional(Config)): Settings that override the <CLIENT_CONFIG>.
+    """
+    if config is None:
+        return None
+    return repr(
+        [(option, getattr(config, option)) for option in Config.OPTION_DEFAULTS]
+    )
+
+
+def get_client(
+    service_name: str,
+    endpoint_url: Optional[str] = None,
+    config: Optional[Config] = None,
+) -> Any:
+    """
+    Get the boto3 client of a service (created once per container and reused).
+    :param service_name (str): Name of the AWS service (e.g. "dynamodb").
+    :param endpoint_url (Optional(str)): Endpoint for the service (only for local tests).
+    :param config (Optional(Config)): Settings that override the <CLIENT_CONFIG>.
+    """
+    key = (service_name, endpoint_url, get_config_key(config))
+    client = _clients.get(key)
+    if client is None:
+        session = get_session()
+        with _lock:
+            client = _clients.get(key)
+            if client is None:
+                client = session.client(
+                    service_name,
+                    endpoint_url=endpoint_url,
+                    config=CLIENT_CONFIG.merge(config) if config else CLIENT_CONFIG,
+                )
+                _clients[key] = client
+    return client
+
+
+def get_resource(service_name: str, endpoint_url: Optional[str] = None) -> Any:
+    """
+    Get the boto3 resource of a service (created once per container and reused).
+    :param service_name (str): Name of the AWS service (e.g. "dynamodb").
+    :param endpoint_url (Optional(str)): Endpoint for the service (only for local tests).
+    """
+    key = (service_name, endpoint_url)
+    resource = _resources.get(key)
+    if resource is None:
+        session = get_session()
+        with _lock:
+            resource = _resources.get(key)
+            if resource is None:
+                resource = session.resource(
+                    service_name, endpoint_url=endpoint_url, config=CLIENT_CONFIG
+                )
+                _resources[key] = resource
+    return resource
+
+
+@after_restore
+def reset_connections() -> None:
+    """
+    Drop the clients and resources created before a SnapStart snapshot, as their
+    pooled connections are stale after a restore. They are created again on their
+    next use (from the same session, so the service models are not loaded again).
+    """
+    with _lock:
+        _clients.clear()
+        _resources.clear()
+
+
+class LazyClient:
+    """
+    Proxy of a boto3 client that is only created the first time it is used, so
+    module-level clients do not slow down the cold starts of unused code paths.
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        endpoint_url: Optional[str] = None,
+        config: Optional[Config] = None,
+    ) -> None:
+        """
+        :param service_name (str): Name of the AWS service (e.g. "dynamodb").
+        :param endpoint_url (Optional(str)): Endpoint for the service (only for local tests).
+        :param config (Optional(Config)): Settings that override the <CLIENT_CONFIG>.
+        """
+        self.service_name = service_name
+        self.endpoint_url = endpoint_url
+        self.config = config
+
+    @property
+    def client(self) -> Any:
+        """Shared boto3 client of the proxy (created on first use)."""
+        return get_client(self.service_name, self.endpoint_url, self.config)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
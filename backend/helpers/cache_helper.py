@@ -0,0 +1,317 @@
+# Built-in imports
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+# External imports
+import orjson
+
+# Own imports
+from common.logger import custom_logger
+from common.runtime_hooks import after_restore
+from common.serialization import dumps
+
+logger = custom_logger()
+
+
+class LRUTTLCache:
+    """
+    Bounded in-memory cache with least-recently-used eviction and a time-to-live
+    for each entry. It lives in the Lambda container, so it is shared by all the
+    (warm) invocations of that container, but not across containers.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl_seconds: float = 30,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param max_size (int): Maximum number of entries (LRU eviction above it).
+        :param ttl_seconds (float): Seconds that an entry is valid for.
+        :param clock (Callable): Monotonic clock (only replaced in tests).
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Counters since the container started (exposed in the logs)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a valid entry from the cache (None if it is missing or expired).
+        :param key (Hashable): Key of the entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None
+    ) -> None:
+        """
+        Add or replace an entry (None values are not cached).
+        :param key (Hashable): Key of the entry.
+        :param value (Any): Value of the entry.
+        :param ttl_seconds (Optional(float)): TTL of the entry (default of the cache if None).
+        """
+        if value is None:
+            return
+
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, namespace: Hashable) -> int:
+        """
+        Remove all the entries of a namespace (first element of the tuple keys).
+        :param namespace (Hashable): Namespace of the entries (e.g. partition key).
+        :returns (int): Number of entries removed.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if isinstance(key, tuple) and key and key[0] == namespace
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """
+        Remove all the entries (the counters are kept).
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Get the counters and the current size of the cache.
+        """
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_evictions": self.evictions,
+            "cache_expirations": self.expirations,
+            "cache_size": len(self._entries),
+        }
+
+
+class CacheBackend(ABC):
+    """
+    Interface of the cache backends. The entries of a namespace (e.g. the RECIPE
+    items of a user) are stamped with the current version of the namespace, so a
+    write only has to bump the version: entries of older versions are never read
+    again, and a slow reader can not overwrite newer data with a stale value.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get an entry (None if it is missing or expired).
+        :param key (str): Key of the entry.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """
+        Add or replace an entry (values must be JSON serializable).
+        :param key (str): Key of the entry.
+        :param value (Any): Value of the entry.
+        :param ttl_seconds (float): Seconds that the entry is valid for.
+        """
+
+    @abstractmethod
+    def get_version(self, namespace: str) -> str:
+        """
+        Get the current version of a namespace (a new one is created if missing).
+        :param namespace (str): Namespace of the entries (e.g. "recipes:v:<pk>").
+        """
+
+    @abstractmethod
+    def bump_version(self, namespace: str) -> str:
+        """
+        Replace the version of a namespace (invalidates all its entries).
+        :param namespace (str): Namespace of the entries (e.g. "recipes:v:<pk>").
+        """
+
+    def stats(self) -> dict:
+        """
+        Get the counters of the cache (exposed in the logs).
+        """
+        return {}
+
+    @staticmethod
+    def new_version() -> str:
+        """
+        Generate a unique version (unique values, instead of counters, so that an
+        evicted version key can not bring back the entries of an old version).
+        """
+        return uuid.uuid4().hex
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Cache backend that lives in the Lambda container (LRU + TTL)."""
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 30) -> None:
+        """
+        :param max_size (int): Maximum number of entries (LRU eviction above it).
+        :param ttl_seconds (float): Default seconds that an entry is valid for.
+        """
+        self.cache = LRUTTLCache(max_size, ttl_seconds)
+        # Versions are bounded too (an evicted version only invalidates its entries)
+        self._versions = LRUTTLCache(max_size, ttl_seconds=float("inf"))
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.cache.get(key)
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self.cache.set(key, value, ttl_seconds)
+
+    def get_version(self, namespace: str) -> str:
+        version = self._versions.get(namespace)
+        if version is None:
+            version = self.bump_version(namespace)
+        return version
+
+    def bump_version(self, namespace: str) -> str:
+        version = self.new_version()
+        self._versions.set(namespace, version)
+        return version
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache backend on a Redis-protocol server (e.g. ElastiCache or Valkey), shared
+    by all the Lambda containers. Errors are logged and treated as cache misses,
+    so the reads fall back to DynamoDB.
+    """
+
+    def __init__(self, url: Optional[str] = None, client: Any = None) -> None:
+        """
+        :param url (Optional(str)): URL of the server (e.g. "rediss://host:6379/0").
+        :param client (Any): Existing Redis client (e.g. "fakeredis" for tests).
+        """
+        if client is None:
+            # Only imported when the Redis backend is configured (faster cold starts)
+            import redis
+
+            client = redis.Redis.from_url(
+                url, socket_timeout=0.2, socket_connect_timeout=0.2
+            )
+        self.client = client
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw_value = self.client.get(key)
+        except Exception as error:
+            self._log_error("get", error)
+            return None
+
+        if raw_value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return orjson.loads(raw_value)
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        if value is None:
+            return
+        try:
+            self.client.set(key, dumps(value), px=int(ttl_seconds * 1000))
+        except Exception as error:
+            self._log_error("set", error)
+
+    def get_version(self, namespace: str) -> str:
+        try:
+            version = self.client.get(namespace)
+            if version is None:
+                # Only the first reader creates the version (NX)
+                self.client.set(namespace, self.new_version(), nx=True)
+                version = self.client.get(namespace)
+        except Exception as error:
+            self._log_error("get_version", error)
+            return self.new_version()  # Unknown version: nothing is read from cache
+        return version.decode("utf-8") if isinstance(version, bytes) else version
+
+    def bump_version(self, namespace: str) -> str:
+        version = self.new_version()
+        try:
+            self.client.set(namespace, version)
+        except Exception as error:
+            self._log_error("bump_version", error)
+        return version
+
+    def stats(self) -> dict:
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_errors": self.errors,
+        }
+
+    def _log_error(self, operation: str, error: Exception) -> None:
+        """
+        Log a failed Redis operation (the cache never fails the request).
+        :param operation (str): Name of the cache operation.
+        :param error (Exception): Error raised by the Redis client.
+        """
+        self.errors += 1
+        logger.warning(f"Redis cache {operation} operation failed due to {error}")
+
+
+def get_cache_backend(prefix: str = "RECIPES_CACHE") -> Optional[CacheBackend]:
+    """
+    Create the cache backend from the environment variables of a prefix:
+    "<prefix>_ENABLED" ("true" or "false"), "<prefix>_BACKEND" ("memory" or
+    "redis"), "<prefix>_MAX_SIZE", "<prefix>_TTL_SECONDS" and "REDIS_URL".
+    :param prefix (str): Prefix of the environment variables.
+    :returns (Optional(CacheBackend)): Cache backend, or None if it is disabled.
+    """
+    if os.environ.get(f"{prefix}_ENABLED", "false") != "true":
+        return None
+
+    if os.environ.get(f"{prefix}_BACKEND", "memory") == "redis":
+        cache_backend = RedisCacheBackend(url=os.environ["REDIS_URL"])
+        # Connections opened before a SnapStart snapshot are stale after a restore
+        after_restore(cache_backend.client.connection_pool.disconnect)
+        return cache_backend
+
+    return MemoryCacheBackend(
+        max_size=int(os.environ.get(f"{prefix}_MAX_SIZE", "256")),
+        ttl_seconds=float(os.environ.get(f"{prefix}_TTL_SECONDS", "30")),
+    )
@@ -1,13 +1,31 @@
 # Built-in imports
-import boto3
-from boto3.dynamodb.conditions import Key
+import contextvars
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, Optional
+
+# External imports
+from boto3.dynamodb.conditions import Attr, ConditionBase, Key
 from botocore.exceptions import ClientError
 
 # Own imports
+from common.capacity import RETURN_CONSUMED_CAPACITY, record_consumed_capacity
+from common.exceptions import UnprocessedKeysError
 from common.logger import custom_logger
+from common.timing import timed
+from helpers.aws_clients import get_client, get_resource
+from helpers.expression_builder import build_projection_params, build_update_params
 
 logger = custom_logger()
 
+# Limits and retry configuration for the DynamoDB batch operations
+BATCH_GET_CHUNK_SIZE = 100
+BATCH_WRITE_CHUNK_SIZE = 25
+BATCH_WRITE_MAX_WORKERS = 8
+BACKOFF_BASE_SECONDS = 0.05
+BACKOFF_MAX_SECONDS = 2
+
 
 class DynamoDBHelper:
     """Custom DynamoDB Helper for simplifying CRUD operations."""
@@ -18,15 +36,48 @@ class DynamoDBHelper:
         :param endpoint_url (Optional(str)): Endpoint for DynamoDB (only for local tests).
         """
         self.table_name = table_name
-        self.dynamodb_client = boto3.client("dynamodb", endpoint_url=endpoint_url)
-        self.dynamodb_resource = boto3.resource("dynamodb", endpoint_url=endpoint_url)
-        self.table = self.dynamodb_resource.Table(self.table_name)
+        self.endpoint_url = endpoint_url
+        self._table = None
+
+    @property
+    def dynamodb_client(self) -> Any:
+        """Low-level DynamoDB client (shared, created on first use)."""
+        return get_client("dynamodb", endpoint_url=self.endpoint_url)
+
+    @property
+    def dynamodb_resource(self) -> Any:
+        """DynamoDB resource (shared, created on first use)."""
+        return get_resource("dynamodb", endpoint_url=self.endpoint_url)
+
+    @property
+    def table(self) -> Any:
+        """DynamoDB table resource (only created by the operations that use it)."""
+        # The shared resource is created again after a SnapStart restore
+        dynamodb_resource = self.dynamodb_resource
+        client = dynamodb_resource.meta.client
+        if self._table is None or self._table.meta.client is not client:
+            self._table = dynamodb_resource.Table(self.table_name)
+        return self._table
+
+    def prewarm(self) -> None:
+        """
+        Create the client and the Table resource (loads the service models), e.g.
+        before a SnapStart snapshot. No connections are opened.
+        """
+        self.dynamodb_client
+        self.table
 
-    def get_item_by_pk_and_sk(self, partition_key: str, sort_key: str) -> dict:
+    def get_item_by_pk_and_sk(
+        self,
+        partition_key: str,
+        sort_key: str,
+        projection: Optional[list[str]] = None,
+    ) -> dict:
         """
         Method to get a single DynamoDB item from the primary key (pk+sk).
         :param partition_key (str): partition key value.
         :param sort_key (str): sort key value.
+        :param projection (Optional(list[str])): attributes to read (all if None).
         """
         logger.info(
             f"Starting get_item_by_pk_and_sk with "
@@ -43,9 +94,15 @@ class DynamoDBHelper:
             },
         }
         try:
-            response = self.dynamodb_client.get_item(
-                TableName=self.table_name,
-                Key=primary_key_dict,
+            with timed("dynamodb"):
+                response = self.dynamodb_client.get_item(
+                    TableName=self.table_name,
+                    Key=primary_key_dict,
+                    ReturnConsumedCapacity=RETURN_CONSUMED_CAPACITY,
+                    **build_projection_params(projection),
+                )
+            record_consumed_capacity(
+                "get_item_by_pk_and_sk", response, items=int("Item" in response)
             )
             return response["Item"] if "Item" in response else {}
 
@@ -60,55 +117,358 @@ class DynamoDBHelper:
             raise error
 
     def query_by_pk_and_sk_begins_with(
-        self, partition_key: str, sort_key_portion: str
+        self,
+        partition_key: str,
+        sort_key_portion: str,
+        projection: Optional[list[str]] = None,
     ) -> list[dict]:
         """
         Method to run a query against DynamoDB with partition key and the sort
-        key with <begins-with> functionality on it.
+        key with <begins-with> functionality on it (drains all the pages).
+        :param partition_key (str): partition key value.
+        :param sort_key_portion (str): sort key portion to use in query.
+        :param projection (Optional(list[str])): attributes to read (all if None).
+        """
+        all_items = []
+        for items, _ in self.iter_pages_by_pk_and_sk_begins_with(
+            partition_key=partition_key,
+            sort_key_portion=sort_key_portion,
+            projection=projection,
+        ):
+            all_items.extend(items)
+        return all_items
+
+    def query_page_by_pk_and_sk_begins_with(
+        self,
+        partition_key: str,
+        sort_key_portion: str,
+        limit: int = 50,
+        exclusive_start_key: Optional[dict] = None,
+        projection: Optional[list[str]] = None,
+    ) -> tuple[list[dict], Optional[dict]]:
+        """
+        Method to run a single-page query against DynamoDB with partition key and
+        the sort key with <begins-with> functionality on it.
+        :param partition_key (str): partition key value.
+        :param sort_key_portion (str): sort key portion to use in query.
+        :param limit (int): maximum number of items to evaluate in the page.
+        :param exclusive_start_key (Optional(dict)): "LastEvaluatedKey" of the previous page.
+        :param projection (Optional(list[str])): attributes to read (all if None).
+        :returns (tuple): items of the page and its "LastEvaluatedKey" (None for the last page).
+        """
+        pages = self.iter_pages_by_pk_and_sk_begins_with(
+            partition_key=partition_key,
+            sort_key_portion=sort_key_portion,
+            limit=limit,
+            exclusive_start_key=exclusive_start_key,
+            projection=projection,
+        )
+        return next(pages)
+
+    def iter_pages_by_pk_and_sk_begins_with(
+        self,
+        partition_key: str,
+        sort_key_portion: str,
+        limit: int = 50,
+        exclusive_start_key: Optional[dict] = None,
+        projection: Optional[list[str]] = None,
+    ) -> Iterator[tuple[list[dict], Optional[dict]]]:
+        """
+        Generator that lazily runs the paginated query against DynamoDB with
+        partition key and the sort key with <begins-with> functionality on it.
+        Each page is only requested when the consumer asks for it.
         :param partition_key (str): partition key value.
         :param sort_key_portion (str): sort key portion to use in query.
+        :param limit (int): maximum number of items to evaluate per page.
+        :param exclusive_start_key (Optional(dict)): "LastEvaluatedKey" to resume from.
+        :param projection (Optional(list[str])): attributes to read (all if None).
         """
         logger.info(
             f"Starting query_by_pk_and_sk_begins_with with "
             f"pk: ({partition_key}) and sk: ({sort_key_portion})"
         )
 
-        all_items = []
-        try:
-            # The structure key for a single-table-design "PK" and "SK" naming
-            key_condition = Key("PK").eq(partition_key) & Key("SK").begins_with(
-                sort_key_portion
+        # The structure key for a single-table-design "PK" and "SK" naming
+        key_condition = Key("PK").eq(partition_key) & Key("SK").begins_with(
+            sort_key_portion
+        )
+        yield from self._iter_query_pages(
+            KeyConditionExpression=key_condition,
+            Limit=limit,
+            ExclusiveStartKey=exclusive_start_key,
+            **build_projection_params(projection),
+        )
+
+    def iter_pages_by_index(
+        self,
+        index_name: str,
+        partition_key: str,
+        sort_key_condition: Optional[ConditionBase] = None,
+        limit: Optional[int] = None,
+        exclusive_start_key: Optional[dict] = None,
+        scan_index_forward: bool = True,
+        projection: Optional[list[str]] = None,
+    ) -> Iterator[tuple[list[dict], Optional[dict]]]:
+        """
+        Generator that lazily runs the paginated query against a secondary index
+        that shares the "PK" partition key of the table.
+        :param index_name (str): name of the secondary index.
+        :param partition_key (str): partition key value.
+        :param sort_key_condition (Optional(ConditionBase)): condition on the sort
+            key of the index (e.g. <Key("updated_at").gt(value)>).
+        :param limit (Optional(int)): maximum number of items to evaluate per page.
+        :param exclusive_start_key (Optional(dict)): "LastEvaluatedKey" to resume from.
+        :param scan_index_forward (bool): ascending (True) or descending (False) order.
+        :param projection (Optional(list[str])): attributes to read (all if None).
+        """
+        logger.info(f"Starting query on index: {index_name} with pk: ({partition_key})")
+
+        key_condition = Key("PK").eq(partition_key)
+        if sort_key_condition is not None:
+            key_condition = key_condition & sort_key_condition
+        yield from self._iter_query_pages(
+            IndexName=index_name,
+            KeyConditionExpression=key_condition,
+            Limit=limit,
+            ExclusiveStartKey=exclusive_start_key,
+            ScanIndexForward=scan_index_forward,
+            **build_projection_params(projection),
+        )
+
+    def _iter_query_pages(
+        self, **query_kwargs
+    ) -> Iterator[tuple[list[dict], Optional[dict]]]:
+        """
+        Generator that runs a DynamoDB query page by page, yielding the items and
+        the "LastEvaluatedKey" of each page.
+        :param query_kwargs: Keyword arguments for the <Table.query> operation.
+        """
+        query_kwargs = {
+            key: value for key, value in query_kwargs.items() if value is not None
+        }
+        query_kwargs["ReturnConsumedCapacity"] = RETURN_CONSUMED_CAPACITY
+        while True:
+            try:
+                with timed("dynamodb"):
+                    response = self.table.query(**query_kwargs)
+            except ClientError as error:
+                logger.error(
+                    f"query operation failed for: "
+                    f"table_name: {self.table_name}."
+                    f"query_kwargs: {query_kwargs}."
+                    f"error: {error}."
+                )
+                raise error
+
+            items = response.get("Items", [])
+            record_consumed_capacity("query", response, items=len(items), page=True)
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            yield items, last_evaluated_key
+
+            if not last_evaluated_key:
+                return
+            query_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+    @staticmethod
+    def is_conditional_check_failed(error: ClientError) -> bool:
+        """
+        Method to identify if a ClientError was caused by a failed "ConditionExpression".
+        :param error (ClientError): Error raised by a DynamoDB operation.
+        """
+        return (
+            error.response.get("Error", {}).get("Code")
+            == "ConditionalCheckFailedException"
+        )
+
+    def batch_get_items(
+        self,
+        keys: list[dict],
+        projection: Optional[list[str]] = None,
+        max_attempts: int = 5,
+    ) -> list[Optional[dict]]:
+        """
+        Method to get multiple DynamoDB items by their primary keys (pk+sk) with
+        <BatchGetItem>. Requests are split in chunks and the "UnprocessedKeys" are
+        retried with jittered exponential backoff.
+        :param keys (list[dict]): Primary keys as {"PK": ..., "SK": ...} dicts.
+        :param projection (Optional(list[str])): attributes to read (all if None).
+        :param max_attempts (int): maximum attempts for each chunk.
+        :returns (list): items in the same order as the input keys (None if not found).
+        """
+        logger.info(f"Starting batch_get_items with {len(keys)} keys.")
+
+        # Duplicated keys are not allowed by BatchGetItem
+        unique_keys = list({(key["PK"], key["SK"]): key for key in keys}.values())
+        keys_and_attributes = build_projection_params(
+            ["PK", "SK", *projection] if projection else None
+        )
+
+        found_items = {}
+        for index in range(0, len(unique_keys), BATCH_GET_CHUNK_SIZE):
+            request_items = {
+                self.table_name: {
+                    "Keys": unique_keys[index : index + BATCH_GET_CHUNK_SIZE],
+                    **keys_and_attributes,
+                }
+            }
+            for attempt in range(max_attempts):
+                try:
+                    with timed("dynamodb"):
+                        response = self.dynamodb_resource.batch_get_item(
+                            RequestItems=request_items,
+                            ReturnConsumedCapacity=RETURN_CONSUMED_CAPACITY,
+                        )
+                except ClientError as error:
+                    logger.error(
+                        f"batch_get_item operation failed for: "
+                        f"table_name: {self.table_name}."
+                        f"error: {error}."
+                    )
+                    raise error
+
+                items = response.get("Responses", {}).get(self.table_name, [])
+                record_consumed_capacity("batch_get_items", response, items=len(items))
+                for item in items:
+                    found_items[(item["PK"], item["SK"])] = item
+
+                request_items = response.get("UnprocessedKeys")
+                if not request_items:
+                    break
+                if attempt + 1 == max_attempts:
+                    unprocessed_keys = request_items[self.table_name]["Keys"]
+                    logger.error(
+                        f"batch_get_item operation failed for: "
+                        f"table_name: {self.table_name}. "
+                        f"unprocessed_keys: {unprocessed_keys}."
+                    )
+                    raise UnprocessedKeysError(
+                        self.table_name, unprocessed_keys, max_attempts
+                    )
+                logger.warning(
+                    f"batch_get_item returned unprocessed keys (attempt {attempt + 1})"
+                )
+                self._sleep_with_backoff(attempt)
+
+        return [found_items.get((key["PK"], key["SK"])) for key in keys]
+
+    def batch_write_items(
+        self,
+        items: list[dict],
+        max_workers: int = BATCH_WRITE_MAX_WORKERS,
+        max_attempts: int = 5,
+    ) -> list[Optional[str]]:
+        """
+        Method to add multiple DynamoDB items with <BatchWriteItem>. Items are
+        grouped in chunks of 25 that are written in parallel from a bounded
+        thread pool, and the "UnprocessedItems" are retried with jittered
+        exponential backoff.
+        :param items (list[dict]): Items to be added in the format of name/value pairs.
+        :param max_workers (int): maximum number of chunks written concurrently.
+        :param max_attempts (int): maximum attempts for each chunk.
+        :returns (list): error message for each input item (None if it was written).
+        """
+        logger.info(f"Starting batch_write_items with {len(items)} items.")
+
+        chunks = [
+            list(range(index, min(index + BATCH_WRITE_CHUNK_SIZE, len(items))))
+            for index in range(0, len(items), BATCH_WRITE_CHUNK_SIZE)
+        ]
+        errors = [None] * len(items)
+        if not chunks:
+            return errors
+
+        # The low-level client is thread-safe, so it is shared by the workers
+        # (the parallel chunks are measured once, as the wall time of the batch).
+        # Each worker runs in a copy of the context (e.g. the access pattern)
+        contexts = [contextvars.copy_context() for _ in chunks]
+        with timed("dynamodb"), ThreadPoolExecutor(
+            max_workers=min(max_workers, len(chunks))
+        ) as executor:
+            for chunk_errors in executor.map(
+                lambda chunk, context: context.run(
+                    self._write_chunk, items, chunk, max_attempts
+                ),
+                chunks,
+                contexts,
+            ):
+                for index, error in chunk_errors.items():
+                    errors[index] = error
+
+        logger.info(
+            f"Finished batch_write_items with {errors.count(None)} items written."
+        )
+        return errors
+
+    def _write_chunk(
+        self, items: list[dict], chunk: list[int], max_attempts: int
+    ) -> dict[int, str]:
+        """
+        Write a single chunk of items, retrying the "UnprocessedItems".
+        :param items (list[dict]): All the items of the batch.
+        :param chunk (list[int]): Indexes of the items that belong to the chunk.
+        :param max_attempts (int): maximum attempts for the chunk.
+        :returns (dict): error message by index of the items that were not written.
+        """
+
+        def item_key(item: dict) -> tuple:
+            return (item["PK"]["S"], item["SK"]["S"])
+
+        pending = chunk
+        put_requests = [{"PutRequest": {"Item": items[index]}} for index in chunk]
+        for attempt in range(max_attempts):
+            try:
+                response = self.dynamodb_client.batch_write_item(
+                    RequestItems={self.table_name: put_requests},
+                    ReturnConsumedCapacity=RETURN_CONSUMED_CAPACITY,
+                )
+            except ClientError as error:
+                logger.error(
+                    f"batch_write_item operation failed for: "
+                    f"table_name: {self.table_name}."
+                    f"error: {error}."
+                )
+                return {index: str(error) for index in pending}
+
+            requested_count = len(put_requests)
+            put_requests = response.get("UnprocessedItems", {}).get(self.table_name)
+            record_consumed_capacity(
+                "batch_write_items",
+                response,
+                items=requested_count - len(put_requests or []),
+                write=True,
             )
-            limit = 50
+            if not put_requests:
+                return {}
 
-            # Initial query before pagination
-            response = self.table.query(
-                KeyConditionExpression=key_condition,
-                Limit=limit,
+            unprocessed_keys = {
+                item_key(request["PutRequest"]["Item"]) for request in put_requests
+            }
+            pending = [
+                index for index in pending if item_key(items[index]) in unprocessed_keys
+            ]
+            logger.warning(
+                f"batch_write_item returned {len(pending)} unprocessed items "
+                f"(attempt {attempt + 1})"
             )
-            if "Items" in response:
-                all_items.extend(response["Items"])
-
-            # Pagination loop for possible following queries
-            while "LastEvaluatedKey" in response:
-                response = self.table.query(
-                    KeyConditionExpression=key_condition,
-                    Limit=limit,
-                    ExclusiveStartKey=response["LastEvaluatedKey"],
-                )
-                if "Items" in response:
-                    all_items.extend(response["Items"])
+            if attempt + 1 < max_attempts:
+                self._sleep_with_backoff(attempt)
 
-            return all_items
-        except ClientError as error:
-            logger.error(
-                f"query operation failed for: "
-                f"table_name: {self.table_name}."
-                f"pk: {partition_key}."
-                f"sort_key_portion: {sort_key_portion}."
-                f"error: {error}."
+        return {
+            index: f"Item not processed after {max_attempts} attempts"
+            for index in pending
+        }
+
+    @staticmethod
+    def _sleep_with_backoff(attempt: int) -> None:
+        """
+        Sleep with exponential backoff and "full jitter" before retrying.
+        :param attempt (int): zero-based number of the failed attempt.
+        """
+        time.sleep(
+            random.uniform(
+                0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
             )
-            raise error
+        )
 
     def put_item(self, data: dict) -> dict:
         """
@@ -119,10 +479,13 @@ class DynamoDBHelper:
         logger.debug(f"data: {data}")
 
         try:
-            response = self.dynamodb_client.put_item(
-                TableName=self.table_name,
-                Item=data,
-            )
+            with timed("dynamodb"):
+                response = self.dynamodb_client.put_item(
+                    TableName=self.table_name,
+                    Item=data,
+                    ReturnConsumedCapacity=RETURN_CONSUMED_CAPACITY,
+                )
+            record_consumed_capacity("put_item", response, items=1, write=True)
             logger.info(response)
             return response
         except ClientError as error:
@@ -135,18 +498,33 @@ class DynamoDBHelper:
             raise error
 
     def update_item(
-        self, partition_key: str, sort_key: str, data_attributes_only: dict
+        self,
+        partition_key: str,
+        sort_key: str,
+        data_attributes_only: Optional[dict] = None,
+        increments: Optional[dict] = None,
+        appends: Optional[dict] = None,
+        must_exist: bool = False,
+        condition: Optional[ConditionBase] = None,
+        return_values: str = "NONE",
     ) -> dict:
         """
-        Method to update an existing item in a "patch" fashion (only deltas).
+        Method to update an existing item in a "patch" fashion (only deltas) with
+        a single <UpdateItem> call.
         :param partition_key (str): partition key value.
         :param sort_key (str): sort key value.
-        :param data_attributes_only (dict): Item's data attributes to be updated in the format of name/value pairs.
+        :param data_attributes_only (Optional(dict)): Item's data attributes to be updated in the format of name/value pairs (None values are removed).
+        :param increments (Optional(dict)): Numeric deltas for atomic counters (ADD).
+        :param appends (Optional(dict)): Lists to append to list attributes (list_append).
+        :param must_exist (bool): Only update if the item exists (conditional write).
+        :param condition (Optional(ConditionBase)): Additional condition for the write (e.g. Attr("version").eq(3)).
+        :param return_values (str): DynamoDB "ReturnValues" option (e.g. "ALL_NEW").
         """
 
         logger.info("Starting update_item operation.")
         logger.debug(
-            f"pk: {partition_key}, sk: {sort_key} data: {data_attributes_only}"
+            f"pk: {partition_key}, sk: {sort_key} data: {data_attributes_only}, "
+            f"increments: {increments}, appends: {appends}"
         )
 
         try:
@@ -154,17 +532,25 @@ class DynamoDBHelper:
                 "PK": partition_key,
                 "SK": sort_key,
             }
-            a, v = self._get_update_params(data_attributes_only)
-            response = self.table.update_item(
-                Key=primary_key_dict,
-                UpdateExpression=a,
-                ExpressionAttributeValues=dict(v),
+            update_params = build_update_params(
+                set_attributes=data_attributes_only,
+                add_attributes=increments,
+                append_attributes=appends,
             )
+            with timed("dynamodb"):
+                response = self.table.update_item(
+                    Key=primary_key_dict,
+                    ReturnValues=return_values,
+                    ReturnConsumedCapacity=RETURN_CONSUMED_CAPACITY,
+                    **update_params,
+                    **self._get_condition_params(must_exist, condition),
+                )
+            record_consumed_capacity("update_item", response, items=1, write=True)
             logger.info(response)
             return response
         except ClientError as error:
             logger.error(
-                f"put_item operation failed for: "
+                f"update_item operation failed for: "
                 f"table_name: {self.table_name}."
                 f"pk: {partition_key}."
                 f"sk: {sort_key}."
@@ -173,27 +559,36 @@ class DynamoDBHelper:
             )
             raise error
 
-    def _get_update_params(self, payload: dict):
+    def _get_condition_params(
+        self, must_exist: bool, condition: Optional[ConditionBase] = None
+    ) -> dict:
         """
-        Given a dictionary we generate an update expression and a dict of values
-        to update a dynamodb table.
+        Generate the optional "ConditionExpression" for conditional writes, so
+        that the existence check happens in the same round trip as the write.
 
-        :payload (dict): Parameters to use for formatting.
+        :must_exist (bool): Require the item to exist before the write.
+        :condition (Optional(ConditionBase)): Additional condition for the write.
         """
-        update_expression = ["set "]
-        update_values = dict()
-
-        for key, val in payload.items():
-            update_expression.append(f" {key} = :{key},")
-            update_values[f":{key}"] = val
-
-        return "".join(update_expression)[:-1], update_values
+        if must_exist:
+            existence = Attr("PK").exists()
+            condition = existence & condition if condition else existence
+        if condition:
+            return {"ConditionExpression": condition}
+        return {}
 
-    def delete_item(self, partition_key: str, sort_key: str) -> dict:
+    def delete_item(
+        self,
+        partition_key: str,
+        sort_key: str,
+        must_exist: bool = False,
+        return_values: str = "NONE",
+    ) -> dict:
         """
         Method to delete an existing item in DynamoDB
         :param partition_key (str): partition key value.
         :param sort_key (str): sort key value.
+        :param must_exist (bool): Only delete if the item exists (conditional write).
+        :param return_values (str): DynamoDB "ReturnValues" option (e.g. "ALL_OLD").
         """
 
         logger.info("Starting delete_item operation.")
@@ -204,7 +599,14 @@ class DynamoDBHelper:
                 "PK": partition_key,
                 "SK": sort_key,
             }
-            response = self.table.delete_item(Key=primary_key_dict)
+            with timed("dynamodb"):
+                response = self.table.delete_item(
+                    Key=primary_key_dict,
+                    ReturnValues=return_values,
+                    ReturnConsumedCapacity=RETURN_CONSUMED_CAPACITY,
+                    **self._get_condition_params(must_exist),
+                )
+            record_consumed_capacity("delete_item", response, items=1, write=True)
             logger.info(response)
             return response
         except ClientError as error:
@@ -0,0 +1,52 @@
+# Built-in imports
+import hashlib
+from typing import Optional
+
+# Clients can keep the responses with an ETag, but must revalidate them
+ETAG_CACHE_CONTROL = "private, no-cache"
+
+
+def build_etag(*parts) -> str:
+    """
+    Build a strong ETag (quoted opaque string) from the parts that identify a
+    representation (e.g. key, version and query parameters).
+    :param parts: Values that change whenever the representation changes.
+    """
+    raw_value = "\x1f".join("" if part is None else str(part) for part in parts)
+    return f'"{hashlib.sha256(raw_value.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluate an "If-None-Match" header against the current ETag (weak comparison,
+    as required for "If-None-Match").
+    :param if_none_match (Optional(str)): Value of the "If-None-Match" header.
+    :param etag (str): Current ETag of the representation.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def opaque_tag(value: str) -> str:
+        value = value.strip()
+        return value[2:] if value.startswith("W/") else value
+
+    return opaque_tag(etag) in {opaque_tag(value) for value in if_none_match.split(",")}
+
+
+def build_content_etag(content: bytes) -> str:
+    """
+    Build a strong ETag from the exact bytes of a representation.
+    :param content (bytes): Body of the response.
+    """
+    return f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+def use_cache(cache_control: Optional[str]) -> bool:
+    """
+    Check if a read can be served from the cache ("Cache-Control: no-cache"
+    forces the read from DynamoDB).
+    :param cache_control (Optional(str)): Value of the "Cache-Control" header.
+    """
+    return not (cache_control and "no-cache" in cache_control.lower())
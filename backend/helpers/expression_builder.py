@@ -0,0 +1,104 @@
+# Built-in imports
+from decimal import Decimal
+from numbers import Number
+from typing import Optional
+
+
+def build_update_params(
+    set_attributes: Optional[dict] = None,
+    add_attributes: Optional[dict] = None,
+    append_attributes: Optional[dict] = None,
+) -> dict:
+    """
+    Generate the parameters of a single DynamoDB <UpdateItem> call. All attribute
+    names go through "ExpressionAttributeNames" placeholders, so reserved words
+    (e.g. "name", "date", "status") are safe to use.
+
+    :param set_attributes (Optional(dict)): Attributes to SET. Explicit None values
+        are translated to REMOVE actions.
+    :param add_attributes (Optional(dict)): Numeric deltas for atomic ADD counters.
+    :param append_attributes (Optional(dict)): Lists to append to existing list
+        attributes with <list_append> (the attribute is created if missing).
+    :returns (dict): "UpdateExpression", "ExpressionAttributeNames" and
+        "ExpressionAttributeValues" (only when values are needed).
+    """
+    set_actions, remove_actions, add_actions = [], [], []
+    attribute_names, attribute_values = {}, {}
+
+    def name_placeholder(attribute_name: str) -> str:
+        placeholder = f"#attr{len(attribute_names)}"
+        attribute_names[placeholder] = attribute_name
+        return placeholder
+
+    def value_placeholder(value) -> str:
+        placeholder = f":val{len(attribute_values)}"
+        attribute_values[placeholder] = value
+        return placeholder
+
+    for attribute_name, value in (set_attributes or {}).items():
+        if value is None:
+            remove_actions.append(name_placeholder(attribute_name))
+        else:
+            set_actions.append(
+                f"{name_placeholder(attribute_name)} = {value_placeholder(value)}"
+            )
+
+    for attribute_name, values in (append_attributes or {}).items():
+        if not isinstance(values, list):
+            raise ValueError(f"Values to append to <{attribute_name}> must be a list")
+        name = name_placeholder(attribute_name)
+        set_actions.append(
+            f"{name} = list_append(if_not_exists({name}, {value_placeholder([])}), "
+            f"{value_placeholder(values)})"
+        )
+
+    for attribute_name, delta in (add_attributes or {}).items():
+        if isinstance(delta, bool) or not isinstance(delta, Number):
+            raise ValueError(f"Delta for <{attribute_name}> must be numeric")
+        if isinstance(delta, float):
+            delta = Decimal(str(delta))  # boto3 only accepts Decimal for non-integers
+        add_actions.append(
+            f"{name_placeholder(attribute_name)} {value_placeholder(delta)}"
+        )
+
+    update_clauses = [
+        f"{action} {', '.join(expressions)}"
+        for action, expressions in (
+            ("SET", set_actions),
+            ("REMOVE", remove_actions),
+            ("ADD", add_actions),
+        )
+        if expressions
+    ]
+    if not update_clauses:
+        raise ValueError("At least one attribute is required to build an update")
+
+    update_params = {
+        "UpdateExpression": " ".join(update_clauses),
+        "ExpressionAttributeNames": attribute_names,
+    }
+    if attribute_values:
+        update_params["ExpressionAttributeValues"] = attribute_values
+    return update_params
+
+
+def build_projection_params(attributes: Optional[list[str]] = None) -> dict:
+    """
+    Generate the "ProjectionExpression" parameters to read only a subset of the
+    attributes of the items (all names go through placeholders).
+
+    :param attributes (Optional(list[str])): Attribute names to read (all if empty).
+    :returns (dict): "ProjectionExpression" and "ExpressionAttributeNames" (or an
+        empty dict when all the attributes are requested).
+    """
+    if not attributes:
+        return {}
+
+    attribute_names = {
+        f"#proj{index}": attribute_name
+        for index, attribute_name in enumerate(dict.fromkeys(attributes))
+    }
+    return {
+        "ProjectionExpression": ", ".join(attribute_names),
+        "ExpressionAttributeNames": attribute_names,
+    }
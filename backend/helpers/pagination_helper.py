@@ -0,0 +1,43 @@
+# Built-in imports
+import base64
+import binascii
+import json
+from typing import Optional
+
+
+def encode_next_token(last_evaluated_key: Optional[dict]) -> Optional[str]:
+    """
+    Encode a DynamoDB "LastEvaluatedKey" as an opaque URL-safe token.
+    :param last_evaluated_key (Optional(dict)): "LastEvaluatedKey" from a query page.
+    """
+    if not last_evaluated_key:
+        return None
+
+    raw_token = json.dumps(last_evaluated_key, separators=(",", ":"))
+    next_token = base64.urlsafe_b64encode(raw_token.encode("utf-8")).decode("utf-8")
+    return next_token.rstrip("=")  # Padding is restored when decoding
+
+
+def decode_next_token(next_token: Optional[str]) -> Optional[dict]:
+    """
+    Decode an opaque token (from <encode_next_token>) back to an "ExclusiveStartKey".
+    :param next_token (Optional(str)): Token received from the client.
+    :raises ValueError: When the token is malformed.
+    """
+    if not next_token:
+        return None
+
+    try:
+        padding = "=" * (-len(next_token) % 4)
+        raw_token = base64.urlsafe_b64decode(next_token + padding).decode("utf-8")
+        exclusive_start_key = json.loads(raw_token)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise ValueError(f"Invalid next_token: {next_token}") from error
+
+    if not isinstance(exclusive_start_key, dict) or not all(
+        isinstance(key, str) and isinstance(value, str)
+        for key, value in exclusive_start_key.items()
+    ):
+        raise ValueError(f"Invalid next_token: {next_token}")
+
+    return exclusive_start_key
@@ -0,0 +1,120 @@
+# Built-in imports
+from typing import Any, Iterator, Optional
+
+# External imports
+from botocore.exceptions import ClientError
+
+# Own imports
+from common.logger import custom_logger
+from helpers.aws_clients import get_client
+
+logger = custom_logger()
+
+# Size of each ranged GET when streaming objects (memory stays bounded by it)
+RANGE_CHUNK_SIZE = 1024 * 1024
+
+
+class S3Helper:
+    """Custom S3 Helper for simplifying the operations on the bucket objects."""
+
+    def __init__(self, bucket_name: str, endpoint_url: Optional[str] = None) -> None:
+        """
+        :param bucket_name (str): Name of the S3 bucket to connect with.
+        :param endpoint_url (Optional(str)): Endpoint for S3 (only for local tests).
+        """
+        self.bucket_name = bucket_name
+        self.endpoint_url = endpoint_url
+
+    @property
+    def s3_client(self) -> Any:
+        """S3 client (shared, created on first use)."""
+        return get_client("s3", endpoint_url=self.endpoint_url)
+
+    def generate_presigned_put_url(
+        self, key: str, expires_in: int = 900, content_type: Optional[str] = None
+    ) -> str:
+        """
+        Method to generate a presigned URL to upload an object with a PUT request.
+        :param key (str): Key of the object to upload.
+        :param expires_in (int): Seconds that the URL is valid for.
+        :param content_type (Optional(str)): Content-Type that the upload must use.
+        """
+        params = {"Bucket": self.bucket_name, "Key": key}
+        if content_type:
+            params["ContentType"] = content_type
+
+        return self.s3_client.generate_presigned_url(
+            "put_object", Params=params, ExpiresIn=expires_in
+        )
+
+    def get_object_size(self, key: str) -> int:
+        """
+        Method to get the size in bytes of an object (without downloading it).
+        :param key (str): Key of the object.
+        """
+        try:
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as error:
+            logger.error(
+                f"head_object operation failed for: "
+                f"bucket_name: {self.bucket_name}."
+                f"key: {key}."
+                f"error: {error}."
+            )
+            raise error
+
+        return response["ContentLength"]
+
+    def get_object_range(self, key: str, start: int, end: int) -> bytes:
+        """
+        Method to read a range of bytes of an object with a ranged GET.
+        :param key (str): Key of the object.
+        :param start (int): First byte of the range.
+        :param end (int): Last byte of the range (inclusive).
+        """
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name, Key=key, Range=f"bytes={start}-{end}"
+            )
+        except ClientError as error:
+            logger.error(
+                f"get_object operation failed for: "
+                f"bucket_name: {self.bucket_name}."
+                f"key: {key}."
+                f"range: {start}-{end}."
+                f"error: {error}."
+            )
+            raise error
+
+        return response["Body"].read()
+
+    def iter_lines(
+        self, key: str, start_offset: int = 0, chunk_size: int = RANGE_CHUNK_SIZE
+    ) -> Iterator[tuple[bytes, int]]:
+        """
+        Generator to stream the lines of an object with ranged GETs, so the object
+        is never loaded whole in memory.
+        :param key (str): Key of the object.
+        :param start_offset (int): Byte offset to start reading from (must be the
+            beginning of a line, e.g. an offset yielded by a previous run).
+        :param chunk_size (int): Size in bytes of each ranged GET.
+        :returns (Iterator): each line (without the line break) and the byte offset
+            where the next line starts.
+        """
+        object_size = self.get_object_size(key)
+        offset = start_offset
+        remainder = b""
+
+        while offset < object_size:
+            end = min(offset + chunk_size, object_size) - 1
+            data = remainder + self.get_object_range(key, offset, end)
+            line_offset = end + 1 - len(data)
+            offset = end + 1
+
+            *lines, remainder = data.split(b"\n")
+            for line in lines:
+                line_offset += len(line) + 1
+                yield line.rstrip(b"\r"), line_offset
+
+        if remainder:
+            yield remainder.rstrip(b"\r"), object_size
@@ -0,0 +1,290 @@
+################################################################################
+# Lambda Function that imports the RECIPE files uploaded to the S3 bucket
+################################################################################
+
+# Built-in imports
+import csv
+import json
+from typing import Callable, Optional
+from urllib.parse import unquote_plus
+
+# External imports
+from aws_lambda_powertools.utilities.typing import LambdaContext
+from aws_lambda_powertools.utilities.data_classes import S3Event, event_source
+from aws_lambda_powertools.utilities.data_classes.s3_event import S3EventRecord
+
+# Own imports
+from access_patterns.recipe_imports import (
+    RecipeImports,
+    build_imported_recipe_id,
+    parse_import_key,
+    s3_helper,
+)
+from access_patterns.recipes import Recipes
+from api.v1.services.validator import validate_payload
+from common.capacity import log_capacity_metrics
+from common.enums import ImportFileFormat, ImportStatus, JSONSchemaType
+from common.logger import custom_logger
+from common.runtime_hooks import before_snapshot
+from helpers.aws_clients import get_client
+
+logger = custom_logger()
+
+# Rows validated and written per batch (a checkpoint is saved after each batch)
+IMPORT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+
+# Remaining time that triggers a checkpoint and a new (chained) invocation
+MIN_REMAINING_TIME_MS = 60 * 1000
+
+
+class RecipesImporter:
+    """Class to import the rows of an uploaded file as RECIPE items."""
+
+    def __init__(
+        self,
+        user_email: str,
+        import_id: str,
+        file_format: ImportFileFormat,
+        key: str,
+    ) -> None:
+        """
+        :param user_email (str): User email that owns the import.
+        :param import_id (str): ULID of the import.
+        :param file_format (ImportFileFormat): Format of the file.
+        :param key (str): S3 key of the file to import.
+        """
+        self.user_email = user_email
+        self.import_id = import_id
+        self.file_format = file_format
+        self.key = key
+        self.recipes = Recipes(user_email=user_email, logger=logger)
+        self.recipe_imports = RecipeImports(user_email=user_email, logger=logger)
+
+        # Progress of the import (restored from the checkpoint when resuming)
+        self.header = None
+        self.rows_imported = 0
+        self.rows_failed = 0
+        self.errors = []
+
+    def run(self, should_stop: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        Stream the file with ranged reads and import its rows in batches, saving a
+        checkpoint after each batch.
+        :param should_stop (Optional(Callable)): Checked after each batch, to stop
+            the import before the Lambda Function times out.
+        :returns (bool): True if the import was completed.
+        """
+        checkpoint = self.recipe_imports.get_checkpoint(self.import_id)
+        if checkpoint.get("import_status") == ImportStatus.COMPLETED.value:
+            logger.info(f"Import {self.import_id} already completed, skipping it")
+            return True
+
+        next_offset = int(checkpoint.get("next_offset", 0))
+        self.header = checkpoint.get("header")
+        self.rows_imported = int(checkpoint.get("rows_imported", 0))
+        self.rows_failed = int(checkpoint.get("rows_failed", 0))
+        self.errors = checkpoint.get("errors", [])
+        logger.info(f"Starting import {self.import_id} from offset: {next_offset}")
+
+        rows = []
+        row_offset = next_offset
+        for line, next_offset in s3_helper.iter_lines(self.key, next_offset):
+            if self.file_format == ImportFileFormat.CSV and self.header is None:
+                self.header = [name.strip() for name in self.parse_csv_values(line)]
+            elif line.strip():
+                rows.append((row_offset, line))
+            row_offset = next_offset
+
+            if len(rows) >= IMPORT_BATCH_SIZE:
+                self.import_rows(rows)
+                rows = []
+                self.save_checkpoint(ImportStatus.IN_PROGRESS, next_offset)
+                if should_stop and should_stop():
+                    logger.info(f"Stopping import {self.import_id} at: {next_offset}")
+                    return False
+
+        self.import_rows(rows)
+        self.save_checkpoint(ImportStatus.COMPLETED, row_offset)
+        logger.info(
+            f"Finished import {self.import_id} with {self.rows_imported} RECIPE "
+            f"items imported and {self.rows_failed} rows failed"
+        )
+        return True
+
+    def import_rows(self, rows: list[tuple[int, bytes]]) -> None:
+        """
+        Validate a batch of rows and create the valid ones as RECIPE items (the
+        chunks of the batch are written concurrently).
+        :param rows (list[tuple[int, bytes]]): Byte offset and content of each row.
+        """
+        valid_offsets, valid_recipes = [], []
+        for row_offset, line in rows:
+            try:
+                recipe_data = self.parse_row(line)
+            except ValueError as error:
+                self.add_error(row_offset, str(error))
+                continue
+
+            # The owner of the RECIPE items is always the owner of the import
+            recipe_data["user_email"] = self.user_email
+            validation_result = validate_payload(
+                data=recipe_data,
+                json_schema_type=JSONSchemaType.RECIPES,
+                logger=logger,
+            )
+            if isinstance(validation_result, Exception):
+                self.add_error(
+                    row_offset,
+                    getattr(validation_result, "message", str(validation_result)),
+                )
+                continue
+
+            valid_offsets.append(row_offset)
+            valid_recipes.append(recipe_data)
+
+        if not valid_recipes:
+            return
+
+        # The ULIDs come from the rows, so a replayed batch (e.g. a crash before
+        # its checkpoint was saved) overwrites its RECIPE items
+        results = self.recipes.create_recipes(
+            valid_recipes,
+            validated=True,
+            recipe_ids=[
+                build_imported_recipe_id(self.import_id, row_offset)
+                for row_offset in valid_offsets
+            ],
+        )
+        for row_offset, result in zip(valid_offsets, results):
+            if result.error:
+                self.add_error(row_offset, result.error)
+            else:
+                self.rows_imported += 1
+
+    def parse_row(self, line: bytes) -> dict:
+        """
+        Parse a single row of the file (CSV rows are mapped with the header).
+        :param line (bytes): Content of the row.
+        :raises ValueError: When the row is malformed.
+        """
+        if self.file_format == ImportFileFormat.JSONL:
+            try:
+                recipe_data = json.loads(self.decode_line(line))
+            except json.JSONDecodeError as error:
+                raise ValueError(f"Row is not valid JSON: {error}") from error
+            if not isinstance(recipe_data, dict):
+                raise ValueError("Row is not a JSON object")
+            return recipe_data
+
+        values = self.parse_csv_values(line)
+        if len(values) != len(self.header):
+            raise ValueError(
+                f"Row has {len(values)} columns but the header has {len(self.header)}"
+            )
+        return {name: value for name, value in zip(self.header, values) if value}
+
+    def parse_csv_values(self, line: bytes) -> list[str]:
+        """
+        Parse the values of a single CSV row (quoted values with line breaks are
+        not supported, as the file is streamed line by line).
+        :param line (bytes): Content of the row.
+        :raises ValueError: When the row is malformed.
+        """
+        try:
+            return next(csv.reader([self.decode_line(line)]))
+        except csv.Error as error:
+            raise ValueError(f"Row is not valid CSV: {error}") from error
+
+    @staticmethod
+    def decode_line(line: bytes) -> str:
+        """
+        Decode a single row of the file (a leading BOM is ignored).
+        :param line (bytes): Content of the row.
+        :raises ValueError: When the row is not valid UTF-8.
+        """
+        try:
+            return line.decode("utf-8-sig")
+        except UnicodeDecodeError as error:
+            raise ValueError("Row is not valid UTF-8") from error
+
+    def add_error(self, row_offset: int, error: str) -> None:
+        """
+        Register a row that could not be imported (only the first errors are kept).
+        :param row_offset (int): Byte offset of the row in the file.
+        :param error (str): Reason why the row was not imported.
+        """
+        self.rows_failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"offset": row_offset, "error": error})
+
+    def save_checkpoint(self, import_status: ImportStatus, next_offset: int) -> None:
+        """
+        Save the progress of the import.
+        :param import_status (ImportStatus): Status of the import.
+        :param next_offset (int): Byte offset of the first unprocessed row.
+        """
+        self.recipe_imports.save_checkpoint(
+            import_id=self.import_id,
+            import_status=import_status,
+            next_offset=next_offset,
+            header=self.header,
+            rows_imported=self.rows_imported,
+            rows_failed=self.rows_failed,
+            errors=self.errors,
+        )
+
+
+@before_snapshot
+def prewarm_lambda_client() -> None:
+    """Create the client of the chained invocations before a SnapStart snapshot."""
+    get_client("lambda")
+
+
+def continue_import(records: list[S3EventRecord], context: LambdaContext) -> None:
+    """
+    Invoke the Lambda Function again (asynchronously) with the records that are
+    not completed yet, so that the import resumes from its last checkpoint.
+    :param records (list[S3EventRecord]): Records from the current one onward.
+    :param context (LambdaContext): Context of the current invocation.
+    """
+    get_client("lambda").invoke(
+        FunctionName=context.invoked_function_arn,
+        InvocationType="Event",
+        Payload=json.dumps({"Records": [record.raw_event for record in records]}),
+    )
+
+
+@logger.inject_lambda_context(log_event=True)
+@log_capacity_metrics
+@event_source(data_class=S3Event)
+def lambda_handler(event: S3Event, context: LambdaContext):
+    logger.info("Starting import of RECIPE files from S3")
+
+    def should_stop() -> bool:
+        return context.get_remaining_time_in_millis() < MIN_REMAINING_TIME_MS
+
+    try:
+        records = list(event.records)
+        for index, record in enumerate(records):
+            # The first record always progresses (at least one batch), so the
+            # chained invocations can not loop without importing anything
+            if index and should_stop():
+                logger.info(f"Chaining the import of {len(records) - index} files")
+                continue_import(records[index:], context)
+                return
+
+            key = unquote_plus(record.s3.get_object.key)
+            user_email, import_id, file_format = parse_import_key(key)
+            logger.append_keys(user_email=user_email, import_id=import_id)
+
+            importer = RecipesImporter(user_email, import_id, file_format, key)
+            if not importer.run(should_stop=should_stop):
+                # The rest of the records are imported by the chained invocation
+                continue_import(records[index:], context)
+                return
+
+        logger.info("Finished import of RECIPE files from S3")
+    except Exception as e:
+        logger.exception(f"Error importing RECIPE files from S3: {e}")
+        raise e
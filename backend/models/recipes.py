@@ -1,8 +1,10 @@
 # Built-in imports
-from typing import Optional, Self
+from decimal import Decimal
+from typing import Any, Optional, Self
 
 # External imports
-from pydantic import BaseModel, Field
+from boto3.dynamodb.types import Binary, TypeSerializer
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class RecipeModel(BaseModel):
@@ -19,34 +21,52 @@ class RecipeModel(BaseModel):
     updated_at: str
 
     def to_dynamodb_dict(self) -> dict:
-        dynamodb_dict = {
-            "PK": {"S": self.PK},
-            "SK": {"S": self.SK},
-            "recipe_title": {"S": self.recipe_title},
-            "recipe_details": {"S": self.recipe_details},
-            "recipe_date": {"S": self.recipe_date},
-            "created_at": {"S": self.created_at},
-            "updated_at": {"S": self.updated_at},
-        }
+        return RecipeCodec.to_dynamodb_item(self)
 
-        # Remove None values from the dictionary
-        dynamodb_dict = {
-            key: value for key, value in dynamodb_dict.items() if value is not None
-        }
+    @classmethod
+    def parse_fields(cls, fields: Optional[str]) -> Optional[list[str]]:
+        """
+        Parse a comma-separated sparse fieldset (e.g. "recipe_title,recipe_date").
+        The "SK" (RECIPE identifier) is always read, but it is only returned when
+        requested (see "get_unrequested_keys").
+        :param fields (Optional(str)): Comma-separated field names (all if empty).
+        :raises ValueError: When a field does not exist in the model.
+        """
+        if not fields:
+            return None
 
-        return dynamodb_dict
+        field_names = [field.strip() for field in fields.split(",") if field.strip()]
+        invalid_fields = [
+            field for field in field_names if field not in cls.model_fields
+        ]
+        if invalid_fields:
+            raise ValueError(
+                f"Invalid fields {invalid_fields}. "
+                f"Allowed ones are: {list(cls.model_fields)}"
+            )
+        return list(dict.fromkeys(["SK", *field_names]))
 
     @classmethod
-    def from_dynamodb_item(cls, dynamodb_item: dict) -> "RecipeModel":
-        return cls(
-            PK=dynamodb_item["PK"]["S"],
-            SK=dynamodb_item["SK"]["S"],
-            recipe_title=dynamodb_item["recipe_title"]["S"],
-            recipe_details=dynamodb_item.get("recipe_details", {}).get("S"),
-            recipe_date=dynamodb_item["recipe_date"]["S"],
-            created_at=dynamodb_item["created_at"]["S"],
-            updated_at=dynamodb_item["updated_at"]["S"],
-        )
+    def get_unrequested_keys(cls, fields: Optional[str]) -> set[str]:
+        """
+        Get the key attributes read with a sparse fieldset (to identify the items)
+        that were not requested, so they are excluded from the responses.
+        :param fields (Optional(str)): Comma-separated field names (all if empty).
+        """
+        if not fields:
+            return set()
+        requested = {field.strip() for field in fields.split(",")}
+        return {key for key in ("PK", "SK") if key not in requested}
+
+    @classmethod
+    def from_dynamodb_item(
+        cls, dynamodb_item: dict, trusted: bool = False
+    ) -> "RecipeModel":
+        """
+        :param dynamodb_item (dict): Item in the DynamoDB low-level format ({"S": ...}).
+        :param trusted (bool): Item read from the table (skip the re-validation).
+        """
+        return RecipeCodec.from_dynamodb_items([dynamodb_item], trusted=trusted)[0]
 
 
 # RECIPE: Instead of a duplicated model for "PATCH" requests, create an abstraction for both
@@ -64,35 +84,185 @@ class RecipeModelUpdates(BaseModel):
     updated_at: Optional[str] = Field(None)
 
     def to_dynamodb_dict(self) -> dict:
-        dynamodb_dict = {
-            "PK": {"S": self.PK},
-            "SK": {"S": self.SK},
-            "recipe_title": {"S": self.recipe_title},
-            "recipe_details": {"S": self.recipe_details},
-            "recipe_date": {"S": self.recipe_date},
-            "created_at": {"S": self.created_at},
-            "updated_at": {"S": self.updated_at},
-        }
+        return RecipeCodec.to_dynamodb_item(self)
 
-        # Remove None values from the dictionary
-        dynamodb_dict = {
-            key: value
-            for key, value in dynamodb_dict.items()
-            if value.get("S") is not None
-        }
+    @classmethod
+    def from_dynamodb_item(cls, dynamodb_item: dict) -> "RecipeModelUpdates":
+        return cls(**deserialize_item(dynamodb_item))
+
+
+class RecipesPageModel(BaseModel):
+    """
+    Class that represents a page of RECIPE items (paginated list responses).
+    Items can be partial when a sparse fieldset was requested.
+    """
+
+    items: list[RecipeModel]
+    next_token: Optional[str] = None
+
+
+class RecipesDeltaModel(BaseModel):
+    """
+    Class that represents the RECIPE items changed since a timestamp (delta sync).
+    When "full_sync_required" is True, the deletions are no longer tracked for
+    that timestamp and "items" contains all the RECIPE items instead.
+    """
+
+    items: list[RecipeModel]
+    deleted: list[str]
+    sync_token: str
+    full_sync_required: bool = False
+
+
+class RecipesBatchGetModel(BaseModel):
+    """
+    Class that represents the result of a batch get of RECIPE items (items keep
+    the order of the requested ULIDs). Items can be partial when a sparse
+    fieldset was requested.
+    """
+
+    items: list[RecipeModel]
+    not_found: list[str]
+
+
+class RecipeBatchCreateResultModel(BaseModel):
+    """
+    Class that represents the status of a single RECIPE item of a batch create.
+    """
+
+    index: int
+    status_code: int
+    recipe_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class RecipesBatchCreateModel(BaseModel):
+    """
+    Class that represents the result of a batch create of RECIPE items (results
+    keep the order of the requested items).
+    """
+
+    created: int
+    failed: int
+    results: list[RecipeBatchCreateResultModel]
+
+
+class RecipesImportModel(BaseModel):
+    """
+    Class that represents a new import of RECIPE items from a file, with the
+    presigned URL that must be used to upload the file.
+    """
+
+    import_id: str
+    file_format: str
+    upload_url: str
+    expires_in: int
+
+
+def deserialize_attribute(attribute_value: dict) -> Any:
+    """
+    Convert a single DynamoDB low-level attribute value (e.g. {"N": "1"}) to its
+    Python value. Numbers are returned as "Decimal" (same as boto3 resources).
+    :param attribute_value (dict): Attribute value in the DynamoDB low-level format.
+    """
+    ((type_descriptor, value),) = attribute_value.items()
+    return _ATTRIBUTE_DESERIALIZERS[type_descriptor](value)
+
+
+def deserialize_item(dynamodb_item: dict) -> dict:
+    """
+    Convert a whole DynamoDB item from the low-level format to Python values.
+    :param dynamodb_item (dict): Item in the DynamoDB low-level format.
+    """
+    return {
+        name: deserialize_attribute(attribute_value)
+        for name, attribute_value in dynamodb_item.items()
+    }
 
-        return dynamodb_dict
+
+def _deserialize_binary(value: Any) -> bytes:
+    return value.value if isinstance(value, Binary) else bytes(value)
+
+
+# Converters per DynamoDB type descriptor (S, N, BOOL, L, M, B, NULL and sets)
+_ATTRIBUTE_DESERIALIZERS = {
+    "S": str,
+    "N": Decimal,
+    "BOOL": bool,
+    "NULL": lambda _: None,
+    "B": _deserialize_binary,
+    "L": lambda values: [deserialize_attribute(value) for value in values],
+    "M": deserialize_item,
+    "SS": set,
+    "NS": lambda values: {Decimal(value) for value in values},
+    "BS": lambda values: {_deserialize_binary(value) for value in values},
+}
+
+
+class RecipeCodec:
+    """
+    Codec for batch conversions between DynamoDB items and RecipeModel instances.
+    Trusted data (read from the table) skips the pydantic re-validation.
+    """
+
+    _list_adapter = TypeAdapter(list[RecipeModel])
+    _serializer = TypeSerializer()
+
+    @classmethod
+    def from_items(cls, items: list[dict], trusted: bool = True) -> list[RecipeModel]:
+        """
+        Convert a page of items already in Python format (boto3 resources) to models.
+        :param items (list[dict]): Items from a DynamoDB resource operation.
+        :param trusted (bool): Items read from the table (skip the re-validation).
+        """
+        if trusted:
+            return [RecipeModel.model_construct(**item) for item in items]
+        return cls._list_adapter.validate_python(items)
+
+    @classmethod
+    def from_dynamodb_items(
+        cls, dynamodb_items: list[dict], trusted: bool = True
+    ) -> list[RecipeModel]:
+        """
+        Convert a page of items in the DynamoDB low-level format to models.
+        :param dynamodb_items (list[dict]): Items from a DynamoDB client operation.
+        :param trusted (bool): Items read from the table (skip the re-validation).
+        """
+        return cls.from_items(
+            [deserialize_item(dynamodb_item) for dynamodb_item in dynamodb_items],
+            trusted=trusted,
+        )
+
+    @classmethod
+    def to_dynamodb_item(cls, recipe: BaseModel) -> dict:
+        """
+        Convert a model to the DynamoDB low-level format (None values are skipped).
+        :param recipe (BaseModel): RECIPE model to convert.
+        """
+        return {
+            name: cls._serializer.serialize(value)
+            for name, value in recipe.__dict__.items()
+            if value is not None
+        }
 
     @classmethod
-    def from_dynamodb_item(cls, dynamodb_item: dict) -> "RecipeModel":
-        return cls(
-            PK=dynamodb_item["PK"]["S"],
-            SK=dynamodb_item["SK"]["S"],
-            recipe_title=dynamodb_item.get("recipe_title", {}).get("S"),
-            recipe_details=dynamodb_item.get("recipe_details", {}).get("S"),
-            recipe_date=dynamodb_item.get("recipe_date", {}).get("S"),
-            created_at=dynamodb_item.get("created_at", {}).get("S"),
-            updated_at=dynamodb_item.get("updated_at", {}).get("S"),
+    def dump_json(
+        cls,
+        recipes: list[RecipeModel],
+        partial: bool = False,
+        exclude: Optional[set[str]] = None,
+    ) -> bytes:
+        """
+        Serialize a list of models to JSON in a single pass (pydantic-core).
+        :param recipes (list[RecipeModel]): RECIPE models to serialize.
+        :param partial (bool): Only serialize the fields present in each item
+            (sparse fieldsets from a "ProjectionExpression").
+        :param exclude (Optional(set[str])): Fields to exclude from each item.
+        """
+        return cls._list_adapter.dump_json(
+            recipes,
+            exclude_unset=partial,
+            exclude={"__all__": exclude} if exclude else None,
         )
 
 
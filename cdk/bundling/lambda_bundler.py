@@ -0,0 +1,402 @@
+################################################################################
+# Per-function bundles for the Lambda Functions. Instead of the whole source
+# tree plus a shared layer with all the requirements, each bundle only contains:
+#  - The source modules of the handler's import closure (found with the
+#    "modulefinder" bytecode scan, so the lazy imports in functions are included).
+#  - The distributions (wheels) of the requirements that the closure imports.
+# The modules of the Lambda runtime (boto3) and the PowerTools layer are not
+# bundled. The synth fails when a module of the closure is not found (nor in the
+# standard library or the provided modules). The bundles are only built again
+# when their inputs change, and the import time of the handler can be measured
+# (in a fresh interpreter, with only the bundle and the provided modules).
+################################################################################
+
+# Built-in imports
+import compileall
+import hashlib
+import importlib.machinery
+import importlib.metadata
+import importlib.util
+import json
+import modulefinder
+import os
+import py_compile
+import shutil
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from typing import Iterable, Optional
+
+# Modules provided by the Lambda runtime and the PowerTools layer (not bundled)
+PROVIDED_MODULES = (
+    "boto3",
+    "botocore",
+    "s3transfer",
+    "jmespath",
+    "dateutil",
+    "six",
+    "urllib3",
+    "aws_lambda_powertools",
+    "typing_extensions",
+    "snapshot_restore_py",
+)
+
+# Python version of the Lambda runtime (".pyc" files are only valid for it)
+RUNTIME_PYTHON_VERSION = (3, 11)
+
+MEASURE_IMPORT_TIMEOUT_SECONDS = 120
+
+# Code that runs in the fresh interpreter to measure the import of the handler
+MEASURE_IMPORT = """
+import importlib, sys, time
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+class BundleError(Exception):
+    """The bundle of a Lambda Function is missing modules or fails to import."""
+
+
+@dataclass
+class LambdaBundle:
+    """Deployment bundle of a Lambda Function."""
+
+    name: str
+    path: str
+    modules: list[str]
+    distributions: list[str]
+    size_bytes: int
+    precompiled: bool = False
+    import_ms: Optional[float] = None
+    import_error: Optional[str] = None
+    fingerprint: Optional[str] = None
+    rebuilt: bool = True
+
+    def summary(self) -> str:
+        """One-line report of the bundle (printed at synth time)."""
+        if self.import_ms is not None:
+            import_time = f"import {self.import_ms:.0f} ms"
+        elif self.import_error is not None:
+            import_time = f"import failed ({self.import_error})"
+        else:
+            import_time = "import not measured"
+        return (
+            f"{self.name}: {self.size_bytes / 1024 / 1024:.1f} MiB, "
+            f"{len(self.modules)} source modules, "
+            f"{len(self.distributions)} distributions "
+            f"({', '.join(self.distributions) or '-'}), {import_time}"
+            f"{'' if self.rebuilt else ' (unchanged)'}"
+        )
+
+
+class ClosureFinder(modulefinder.ModuleFinder):
+    """
+    <modulefinder.ModuleFinder> that also supports the namespace packages (the
+    source directories without "__init__.py").
+    """
+
+    def find_module(self, name, path, parent=None):
+        spec = importlib.machinery.PathFinder.find_spec(
+            name, self.path if path is None else path
+        )
+        if spec is not None and spec.loader is None and spec.submodule_search_locations:
+            package_path = list(spec.submodule_search_locations)[0]
+            return None, package_path, ("", "", modulefinder._PKG_DIRECTORY)
+        return super().find_module(name, path, parent)
+
+    def load_package(self, fqname, pathname):
+        if os.path.exists(os.path.join(pathname, "__init__.py")):
+            return super().load_package(fqname, pathname)
+        module = self.add_module(fqname)
+        module.__path__ = [pathname]
+        return module
+
+
+def handler_module(handler: str) -> str:
+    """
+    Get the module of a Lambda handler (e.g. "trigger/trigger_handler.lambda_handler").
+    :param handler (str): Handler in the format of the Lambda Functions.
+    """
+    return handler.rsplit(".", 1)[0].replace("/", ".")
+
+
+def find_import_closure(
+    modules: Iterable[str], code_dir: str, dependencies_dir: Optional[str] = None
+) -> ClosureFinder:
+    """
+    Find all the modules imported (directly or not) by some modules, only in the
+    source code and the dependencies (the standard library is not scanned).
+    :param modules (Iterable[str]): Names of the modules (e.g. the handler module).
+    :param code_dir (str): Directory with the source code of the functions.
+    :param dependencies_dir (Optional(str)): Directory with the installed requirements.
+    """
+    finder = ClosureFinder(
+        path=[code_dir, *([dependencies_dir] if dependencies_dir else [])],
+        excludes=list(PROVIDED_MODULES),
+    )
+    for module in modules:
+        finder.import_hook(module)
+    return finder
+
+
+def find_missing_modules(finder: ClosureFinder) -> list[str]:
+    """
+    Get the modules of the import closure that were not found, except the ones
+    of the standard library (not scanned) and the provided modules.
+    :param finder (ClosureFinder): Finder that scanned the import closure.
+    """
+    return sorted(
+        module
+        for module in finder.badmodules
+        if module.split(".", 1)[0] not in sys.stdlib_module_names
+        and module.split(".", 1)[0] not in PROVIDED_MODULES
+    )
+
+
+def get_distribution_files(dependencies_dir: str) -> dict[str, tuple[str, list[str]]]:
+    """
+    Map the top-level modules of the installed requirements to their distribution
+    (name and files, including the metadata).
+    :param dependencies_dir (str): Directory with the installed requirements.
+    """
+    top_level_modules = {}
+    for distribution in importlib.metadata.distributions(path=[dependencies_dir]):
+        files = [str(file) for file in distribution.files or []]
+        for file in files:
+            top_level = file.split("/", 1)[0]
+            if top_level.endswith((".dist-info", ".data")) or top_level == "..":
+                continue
+            top_level = top_level.split(".", 1)[0] if "/" not in file else top_level
+            top_level_modules[top_level] = (distribution.metadata["Name"], files)
+    return top_level_modules
+
+
+def copy_file(source: str, destination: str) -> None:
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    shutil.copy2(source, destination)
+
+
+def get_fingerprint(files: Iterable[tuple[str, str]], precompiled: bool) -> str:
+    """
+    Hash of the inputs of a bundle (the content of its files and the options).
+    :param files (Iterable[tuple[str, str]]): Source and destination of each file.
+    :param precompiled (bool): The bundle includes the ".pyc" files.
+    """
+    digest = hashlib.sha256(f"precompiled={precompiled}".encode("utf-8"))
+    for source, destination in sorted(files, key=lambda file: file[1]):
+        digest.update(destination.encode("utf-8"))
+        with open(source, "rb") as file:
+            digest.update(hashlib.sha256(file.read()).digest())
+    return digest.hexdigest()
+
+
+def load_manifest(manifest_path: str) -> Optional[LambdaBundle]:
+    """
+    Load the bundle saved in a manifest (None if it does not exist).
+    :param manifest_path (str): Path of the manifest of the bundle.
+    """
+    if not os.path.isfile(manifest_path):
+        return None
+    with open(manifest_path) as file:
+        return LambdaBundle(**json.load(file))
+
+
+def measure_import_time(
+    bundle_path: str, module: str, environment: Optional[dict] = None
+) -> tuple[Optional[float], Optional[str]]:
+    """
+    Import a module of the bundle in a fresh interpreter that only has the
+    bundle, the standard library and the provided modules (like the Lambda runtime).
+    :param bundle_path (str): Directory of the bundle.
+    :param module (str): Name of the module (e.g. the handler module).
+    :param environment (Optional(dict)): Environment variables of the function.
+    :returns (tuple): Import time in milliseconds, or the error of the import.
+    """
+    with tempfile.TemporaryDirectory() as provided_dir:
+        for name in PROVIDED_MODULES:
+            spec = importlib.util.find_spec(name)
+            if spec is None or spec.origin is None:
+                continue
+            source = (
+                os.path.dirname(spec.origin)
+                if spec.submodule_search_locations
+                else spec.origin
+            )
+            os.symlink(source, os.path.join(provided_dir, os.path.basename(source)))
+
+        process_environment = {
+            "AWS_DEFAULT_REGION": "us-east-1",
+            "AWS_ACCESS_KEY_ID": "bundler",
+            "AWS_SECRET_ACCESS_KEY": "bundler",
+            **{key: str(value) for key, value in (environment or {}).items()},
+            "PYTHONPATH": os.pathsep.join([bundle_path, provided_dir]),
+            "PYTHONDONTWRITEBYTECODE": "1",
+        }
+        process = subprocess.run(
+            [sys.executable, "-S", "-c", MEASURE_IMPORT, module],
+            cwd=bundle_path,
+            env=process_environment,
+            capture_output=True,
+            text=True,
+            timeout=MEASURE_IMPORT_TIMEOUT_SECONDS,
+        )
+    if process.returncode != 0:
+        return None, (process.stderr.strip().splitlines() or ["unknown error"])[-1]
+    return float(process.stdout.strip().splitlines()[-1]), None
+
+
+def build_lambda_bundle(
+    name: str,
+    code_dir: str,
+    handler: str,
+    output_dir: str,
+    dependencies_dir: Optional[str] = None,
+    extra_modules: Iterable[str] = (),
+    precompile: bool = False,
+    environment: Optional[dict] = None,
+    measure: bool = False,
+    rebuild: bool = False,
+) -> LambdaBundle:
+    """
+    Build the bundle of a Lambda Function with only its import closure.
+    :param name (str): Name of the bundle (e.g. the construct id of the function).
+    :param code_dir (str): Directory with the source code of the functions.
+    :param handler (str): Handler of the function (e.g. "trigger/trigger_handler.lambda_handler").
+    :param output_dir (str): Directory for the bundles (each one in "<output_dir>/<name>").
+    :param dependencies_dir (Optional(str)): Directory with the installed requirements.
+    :param extra_modules (Iterable[str]): Modules imported dynamically (by name).
+    :param precompile (bool): Add the ".pyc" files (only if the Python version matches the runtime).
+    :param environment (Optional(dict)): Environment variables to measure the import time.
+    :param measure (bool): Measure the import time of the handler (in a subprocess).
+    :param rebuild (bool): Build the bundle again, even if its inputs did not change.
+    :raises BundleError: If a module of the closure is not found, or if the
+        handler fails to import (only when measured).
+    """
+    code_dir = os.path.abspath(code_dir)
+    dependencies_dir = dependencies_dir and os.path.abspath(dependencies_dir)
+    bundle_path = os.path.join(os.path.abspath(output_dir), name)
+    manifest_path = f"{bundle_path}.manifest.json"
+
+    module_name = handler_module(handler)
+    finder = find_import_closure(
+        [module_name, *extra_modules], code_dir, dependencies_dir
+    )
+    missing_modules = find_missing_modules(finder)
+    if missing_modules:
+        raise BundleError(
+            f"{name}: modules not found in the code or the requirements: "
+            f"{', '.join(missing_modules)}"
+        )
+    distribution_files = (
+        get_distribution_files(dependencies_dir) if dependencies_dir else {}
+    )
+
+    # Files of the bundle, as (source, path in the bundle)
+    files, source_modules, distributions = [], [], {}
+    for module in finder.modules.values():
+        module_file = module.__file__
+        if not module_file:
+            continue
+        if module_file.startswith(code_dir + os.sep):
+            relative_path = os.path.relpath(module_file, code_dir)
+            files.append((module_file, relative_path))
+            source_modules.append(module.__name__)
+            # Data files of the source packages (e.g. the JSON schemas)
+            if module.__path__:
+                for file_name in os.listdir(os.path.dirname(module_file)):
+                    file_path = os.path.join(os.path.dirname(module_file), file_name)
+                    if os.path.isfile(file_path) and not file_name.endswith(
+                        (".py", ".pyc")
+                    ):
+                        files.append(
+                            (
+                                file_path,
+                                os.path.join(os.path.dirname(relative_path), file_name),
+                            )
+                        )
+        elif dependencies_dir and module_file.startswith(dependencies_dir + os.sep):
+            top_level = os.path.relpath(module_file, dependencies_dir).split(os.sep)[0]
+            top_level = top_level.split(".", 1)[0]
+            distribution_name, distribution_paths = distribution_files.get(
+                top_level, (top_level, [top_level])
+            )
+            distributions[distribution_name] = distribution_paths
+
+    # The complete distributions are bundled (data files and metadata included)
+    for distribution_paths in distributions.values():
+        for path in distribution_paths:
+            source = os.path.normpath(os.path.join(dependencies_dir, path))
+            if (
+                not source.startswith(dependencies_dir + os.sep)
+                or "__pycache__" in path
+            ):
+                continue
+            if os.path.isdir(source):
+                for directory, directory_names, file_names in os.walk(source):
+                    directory_names[:] = [
+                        directory_name
+                        for directory_name in directory_names
+                        if directory_name != "__pycache__"
+                    ]
+                    for file_name in file_names:
+                        file_path = os.path.join(directory, file_name)
+                        files.append(
+                            (file_path, os.path.relpath(file_path, dependencies_dir))
+                        )
+            elif os.path.isfile(source):
+                files.append((source, path))
+
+    precompiled = precompile and sys.version_info[:2] == RUNTIME_PYTHON_VERSION
+    fingerprint = get_fingerprint(files, precompiled)
+
+    # The bundle of the previous synth is reused when its inputs did not change
+    bundle = None if rebuild else load_manifest(manifest_path)
+    if (
+        bundle is not None
+        and bundle.fingerprint == fingerprint
+        and os.path.isdir(bundle_path)
+    ):
+        bundle.path, bundle.rebuilt = bundle_path, False
+    else:
+        shutil.rmtree(bundle_path, ignore_errors=True)
+        os.makedirs(bundle_path)
+        for source, destination in files:
+            copy_file(source, os.path.join(bundle_path, destination))
+
+        # Hash-based ".pyc" files (the zip of the asset does not keep the mtimes)
+        if precompiled:
+            compileall.compile_dir(
+                bundle_path,
+                quiet=2,
+                invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+            )
+
+        size_bytes = sum(
+            os.path.getsize(os.path.join(directory, file_name))
+            for directory, _, file_names in os.walk(bundle_path)
+            for file_name in file_names
+        )
+        bundle = LambdaBundle(
+            name=name,
+            path=bundle_path,
+            modules=sorted(source_modules),
+            distributions=sorted(distributions),
+            size_bytes=size_bytes,
+            precompiled=precompiled,
+            fingerprint=fingerprint,
+        )
+        with open(manifest_path, "w") as file:
+            json.dump(asdict(bundle), file, indent=2)
+
+    if measure:
+        bundle.import_ms, bundle.import_error = measure_import_time(
+            bundle_path, module_name, environment
+        )
+        if bundle.import_error is not None:
+            raise BundleError(
+                f"{name}: the handler fails to import: {bundle.import_error}"
+            )
+    return bundle
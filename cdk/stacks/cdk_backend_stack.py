@@ -10,7 +10,10 @@ from aws_cdk import (
     Duration,
     aws_cognito,
     aws_dynamodb,
+    aws_iam,
     aws_lambda,
+    aws_lambda_event_sources,
+    aws_s3,
     aws_apigateway as aws_apigw,
     CfnOutput,
 )
@@ -50,6 +53,7 @@ class BackendStack(Stack):
 
         # Main methods for the deployment
         self.create_dynamodb_table()
+        self.create_imports_bucket()
         self.create_cognito_user_pool()
         self.create_lambda_layers()
         self.create_lambda_functions()
@@ -77,10 +81,60 @@ class BackendStack(Stack):
                 name="SK", type=aws_dynamodb.AttributeType.STRING
             ),
             billing_mode=aws_dynamodb.BillingMode.PAY_PER_REQUEST,
+            time_to_live_attribute="ttl",
             removal_policy=RemovalPolicy.DESTROY,
         )
         Tags.of(self.dynamodb_table).add("Name", self.app_config["table_name"])
 
+        # Index for the delta syncs (items and tombstones changed since a timestamp)
+        # Note: GSI instead of LSI, as LSIs can not be added to an existing table
+        self.dynamodb_table.add_global_secondary_index(
+            index_name="GSI-UpdatedAt",
+            partition_key=aws_dynamodb.Attribute(
+                name="PK", type=aws_dynamodb.AttributeType.STRING
+            ),
+            sort_key=aws_dynamodb.Attribute(
+                name="updated_at", type=aws_dynamodb.AttributeType.STRING
+            ),
+            projection_type=aws_dynamodb.ProjectionType.ALL,
+        )
+
+        # Index for the date range queries (only RECIPE items have "recipe_date")
+        # Note: CloudFormation only creates one GSI per table update, so on existing
+        # tables this index is deployed in a second step (see "recipe_date_index")
+        if self.app_config.get("recipe_date_index", False):
+            self.dynamodb_table.add_global_secondary_index(
+                index_name="GSI-RecipeDate",
+                partition_key=aws_dynamodb.Attribute(
+                    name="PK", type=aws_dynamodb.AttributeType.STRING
+                ),
+                sort_key=aws_dynamodb.Attribute(
+                    name="recipe_date", type=aws_dynamodb.AttributeType.STRING
+                ),
+                projection_type=aws_dynamodb.ProjectionType.ALL,
+            )
+
+    def create_imports_bucket(self):
+        """
+        Create S3 bucket for the uploaded RECIPE import files.
+        """
+        self.imports_bucket = aws_s3.Bucket(
+            self,
+            "S3-Bucket-Imports",
+            block_public_access=aws_s3.BlockPublicAccess.BLOCK_ALL,
+            encryption=aws_s3.BucketEncryption.S3_MANAGED,
+            enforce_ssl=True,
+            cors=[
+                aws_s3.CorsRule(
+                    allowed_methods=[aws_s3.HttpMethods.PUT],
+                    allowed_origins=["*"],
+                    allowed_headers=["*"],
+                )
+            ],
+            lifecycle_rules=[aws_s3.LifecycleRule(expiration=Duration.days(7))],
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
     def create_cognito_user_pool(self):
         """
         Create Cognito User Pool for the RECIPE app.
@@ -181,6 +235,12 @@ class BackendStack(Stack):
                 "ENVIRONMENT": self.app_config["deployment_environment"],
                 "LOG_LEVEL": self.app_config["log_level"],
                 "DYNAMODB_TABLE": self.dynamodb_table.table_name,
+                "IMPORTS_BUCKET": self.imports_bucket.bucket_name,
+                "RECIPES_CACHE_ENABLED": "false",
+                "RECIPES_CACHE_BACKEND": "memory",
+                "RECIPE_DATE_INDEX_ENABLED": str(
+                    self.app_config.get("recipe_date_index", False)
+                ).lower(),
             },
             layers=[
                 self.lambda_layer_powertools,
@@ -189,6 +249,82 @@ class BackendStack(Stack):
         )
 
         self.dynamodb_table.grant_read_write_data(self.lambda_recipes_app)
+        self.imports_bucket.grant_put(self.lambda_recipes_app)
+
+        # Lambda Function for the hot CRUD paths of "Recipes" without the FastAPI
+        # stack (unsupported requests are still answered by the FastAPI app)
+        self.lambda_recipes_native: aws_lambda.Function = aws_lambda.Function(
+            self,
+            "Lambda-Recipes-Native",
+            runtime=aws_lambda.Runtime.PYTHON_3_11,
+            function_name=f"{self.main_resources_name}-native-{self.deployment_environment}",
+            handler="api/v1/native_handler.handler",
+            code=aws_lambda.Code.from_asset(PATH_TO_LAMBDA_FUNCTION_FOLDER),
+            timeout=Duration.seconds(20),
+            memory_size=512,
+            environment={
+                "ENVIRONMENT": self.app_config["deployment_environment"],
+                "LOG_LEVEL": self.app_config["log_level"],
+                "DYNAMODB_TABLE": self.dynamodb_table.table_name,
+                "IMPORTS_BUCKET": self.imports_bucket.bucket_name,
+                "RECIPES_CACHE_ENABLED": "false",
+                "RECIPES_CACHE_BACKEND": "memory",
+                "RECIPE_DATE_INDEX_ENABLED": str(
+                    self.app_config.get("recipe_date_index", False)
+                ).lower(),
+            },
+            layers=[
+                self.lambda_layer_powertools,
+                self.lambda_layer_common,
+            ],
+        )
+
+        self.dynamodb_table.grant_read_write_data(self.lambda_recipes_native)
+
+        # Lambda Function for importing the RECIPE files uploaded to S3
+        lambda_imports_name = (
+            f"{self.main_resources_name}-imports-{self.deployment_environment}"
+        )
+        self.lambda_recipes_imports: aws_lambda.Function = aws_lambda.Function(
+            self,
+            "Lambda-Recipes-Imports",
+            runtime=aws_lambda.Runtime.PYTHON_3_11,
+            function_name=lambda_imports_name,
+            handler="imports/import_handler.lambda_handler",
+            code=aws_lambda.Code.from_asset(PATH_TO_LAMBDA_FUNCTION_FOLDER),
+            timeout=Duration.minutes(15),
+            memory_size=1024,
+            environment={
+                "ENVIRONMENT": self.app_config["deployment_environment"],
+                "LOG_LEVEL": self.app_config["log_level"],
+                "DYNAMODB_TABLE": self.dynamodb_table.table_name,
+                "IMPORTS_BUCKET": self.imports_bucket.bucket_name,
+            },
+            layers=[
+                self.lambda_layer_powertools,
+                self.lambda_layer_common,
+            ],
+        )
+        self.lambda_recipes_imports.add_event_source(
+            aws_lambda_event_sources.S3EventSource(
+                self.imports_bucket,
+                events=[aws_s3.EventType.OBJECT_CREATED],
+                filters=[aws_s3.NotificationKeyFilter(prefix="imports/")],
+            )
+        )
+
+        self.dynamodb_table.grant_read_write_data(self.lambda_recipes_imports)
+        self.imports_bucket.grant_read(self.lambda_recipes_imports)
+
+        # Long imports are chained, so the Lambda Function can invoke itself
+        self.lambda_recipes_imports.add_to_role_policy(
+            aws_iam.PolicyStatement(
+                actions=["lambda:InvokeFunction"],
+                resources=[
+                    f"arn:aws:lambda:{self.region}:{self.account}:function:{lambda_imports_name}"
+                ],
+            )
+        )
 
     def create_rest_api(self):
         """
@@ -290,20 +426,44 @@ class BackendStack(Stack):
             default_method_options=self.api_method_options_private,
         )
         recipes_resource = root_resource_recipes.add_resource("{recipe_id}")
+        recipes_batch_get_resource = root_resource_v1.add_resource(
+            "recipes:batchGet",
+            default_method_options=self.api_method_options_private,
+        )
+        recipes_batch_create_resource = root_resource_v1.add_resource(
+            "recipes:batchCreate",
+            default_method_options=self.api_method_options_private,
+        )
+        recipes_import_resource = root_resource_v1.add_resource(
+            "recipes:import",
+            default_method_options=self.api_method_options_private,
+        )
 
         # Define all API-Lambda integrations for the API methods
         api_lambda_integration_recipes = aws_apigw.LambdaIntegration(
             self.lambda_recipes_app
         )
+        api_lambda_integration_recipes_native = aws_apigw.LambdaIntegration(
+            self.lambda_recipes_native
+        )
 
         # API-Path: "/api/v1/recipes"
-        root_resource_recipes.add_method("GET", api_lambda_integration_recipes)
-        root_resource_recipes.add_method("POST", api_lambda_integration_recipes)
+        root_resource_recipes.add_method("GET", api_lambda_integration_recipes_native)
+        root_resource_recipes.add_method("POST", api_lambda_integration_recipes_native)
 
         # API-Path: "/api/v1/recipes/{recipe_id}"
-        recipes_resource.add_method("GET", api_lambda_integration_recipes)
-        recipes_resource.add_method("PATCH", api_lambda_integration_recipes)
-        recipes_resource.add_method("DELETE", api_lambda_integration_recipes)
+        recipes_resource.add_method("GET", api_lambda_integration_recipes_native)
+        recipes_resource.add_method("PATCH", api_lambda_integration_recipes_native)
+        recipes_resource.add_method("DELETE", api_lambda_integration_recipes_native)
+
+        # API-Path: "/api/v1/recipes:batchGet"
+        recipes_batch_get_resource.add_method("POST", api_lambda_integration_recipes)
+
+        # API-Path: "/api/v1/recipes:batchCreate"
+        recipes_batch_create_resource.add_method("POST", api_lambda_integration_recipes)
+
+        # API-Path: "/api/v1/recipes:import"
+        recipes_import_resource.add_method("POST", api_lambda_integration_recipes)
 
         # API-Path: "/api/v1/docs"
         root_resource_docs.add_method("GET", api_lambda_integration_recipes)
@@ -1,5 +1,6 @@
 # Built-in imports
 import os
+from typing import Optional
 
 # External imports
 from aws_cdk import (
@@ -22,6 +23,22 @@ from aws_cdk import (
 )
 from constructs import Construct
 
+# Own imports
+from bundling.lambda_bundler import build_lambda_bundle
+
+# Installed requirements of the "common" layer and output of the slim bundles
+PATH_TO_LAYER_COMMON_MODULES = "lambda-layers/common/modules/python"
+PATH_TO_LAMBDA_BUNDLES = ".build/lambda-bundles"
+
+# Modules of the State Machine steps (imported by name from <STEP_CLASSES>)
+STATE_MACHINE_STEP_MODULES = [
+    "state_machine.utils.validate_message",
+    "state_machine.processing.process_text",
+    "state_machine.processing.send_message",
+    "state_machine.utils.success",
+    "state_machine.utils.failure",
+]
+
 
 class ChatbotStack(Stack):
     """
@@ -123,6 +140,49 @@ class ChatbotStack(Stack):
             compatible_architectures=[aws_lambda.Architecture.X86_64],
         )
 
+    def get_lambda_code(
+        self,
+        construct_id: str,
+        code_dir: str,
+        handler: str,
+        environment: dict,
+        extra_modules: Optional[list[str]] = None,
+    ) -> tuple[aws_lambda.Code, list[aws_lambda.ILayerVersion]]:
+        """
+        Get the code and the layers of a Lambda Function. By default, the whole
+        source tree with the shared layers. With "slim_bundles", a bundle with only
+        the modules and requirements of the handler's import closure (plus the
+        PowerTools layer), reporting its size at synth time. The synth fails if a
+        module of the closure is missing. The bundles are only built again when
+        their inputs change (or with "rebuild_bundles"), and "measure_bundles"
+        also measures (and checks) the import of the handlers.
+        :param construct_id (str): Construct ID of the Lambda Function.
+        :param code_dir (str): Directory with the source code of the functions.
+        :param handler (str): Handler of the Lambda Function.
+        :param environment (dict): Environment variables of the Lambda Function.
+        :param extra_modules (Optional(list[str])): Modules imported dynamically (by name).
+        """
+        if not self.app_config.get("slim_bundles", False):
+            return aws_lambda.Code.from_asset(code_dir), [
+                self.lambda_layer_powertools,
+                self.lambda_layer_common,
+            ]
+
+        bundle = build_lambda_bundle(
+            name=construct_id,
+            code_dir=code_dir,
+            handler=handler,
+            output_dir=PATH_TO_LAMBDA_BUNDLES,
+            dependencies_dir=PATH_TO_LAYER_COMMON_MODULES,
+            extra_modules=extra_modules or [],
+            precompile=self.app_config.get("precompile_bundles", False),
+            environment=environment,
+            measure=self.app_config.get("measure_bundles", False),
+            rebuild=self.app_config.get("rebuild_bundles", False),
+        )
+        print(f"--> Lambda bundle {bundle.summary()}")
+        return aws_lambda.Code.from_asset(bundle.path), [self.lambda_layer_powertools]
+
     def create_lambda_functions(self) -> None:
         """
         Create the Lambda Functions for the solution.
@@ -135,71 +195,84 @@ class ChatbotStack(Stack):
         )
 
         # Lambda Function for WhatsApp input messages (Meta WebHook)
+        webhook_environment = {
+            "ENVIRONMENT": self.app_config["deployment_environment"],
+            "LOG_LEVEL": self.app_config["log_level"],
+            "DYNAMODB_TABLE": self.dynamodb_table.table_name,
+            "SECRET_NAME": self.app_config["chatbot_secret_name"],
+        }
+        webhook_code, webhook_layers = self.get_lambda_code(
+            "Lambda-WhatsApp-Webhook",
+            PATH_TO_LAMBDA_FUNCTION_FOLDER,
+            "whatsapp_webhook/api/v1/main.handler",
+            webhook_environment,
+        )
         self.lambda_whatsapp_webhook = aws_lambda.Function(
             self,
             "Lambda-WhatsApp-Webhook",
             runtime=aws_lambda.Runtime.PYTHON_3_11,
             handler="whatsapp_webhook/api/v1/main.handler",
             function_name=f"{self.main_resources_name}-input",
-            code=aws_lambda.Code.from_asset(PATH_TO_LAMBDA_FUNCTION_FOLDER),
+            code=webhook_code,
             timeout=Duration.seconds(20),
             memory_size=512,
-            environment={
-                "ENVIRONMENT": self.app_config["deployment_environment"],
-                "LOG_LEVEL": self.app_config["log_level"],
-                "DYNAMODB_TABLE": self.dynamodb_table.table_name,
-                "SECRET_NAME": self.app_config["chatbot_secret_name"],
-            },
-            layers=[
-                self.lambda_layer_powertools,
-                self.lambda_layer_common,
-            ],
+            environment=webhook_environment,
+            layers=webhook_layers,
         )
         self.dynamodb_table.grant_read_write_data(self.lambda_whatsapp_webhook)
         self.secret_chatbot.grant_read(self.lambda_whatsapp_webhook)
 
         # Lambda Function for receiving the messages from DynamoDB Streams
         # ... and triggering the State Machine for processing the messages
+        trigger_environment = {
+            "ENVIRONMENT": self.app_config["deployment_environment"],
+            "LOG_LEVEL": self.app_config["log_level"],
+        }
+        trigger_code, trigger_layers = self.get_lambda_code(
+            "Lambda-Trigger-Message-Processing",
+            PATH_TO_LAMBDA_FUNCTION_FOLDER,
+            "trigger/trigger_handler.lambda_handler",
+            trigger_environment,
+        )
         self.lambda_trigger_state_machine = aws_lambda.Function(
             self,
             "Lambda-Trigger-Message-Processing",
             runtime=aws_lambda.Runtime.PYTHON_3_11,
             handler="trigger/trigger_handler.lambda_handler",
             function_name=f"{self.main_resources_name}-trigger-state-machine",
-            code=aws_lambda.Code.from_asset(PATH_TO_LAMBDA_FUNCTION_FOLDER),
+            code=trigger_code,
             timeout=Duration.seconds(20),
             memory_size=512,
-            environment={
-                "ENVIRONMENT": self.app_config["deployment_environment"],
-                "LOG_LEVEL": self.app_config["log_level"],
-            },
-            layers=[
-                self.lambda_layer_powertools,
-                self.lambda_layer_common,
-            ],
+            environment=trigger_environment,
+            layers=trigger_layers,
         )
 
         # Lambda Function that will run the State Machine steps for processing the messages
         # TODO: In the future, can be migrated to MULTIPLE Lambda Functions for each step...
+        state_machine_environment = {
+            "ENVIRONMENT": self.app_config["deployment_environment"],
+            "LOG_LEVEL": self.app_config["log_level"],
+            "SECRET_NAME": self.app_config["chatbot_secret_name"],
+            "META_ENDPOINT": self.app_config["meta_endpoint"],
+        }
+        state_machine_code, state_machine_layers = self.get_lambda_code(
+            "Lambda-SM-Process-Message",
+            PATH_TO_LAMBDA_FUNCTION_FOLDER,
+            "state_machine/state_machine_handler.lambda_handler",
+            state_machine_environment,
+            extra_modules=STATE_MACHINE_STEP_MODULES,
+        )
         self.lambda_state_machine_process_message = aws_lambda.Function(
             self,
             "Lambda-SM-Process-Message",
             runtime=aws_lambda.Runtime.PYTHON_3_11,
             handler="state_machine/state_machine_handler.lambda_handler",
             function_name=f"{self.main_resources_name}-state-machine-lambda",
-            code=aws_lambda.Code.from_asset(PATH_TO_LAMBDA_FUNCTION_FOLDER),
+            code=state_machine_code,
             timeout=Duration.seconds(60),
             memory_size=512,
-            environment={
-                "ENVIRONMENT": self.app_config["deployment_environment"],
-                "LOG_LEVEL": self.app_config["log_level"],
-                "SECRET_NAME": self.app_config["chatbot_secret_name"],
-                "META_ENDPOINT": self.app_config["meta_endpoint"],
-            },
-            layers=[
-                self.lambda_layer_powertools,
-                self.lambda_layer_common,
-            ],
+            environment=state_machine_environment,
+            layers=state_machine_layers,
         )
         self.secret_chatbot.grant_read(self.lambda_state_machine_process_message)
         self.dynamodb_table.grant_read_write_data(
@@ -234,21 +307,31 @@ class ChatbotStack(Stack):
                 ),
             ],
         )
+        fetch_recipes_environment = {
+            "ENVIRONMENT": self.app_config["deployment_environment"],
+            "LOG_LEVEL": self.app_config["log_level"],
+            "TABLE_NAME": self.app_config["table_name"],
+            # Only with "RECIPES_CACHE_BACKEND": "redis" (shared with the backend)
+            "RECIPES_CACHE_ENABLED": "false",
+        }
+        fetch_recipes_code, fetch_recipes_layers = self.get_lambda_code(
+            "Lambda-AG-FetchRecipes",
+            PATH_TO_LAMBDA_FUNCTION_FOLDER,
+            "bedrock_agent/lambda_function.lambda_handler",
+            fetch_recipes_environment,
+        )
         self.lambda_fetch_recipes = aws_lambda.Function(
             self,
             "Lambda-AG-FetchRecipes",
             runtime=aws_lambda.Runtime.PYTHON_3_11,
             handler="bedrock_agent/lambda_function.lambda_handler",
             function_name=f"{self.main_resources_name}-bedrock-action-group-recipes",
-            code=aws_lambda.Code.from_asset(PATH_TO_LAMBDA_FUNCTION_FOLDER),
+            code=fetch_recipes_code,
             timeout=Duration.seconds(60),
             memory_size=512,
-            environment={
-                "ENVIRONMENT": self.app_config["deployment_environment"],
-                "LOG_LEVEL": self.app_config["log_level"],
-                "TABLE_NAME": self.app_config["table_name"],
-            },
+            environment=fetch_recipes_environment,
             role=bedrock_agent_lambda_role,
+            layers=fetch_recipes_layers,
         )
 
         # Add permissions to the Lambda function resource policy. You use a resource-based policy to allow an AWS service to invoke your function.
@@ -1,17 +1,59 @@
 # Built-in imports
 import os
-import boto3
 from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
+# Own imports
+from common.capacity import (
+    RETURN_CONSUMED_CAPACITY,
+    access_pattern,
+    record_consumed_capacity,
+)
+from common.helpers.aws_clients import get_resource
+from common.helpers.cache_helper import RedisCacheBackend, get_cache_backend
+from common.logger import custom_logger
+
 # TODO: Enhance code to be production grade. This is just a POC
 # (Add logger, add error handling, add optimizations, etc...)
 
+logger = custom_logger()
+
 TABLE_NAME = os.environ.get("TABLE_NAME")
-dynamodb_resource = boto3.resource("dynamodb")
-table = dynamodb_resource.Table(TABLE_NAME)
 
+# Optional cache for the per-user lookups. Only the Redis backend shares the
+# versions bumped by the backend writes (the memory backend of this Lambda
+# Function would serve stale lookups), so it is the only one enabled.
+RECIPES_CACHE_TTL_SECONDS = float(os.environ.get("RECIPES_CACHE_TTL_SECONDS", "30"))
+recipes_cache = get_cache_backend("RECIPES_CACHE")
+if recipes_cache is not None and not isinstance(recipes_cache, RedisCacheBackend):
+    logger.warning("Recipes cache disabled: it requires RECIPES_CACHE_BACKEND=redis")
+    recipes_cache = None
 
+
+def get_all_recipes_for_user_cached(
+    partition_key: str, sort_key_portion: str
+) -> list[dict]:
+    """
+    Function to get the RECIPE items of a user from the cache, or from DynamoDB
+    when they are not cached. Keys are stamped with the version of the user in
+    Redis (bumped by the backend writes), so a stale lookup is never served.
+    :param partition_key (str): partition key value.
+    :param sort_key_portion (str): sort key portion to use in query.
+    """
+    if recipes_cache is None:
+        return get_all_recipes_for_user(partition_key, sort_key_portion)
+
+    version = recipes_cache.get_version(f"recipes:v:{partition_key}")
+    cache_key = f"recipes:{partition_key}:{version}:chatbot:{sort_key_portion}"
+    all_items = recipes_cache.get(cache_key)
+    if all_items is None:
+        all_items = get_all_recipes_for_user(partition_key, sort_key_portion)
+        recipes_cache.set(cache_key, all_items, RECIPES_CACHE_TTL_SECONDS)
+    logger.debug("Recipes cache stats", extra=recipes_cache.stats())
+    return all_items
+
+
+@access_pattern("bedrock_fetch_recipes")
 def get_all_recipes_for_user(partition_key: str, sort_key_portion: str) -> list[dict]:
     """
     Function to run a query against DynamoDB with partition key and the sort
@@ -24,6 +66,9 @@ def get_all_recipes_for_user(partition_key: str, sort_key_portion: str) -> list[
         f"pk: ({partition_key}) and sk: ({sort_key_portion})"
     )
 
+    # The shared resource is created again after a SnapStart restore
+    table = get_resource("dynamodb").Table(TABLE_NAME)
+
     all_items = []
     try:
         # The structure key for a single-table-design "PK" and "SK" naming
@@ -36,6 +81,10 @@ def get_all_recipes_for_user(partition_key: str, sort_key_portion: str) -> list[
         response = table.query(
             KeyConditionExpression=key_condition,
             Limit=limit,
+            ReturnConsumedCapacity=RETURN_CONSUMED_CAPACITY,
+        )
+        record_consumed_capacity(
+            "query", response, items=len(response.get("Items", [])), page=True
         )
         if "Items" in response:
             all_items.extend(response["Items"])
@@ -46,6 +95,10 @@ def get_all_recipes_for_user(partition_key: str, sort_key_portion: str) -> list[
                 KeyConditionExpression=key_condition,
                 Limit=limit,
                 ExclusiveStartKey=response["LastEvaluatedKey"],
+                ReturnConsumedCapacity=RETURN_CONSUMED_CAPACITY,
+            )
+            record_consumed_capacity(
+                "query", response, items=len(response.get("Items", [])), page=True
             )
             if "Items" in response:
                 all_items.extend(response["Items"])
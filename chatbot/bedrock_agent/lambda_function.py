@@ -1,8 +1,10 @@
 # NOTE: This is a super-MVP code for testing. Still has a lot of gaps to solve/fix. Do not use in prod.
 
-from bedrock_agent.fetch_recipes import get_all_recipes_for_user
+from bedrock_agent.fetch_recipes import get_all_recipes_for_user_cached
+from common.capacity import log_capacity_metrics
 
 
+@log_capacity_metrics
 def lambda_handler(event, context):
     action_group = event["actionGroup"]
     _function = event["function"]
@@ -19,7 +21,7 @@ def lambda_handler(event, context):
         if param["name"] == "recipe_name":
             recipe_name = param["value"]
 
-    all_recipes_for_user = get_all_recipes_for_user(
+    all_recipes_for_user = get_all_recipes_for_user_cached(
         partition_key=f"USER#{email}",
         sort_key_portion="RECIPE#",
     )
@@ -1,10 +1,14 @@
 # Built-in imports
-import boto3
+from typing import Any
+
+# External imports
 from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
 # Own imports
+from common.capacity import RETURN_CONSUMED_CAPACITY, record_consumed_capacity
 from common.logger import custom_logger
+from common.helpers.aws_clients import get_client, get_resource
 
 logger = custom_logger()
 
@@ -18,9 +22,36 @@ class DynamoDBHelper:
         :param endpoint_url (Optional(str)): Endpoint for DynamoDB (only for local tests).
         """
         self.table_name = table_name
-        self.dynamodb_client = boto3.client("dynamodb", endpoint_url=endpoint_url)
-        self.dynamodb_resource = boto3.resource("dynamodb", endpoint_url=endpoint_url)
-        self.table = self.dynamodb_resource.Table(self.table_name)
+        self.endpoint_url = endpoint_url
+        self._table = None
+
+    @property
+    def dynamodb_client(self) -> Any:
+        """Low-level DynamoDB client (shared, created on first use)."""
+        return get_client("dynamodb", endpoint_url=self.endpoint_url)
+
+    @property
+    def dynamodb_resource(self) -> Any:
+        """DynamoDB resource (shared, created on first use)."""
+        return get_resource("dynamodb", endpoint_url=self.endpoint_url)
+
+    @property
+    def table(self) -> Any:
+        """DynamoDB table resource (only created by the operations that use it)."""
+        # The shared resource is created again after a SnapStart restore
+        dynamodb_resource = self.dynamodb_resource
+        client = dynamodb_resource.meta.client
+        if self._table is None or self._table.meta.client is not client:
+            self._table = dynamodb_resource.Table(self.table_name)
+        return self._table
+
+    def prewarm(self) -> None:
+        """
+        Create the client and the Table resource (loads the service models), e.g.
+        before a SnapStart snapshot. No connections are opened.
+        """
+        self.dynamodb_client
+        self.table
 
     def get_item_by_pk_and_sk(self, partition_key: str, sort_key: str) -> dict:
         """
@@ -46,6 +77,10 @@ class DynamoDBHelper:
             response = self.dynamodb_client.get_item(
                 TableName=self.table_name,
                 Key=primary_key_dict,
+                ReturnConsumedCapacity=RETURN_CONSUMED_CAPACITY,
+            )
+            record_consumed_capacity(
+                "get_item_by_pk_and_sk", response, items=int("Item" in response)
             )
             return response["Item"] if "Item" in response else {}
 
@@ -85,6 +120,10 @@ class DynamoDBHelper:
             response = self.table.query(
                 KeyConditionExpression=key_condition,
                 Limit=limit,
+                ReturnConsumedCapacity=RETURN_CONSUMED_CAPACITY,
+            )
+            record_consumed_capacity(
+                "query", response, items=len(response.get("Items", [])), page=True
             )
             if "Items" in response:
                 all_items.extend(response["Items"])
@@ -95,6 +134,10 @@ class DynamoDBHelper:
                     KeyConditionExpression=key_condition,
                     Limit=limit,
                     ExclusiveStartKey=response["LastEvaluatedKey"],
+                    ReturnConsumedCapacity=RETURN_CONSUMED_CAPACITY,
+                )
+                record_consumed_capacity(
+                    "query", response, items=len(response.get("Items", [])), page=True
                 )
                 if "Items" in response:
                     all_items.extend(response["Items"])
@@ -122,7 +165,9 @@ class DynamoDBHelper:
             response = self.table.put_item(
                 TableName=self.table_name,
                 Item=data,
+                ReturnConsumedCapacity=RETURN_CONSUMED_CAPACITY,
             )
+            record_consumed_capacity("put_item", response, items=1, write=True)
             logger.info(response)
             return response
         except ClientError as error:
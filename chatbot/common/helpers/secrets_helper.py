@@ -1,6 +1,5 @@
 # Built-in imports
 import json
-import boto3
 from typing import Union, Optional
 
 # External imports
@@ -8,6 +7,7 @@ from botocore.exceptions import ClientError
 
 # Own imports
 from common.logger import custom_logger
+from common.helpers.aws_clients import LazyClient
 
 logger = custom_logger()
 
@@ -20,7 +20,7 @@ class SecretsHelper:
         :param secret_name (str): Name of the secret to fetch.
         """
         self.secret_name = secret_name
-        self.client_sm = boto3.client("secretsmanager")
+        self.client_sm = LazyClient("secretsmanager")
 
     def get_secret_value(self, key_name: Optional[str] = None) -> Union[str, None]:
         """
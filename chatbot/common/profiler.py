@@ -0,0 +1,324 @@
+################################################################################
+# Opt-in sampling profiler for the requests and the Lambda invocations. When
+# "PROFILING_ENABLED" is set, a fraction of the invocations ("PROFILING_SAMPLE_RATE")
+# is profiled by a background thread that samples the stacks of all the threads
+# ("sys._current_frames") every "PROFILING_INTERVAL_MS", so the profiled code is
+# not instrumented. Each profile is saved in the speedscope or the collapsed
+# stacks format to a local directory (e.g. "/tmp/profiles") or to an
+# "s3://bucket/prefix" location, tagged with the correlation-id of its logs.
+# The profiles that fail to be saved are logged (the requests do not fail).
+################################################################################
+
+# Built-in imports
+import functools
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+from urllib.parse import urlencode
+from uuid import uuid4
+
+# Own imports
+from common.logger import custom_logger
+
+logger = custom_logger()
+
+PROFILING_ENABLED = os.environ.get("PROFILING_ENABLED", "false").lower() == "true"
+PROFILING_SAMPLE_RATE = float(os.environ.get("PROFILING_SAMPLE_RATE", "0.01"))
+PROFILING_INTERVAL_MS = float(os.environ.get("PROFILING_INTERVAL_MS", "5"))
+PROFILING_FORMAT = os.environ.get("PROFILING_FORMAT", "speedscope")  # or "collapsed"
+PROFILING_OUTPUT = os.environ.get("PROFILING_OUTPUT", "/tmp/profiles")
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# Name of the profiles of the requests that do not match any route (e.g. 404)
+UNMATCHED_ROUTE = "unmatched"
+
+# A frame of the stacks: (function name, file name, first line of the function)
+Frame = tuple[str, str, int]
+
+# The samples include all the threads, so only one request is profiled at a time
+# (e.g. the native handler delegating to the FastAPI app is profiled once)
+_active_profiler: Optional["SamplingProfiler"] = None
+
+
+@dataclass
+class Profile:
+    """Stacks sampled from each thread (and how many times each one was seen)."""
+
+    name: str
+    correlation_id: str
+    interval_ms: float
+    duration_ms: float = 0.0
+    samples: dict[str, Counter] = field(default_factory=dict)
+
+    def to_collapsed(self) -> str:
+        """Collapsed stacks ("thread;frame;...;frame count"), e.g. for flamegraph.pl."""
+        lines = []
+        for thread_name, stacks in self.samples.items():
+            for stack, count in stacks.items():
+                frames = [thread_name, *(format_frame(frame) for frame in stack)]
+                lines.append(f"{';'.join(frames)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def to_speedscope(self) -> dict:
+        """Speedscope file (one sampled profile per thread)."""
+        frames, frame_indexes, profiles = [], {}, []
+        for thread_name, stacks in self.samples.items():
+            samples, weights = [], []
+            for stack, count in stacks.items():
+                for frame in stack:
+                    if frame not in frame_indexes:
+                        frame_indexes[frame] = len(frames)
+                        frames.append(
+                            {"name": frame[0], "file": frame[1], "line": frame[2]}
+                        )
+                samples.append([frame_indexes[frame] for frame in stack])
+                weights.append(count * self.interval_ms)
+            profiles.append(
+                {
+                    "type": "sampled",
+                    "name": thread_name,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            )
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": f"{self.name} (correlation_id: {self.correlation_id})",
+            "exporter": "wpp-chatbot-profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+
+def format_frame(frame: Frame) -> str:
+    return f"{frame[0]} ({frame[1]}:{frame[2]})"
+
+
+class SamplingProfiler:
+    """Background thread that samples the stacks of the other threads."""
+
+    def __init__(self, name: str, correlation_id: str, interval_ms: float) -> None:
+        """
+        :param name (str): Name of the profiled request (e.g. the route).
+        :param correlation_id (str): Correlation ID of the logs of the request.
+        :param interval_ms (float): Milliseconds between the samples.
+        """
+        self.profile = Profile(name, correlation_id, interval_ms)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread_names: dict[int, str] = {}
+
+    def start(self) -> "SamplingProfiler":
+        global _active_profiler
+        _active_profiler = self
+        self._start = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def stop(self) -> Profile:
+        global _active_profiler
+        self._stop.set()
+        self._thread.join()
+        _active_profiler = None
+        self.profile.duration_ms = (time.perf_counter() - self._start) * 1000
+        return self.profile
+
+    def _run(self) -> None:
+        interval_seconds = self.profile.interval_ms / 1000
+        while not self._stop.wait(interval_seconds):
+            self.sample()
+
+    def sample(self) -> None:
+        """Take a sample of the stacks of all the threads (except the profiler)."""
+        own_thread_id = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread_id:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            thread_name = self._get_thread_name(thread_id)
+            self.profile.samples.setdefault(thread_name, Counter())[
+                tuple(reversed(stack))
+            ] += 1
+
+    def _get_thread_name(self, thread_id: int) -> str:
+        if thread_id not in self._thread_names:
+            self._thread_names.update(
+                {thread.ident: thread.name for thread in threading.enumerate()}
+            )
+        return self._thread_names.get(thread_id, str(thread_id))
+
+
+def should_profile() -> bool:
+    """Decide if the current invocation is profiled (only when enabled)."""
+    return (
+        PROFILING_ENABLED
+        and _active_profiler is None
+        and random.random() < PROFILING_SAMPLE_RATE
+    )
+
+
+def start_profiler(name: str, correlation_id: str) -> SamplingProfiler:
+    """
+    Start profiling a request.
+    :param name (str): Name of the profiled request (e.g. the route).
+    :param correlation_id (str): Correlation ID of the logs of the request.
+    """
+    return SamplingProfiler(name, correlation_id, PROFILING_INTERVAL_MS).start()
+
+
+def save_profile(profile: Profile) -> str:
+    """
+    Save a profile in the "PROFILING_FORMAT" to the "PROFILING_OUTPUT" location
+    (a local directory or "s3://bucket/prefix"), and log where it was saved.
+    :param profile (Profile): Profile to save.
+    :returns (str): Location of the saved profile.
+    """
+    if PROFILING_FORMAT == "collapsed":
+        content, extension = profile.to_collapsed(), "collapsed.txt"
+    else:
+        content, extension = json.dumps(profile.to_speedscope()), "speedscope.json"
+
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    # The names come from the requests (e.g. the header), so they are sanitized
+    route, correlation_id = (
+        re.sub(r"[^A-Za-z0-9_.-]+", "_", value).strip("_.")
+        for value in (profile.name, profile.correlation_id)
+    )
+    key = f"{route}/{timestamp}-{correlation_id}.{extension}"
+
+    if PROFILING_OUTPUT.startswith("s3://"):
+        # boto3 is kept out of the cold starts (only the S3 output requires it)
+        from common.helpers.aws_clients import get_client
+
+        bucket, _, prefix = PROFILING_OUTPUT[len("s3://") :].partition("/")
+        key = f"{prefix.strip('/')}/{key}" if prefix.strip("/") else key
+        get_client("s3").put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=content.encode("utf-8"),
+            Tagging=urlencode({"correlation-id": profile.correlation_id}),
+            Metadata={"correlation-id": profile.correlation_id},
+        )
+        location = f"s3://{bucket}/{key}"
+    else:
+        location = os.path.join(PROFILING_OUTPUT, key)
+        os.makedirs(os.path.dirname(location), exist_ok=True)
+        with open(location, "w") as file:
+            file.write(content)
+
+    logger.info(
+        f"Profile saved to: {location}",
+        extra={
+            "correlation_id": profile.correlation_id,
+            "profile_duration_ms": round(profile.duration_ms, 1),
+        },
+    )
+    return location
+
+
+def stop_and_save_profile(profiler: SamplingProfiler) -> Optional[str]:
+    """
+    Stop a profiler and save its profile. The errors are logged instead of
+    raised, so they do not replace the response (or the error) of the request.
+    :param profiler (SamplingProfiler): Profiler of the request.
+    :returns (Optional(str)): Location of the saved profile (None if it failed).
+    """
+    try:
+        return save_profile(profiler.stop())
+    except Exception as error:
+        logger.exception(
+            f"Error saving the profile of {profiler.profile.name}: {error}",
+            extra={"correlation_id": profiler.profile.correlation_id},
+        )
+        return None
+
+
+def profile_handler(
+    get_correlation_id: Optional[Callable[[Any], Optional[str]]] = None,
+) -> Callable:
+    """
+    Decorator for the Lambda handlers that profiles the sampled invocations.
+    :param get_correlation_id (Optional(Callable)): Function that gets the
+        correlation ID of the logs from the event (the request ID if None).
+    """
+
+    def decorator(handler: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+        @functools.wraps(handler)
+        def wrapper(event: Any, context: Any) -> Any:
+            if not should_profile():
+                return handler(event, context)
+
+            correlation_id = (
+                (get_correlation_id and get_correlation_id(event))
+                or getattr(context, "aws_request_id", None)
+                or str(uuid4())
+            )
+            profiler = start_profiler(handler.__module__, correlation_id)
+            try:
+                return handler(event, context)
+            finally:
+                stop_and_save_profile(profiler)
+
+        return wrapper
+
+    return decorator
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware that profiles the sampled requests. The correlation ID
+    is read from the "correlation-id" header (added to the request when missing,
+    so the logs of the routes use the same one). The profiles are named after
+    the template of the matched route, not the raw path.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or not should_profile():
+            return await self.app(scope, receive, send)
+
+        headers = dict(scope["headers"])
+        correlation_id = headers.get(b"correlation-id", b"").decode("latin-1")
+        if not correlation_id:
+            correlation_id = str(uuid4())
+            scope = {
+                **scope,
+                "headers": [
+                    *scope["headers"],
+                    (b"correlation-id", correlation_id.encode("latin-1")),
+                ],
+            }
+
+        profiler = start_profiler(
+            f"{scope['method']} {UNMATCHED_ROUTE}", correlation_id
+        )
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            # The router adds the matched route to the scope (e.g. its template
+            # "/api/v1/recipes/{ulid}", so each ULID is not a different profile)
+            route = scope.get("route")
+            if route is not None:
+                profiler.profile.name = f"{scope['method']} {route.path}"
+            stop_and_save_profile(profiler)
@@ -0,0 +1,17 @@
+# Built-in imports
+from typing import Any
+
+# External imports
+from fastapi.responses import JSONResponse
+
+# Own imports
+from common.serialization import dumps, json_default  # noqa: F401 (re-exported)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    High-performance JSON response based on "orjson" (default for the FastAPI app).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
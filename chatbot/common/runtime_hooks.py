@@ -0,0 +1,82 @@
+################################################################################
+# Hooks for Lambda SnapStart (Python 3.12+ runtimes). The init phase runs once,
+# a snapshot of the memory is taken and the new execution environments are
+# restored from it. So the modules register here:
+#  - "before snapshot" hooks: do the expensive init work that is safe to share
+#    (imports, schemas, boto3 clients without connections).
+#  - "after restore" hooks: renew the state that must be unique per execution
+#    environment (connections, secrets and random seeds).
+# On runtimes without SnapStart (and locally) the hooks are only registered, and
+# <run_before_snapshot> and <run_after_restore> can simulate the cycle.
+################################################################################
+
+# Built-in imports
+import importlib
+import random
+from typing import Callable
+
+_before_snapshot_hooks: list[Callable[[], None]] = []
+_after_restore_hooks: list[Callable[[], None]] = []
+
+
+def before_snapshot(function: Callable[[], None]) -> Callable[[], None]:
+    """
+    Register a function to run before the snapshot is taken (usable as decorator).
+    :param function (Callable): Function without arguments.
+    """
+    _before_snapshot_hooks.append(function)
+    return function
+
+
+def after_restore(function: Callable[[], None]) -> Callable[[], None]:
+    """
+    Register a function to run after the snapshot is restored (usable as decorator).
+    :param function (Callable): Function without arguments.
+    """
+    _after_restore_hooks.append(function)
+    return function
+
+
+def preload(*module_names: str) -> None:
+    """
+    Import modules before the snapshot (e.g. the ones that are only imported on
+    first use to keep the regular cold starts fast), so they are in the snapshot.
+    :param module_names (str): Names of the modules to import.
+    """
+
+    @before_snapshot
+    def import_modules() -> None:
+        for module_name in module_names:
+            importlib.import_module(module_name)
+
+
+def run_before_snapshot() -> None:
+    """Run the "before snapshot" hooks (in the order they were registered)."""
+    for hook in _before_snapshot_hooks:
+        hook()
+
+
+def run_after_restore() -> None:
+    """Run the "after restore" hooks (in the order they were registered)."""
+    for hook in _after_restore_hooks:
+        hook()
+
+
+@after_restore
+def reseed_random() -> None:
+    """
+    Re-seed the "random" module, otherwise all the environments restored from the
+    same snapshot generate the same numbers (e.g. the same retry jitter). The ULIDs
+    use "os.urandom", which is already unique after a restore.
+    """
+    random.seed()
+
+
+try:
+    # Only available in the Lambda runtimes with SnapStart support
+    from snapshot_restore_py import register_after_restore, register_before_snapshot
+except ImportError:
+    pass
+else:
+    register_before_snapshot(run_before_snapshot)
+    register_after_restore(run_after_restore)
@@ -1,17 +1,42 @@
 ################################################################################
 # !!! IMPORTANT !!!
 #  This __init__.py allows to load the relevant classes from the State Machine.
-#  By importing this file, we leverage "globals" and "getattr" to dynamically
-#  execute the Step Function's inner Lambda Functions classes.
+#  The classes are registered by name and only imported the first time that
+#  a step uses them, so each step does not pay the imports (and the I/O) of
+#  the rest of the steps (e.g. "ProcessText" never loads the Meta API client).
 ################################################################################
 
-# Validation
-from state_machine.utils.validate_message import ValidateMessage  # noqa
+# Built-in imports
+import importlib
 
-# Processing
-from state_machine.processing.process_text import ProcessText  # noqa
-from state_machine.processing.send_message import SendMessage  # noqa
+# Own imports
+from common.runtime_hooks import before_snapshot
 
-# Utils
-from state_machine.utils.success import Success  # noqa
-from state_machine.utils.failure import Failure  # noqa
+# Modules of the Step Function's inner Lambda Functions classes
+STEP_CLASSES = {
+    # Validation
+    "ValidateMessage": "state_machine.utils.validate_message",
+    # Processing
+    "ProcessText": "state_machine.processing.process_text",
+    "SendMessage": "state_machine.processing.send_message",
+    # Utils
+    "Success": "state_machine.utils.success",
+    "Failure": "state_machine.utils.failure",
+}
+
+
+def get_step_class(class_name: str) -> type:
+    """
+    Import (only once) and return a registered class of the State Machine.
+    :param class_name (str): Name of the class (e.g. "ProcessText").
+    :raises KeyError: When the class is not registered.
+    """
+    module = importlib.import_module(STEP_CLASSES[class_name])
+    return getattr(module, class_name)
+
+
+@before_snapshot
+def preload_step_classes() -> None:
+    """Import all the steps before a SnapStart snapshot (shared by all the steps)."""
+    for class_name in STEP_CLASSES:
+        get_step_class(class_name)
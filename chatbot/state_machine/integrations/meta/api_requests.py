@@ -1,6 +1,7 @@
 # Built-in imports
 import os
 import json
+from functools import lru_cache
 from typing import Optional
 
 # External imports
@@ -11,6 +12,7 @@ import requests
 # Own imports
 from common.helpers.secrets_helper import SecretsHelper
 from common.logger import custom_logger
+from common.runtime_hooks import after_restore, before_snapshot
 from state_machine.integrations.meta.api_utils import (
     get_api_endpoint,
     get_api_headers,
@@ -20,7 +22,21 @@ from state_machine.integrations.meta.schemas import MetaPostMessageModel
 
 SECRET_NAME = os.environ["SECRET_NAME"]
 secrets_helper = SecretsHelper(SECRET_NAME)
-auth_token = secrets_helper.get_secret_value("META_TOKEN")
+
+
+@lru_cache(maxsize=1)
+def get_meta_secret() -> dict:
+    """
+    Get the Meta secret from Secrets Manager on first use (not at import time),
+    and keep it for the rest of the invocations of the container.
+    """
+    return secrets_helper.get_secret_value()
+
+
+# SnapStart: the secret is never kept in the snapshot, and the restored
+# environments fetch the current value (e.g. after a token rotation)
+before_snapshot(get_meta_secret.cache_clear)
+after_restore(get_meta_secret.cache_clear)
 
 
 class MetaAPI:
@@ -37,12 +53,12 @@ class MetaAPI:
         Method to load Meta configurations from Secrets Manager and initialize endpoint and headers.
         """
         self.logger.debug("Loading Meta configurations from Secrets Manager...")
-        self.meta_secret_json = secrets_helper.get_secret_value()
+        self.meta_secret_json = get_meta_secret()
         _meta_token = self.meta_secret_json.get("META_TOKEN")
         _meta_from_phone_number_id = self.meta_secret_json.get(
             "META_FROM_PHONE_NUMBER_ID"
         )
-        self.api_headers = get_api_headers(bearer_token=auth_token)
+        self.api_headers = get_api_headers(bearer_token=_meta_token)
         self.api_endpoint = get_api_endpoint(f"{_meta_from_phone_number_id}/messages")
 
     def post_message(
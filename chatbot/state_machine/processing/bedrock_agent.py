@@ -1,18 +1,37 @@
 # Built-in imports
 import os
-import boto3
+
+# External imports
+from botocore.config import Config
 
 # Own imports
+from common.helpers.aws_clients import LazyClient
 from common.logger import custom_logger
+from common.runtime_hooks import before_snapshot
 
 
 ENVIRONMENT = os.environ.get("ENVIRONMENT")
 
 logger = custom_logger()
 
-# Create a bedrock runtime client
-bedrock_agent_runtime_client = boto3.client("bedrock-agent-runtime")
-ssm_client = boto3.client("ssm")
+# Agent responses are streamed after the whole orchestration (longer read timeout)
+BEDROCK_AGENT_CONFIG = Config(read_timeout=60)
+
+# Create a bedrock runtime client (created on first use)
+bedrock_agent_runtime_client = LazyClient(
+    "bedrock-agent-runtime", config=BEDROCK_AGENT_CONFIG
+)
+ssm_client = LazyClient("ssm")
+
+
+@before_snapshot
+def prewarm_clients() -> None:
+    """
+    Create the clients before a SnapStart snapshot. The SSM parameters are not
+    read here, so the restored environments always use the current agent alias.
+    """
+    bedrock_agent_runtime_client.client
+    ssm_client.client
 
 
 def get_ssm_parameter(parameter_name):
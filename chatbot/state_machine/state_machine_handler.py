@@ -1,9 +1,13 @@
+# Built-in imports
+from typing import Optional
+
 # External imports
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
 # Own imports
-from state_machine.__init__ import *  # noqa NOSONAR
+from common.profiler import profile_handler
+from state_machine import get_step_class
 
 
 logger = Logger(
@@ -13,7 +17,20 @@ logger = Logger(
 )
 
 
+def get_correlation_id(event: dict) -> Optional[str]:
+    """Correlation ID of the message (from the step or the DynamoDB Stream)."""
+    main_event = event.get("event") or {}
+    return main_event.get("correlation_id") or (
+        main_event.get("input", {})
+        .get("dynamodb", {})
+        .get("NewImage", {})
+        .get("correlation_id", {})
+        .get("S")
+    )
+
+
 @logger.inject_lambda_context(log_event=True)
+@profile_handler(get_correlation_id)
 def lambda_handler(event: dict, context: LambdaContext):
     main_event = {}
     try:
@@ -27,7 +44,7 @@ def lambda_handler(event: dict, context: LambdaContext):
 
         if class_name is not None and method_name is not None:
             # Dynamically load and initialize the target class at runtime
-            target_class = globals()[class_name]
+            target_class = get_step_class(class_name)
             target_instance = target_class(main_event)
             logger.debug(f"dynamically loaded target_instance: {target_instance}")
 
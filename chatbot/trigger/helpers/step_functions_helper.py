@@ -2,7 +2,6 @@
 import time
 import os
 import json
-import boto3
 
 # External imports
 from aws_lambda_powertools import Logger
@@ -12,10 +11,13 @@ from aws_lambda_powertools.utilities.data_classes.dynamo_db_stream_event import
 
 # Own imports
 from common.logger import custom_logger
+from common.helpers.aws_clients import LazyClient
+from common.runtime_hooks import before_snapshot
 
 LOGGER = custom_logger()
 
-step_function_client = boto3.client("stepfunctions")
+step_function_client = LazyClient("stepfunctions")
+before_snapshot(lambda: step_function_client.client)
 
 
 def trigger_sm(record: DynamoDBRecord, logger: Logger = None) -> str:
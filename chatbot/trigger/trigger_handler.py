@@ -2,6 +2,9 @@
 # Lambda Function that triggers receives the event and triggers the State Machine
 ################################################################################
 
+# Built-in imports
+from typing import Optional
+
 # External imports
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.utilities.typing import LambdaContext
@@ -13,6 +16,7 @@ from aws_lambda_powertools.utilities.data_classes.dynamo_db_stream_event import
 
 # Own imports
 from common.logger import custom_logger
+from common.profiler import profile_handler
 from trigger.helpers.step_functions_helper import trigger_sm  # noqa
 
 logger = custom_logger()
@@ -24,7 +28,20 @@ def send_message_to_step_function(record: DynamoDBRecord) -> None:
     logger.info(f"State Machine execution_id: {execution_id}")
 
 
+def get_correlation_id(event: dict) -> Optional[str]:
+    """Correlation ID of the first message of the DynamoDB Stream batch."""
+    records = event.get("Records") or [{}]
+    return (
+        records[0]
+        .get("dynamodb", {})
+        .get("NewImage", {})
+        .get("correlation_id", {})
+        .get("S")
+    )
+
+
 @logger.inject_lambda_context(log_event=True)
+@profile_handler(get_correlation_id)
 @event_source(data_class=DynamoDBStreamEvent)
 def lambda_handler(event: DynamoDBStreamEvent, context: LambdaContext):
     logger.info("Starting message processing from DynamoDB Stream")
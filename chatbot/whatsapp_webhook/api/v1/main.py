@@ -10,6 +10,9 @@ from mangum import Mangum
 from fastapi import FastAPI
 
 # Own imports
+from common.capacity import log_capacity_metrics
+from common.profiler import ProfilingMiddleware
+from common.responses import FastJSONResponse
 from whatsapp_webhook.api.v1.routers import webhook
 
 # Environment used to dynamically load the FastAPI docs with stages
@@ -24,10 +27,14 @@ app = FastAPI(
     root_path=f"/{ENVIRONMENT}" if ENVIRONMENT else None,
     docs_url="/api/v1/docs",
     openapi_url="/api/v1/docs/openapi.json",
+    default_response_class=FastJSONResponse,
 )
 
 
 app.include_router(webhook.router, prefix=API_PREFIX)
 
+# Opt-in sampling profiler of a fraction of the requests
+app.add_middleware(ProfilingMiddleware)
+
 # This is the Lambda Function's entrypoint (handler)
-handler = Mangum(app)
+handler = log_capacity_metrics(Mangum(app))
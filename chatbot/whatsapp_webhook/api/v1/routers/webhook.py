@@ -8,10 +8,12 @@ from uuid import uuid4
 from fastapi import APIRouter, Header, Query, Request, Response, status
 
 # Own imports
+from common.capacity import access_pattern
 from common.models.text_message_model import TextMessageModel
 from common.logger import custom_logger
 from common.helpers.dynamodb_helper import DynamoDBHelper
 from common.helpers.secrets_helper import SecretsHelper
+from common.runtime_hooks import before_snapshot
 
 # Initialize Secrets Manager Helper
 SECRET_NAME = os.environ["SECRET_NAME"]
@@ -23,6 +25,13 @@ ENDPOINT_URL = os.environ.get("ENDPOINT_URL")  # Used for local testing
 dynamodb_helper = DynamoDBHelper(table_name=DYNAMODB_TABLE, endpoint_url=ENDPOINT_URL)
 
 
+@before_snapshot
+def prewarm_clients() -> None:
+    """Create the clients before a SnapStart snapshot (the secret is not read)."""
+    dynamodb_helper.prewarm()
+    secrets_helper.client_sm.client
+
+
 router = APIRouter()
 logger = custom_logger()
 
@@ -64,7 +73,8 @@ async def post_chatbot_webhook(
     input_body: dict,
 ):
     try:
-        correlation_id = str(uuid4())
+        # Same correlation ID of the request profile (when it is profiled)
+        correlation_id = request.headers.get("correlation-id") or str(uuid4())
         logger.append_keys(correlation_id=correlation_id)
         logger.info(
             input_body, message_details="Received body in post_chatbot_webhook()"
@@ -108,7 +118,8 @@ async def post_chatbot_webhook(
 
         # Save the message to DynamoDB
         if message_item:
-            result = dynamodb_helper.put_item(message_item.model_dump())
+            with access_pattern("webhook_put_message"):
+                result = dynamodb_helper.put_item(message_item.model_dump())
             logger.debug(result, message_details="DynamoDB put_item() result")
 
         result = {"message": "ok", "details": "Received message"}
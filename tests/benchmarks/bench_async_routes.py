@@ -0,0 +1,111 @@
+################################################################################
+# Benchmark for the throughput of the async routes with concurrent clients.
+# Usage: python tests/benchmarks/bench_async_routes.py
+################################################################################
+
+# Built-in imports
+import asyncio
+import functools
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+# Environment required before importing the backend modules (no real AWS calls)
+os.environ.setdefault("DYNAMODB_TABLE", "recipes-table-bench")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+# External imports
+import boto3  # noqa: E402
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from moto import mock_dynamodb  # noqa: E402
+
+# Own imports
+from access_patterns import recipes as recipes_access_pattern  # noqa: E402
+from access_patterns.recipes import Recipes  # noqa: E402
+from api.v1.main import app  # noqa: E402
+
+CONCURRENT_CLIENTS = (1, 10, 100)
+TOTAL_REQUESTS = 200
+USER_EMAIL = "rick@example.com"
+
+# Round trip of a DynamoDB "GetItem" in the same region (moto answers in-process)
+SIMULATED_LATENCY_SECONDS = 0.01
+
+logging.getLogger("recipe-app").setLevel("CRITICAL")  # Avoid measuring logging I/O
+
+# Previous implementation: "async def" route with the blocking access pattern
+blocking_app = FastAPI()
+
+
+@blocking_app.get("/api/v1/recipes/{recipe_id}")
+async def read_recipe_item_blocking(user_email: str, recipe_id: str):
+    return Recipes(user_email=user_email).get_recipe_by_ulid(ulid=recipe_id)
+
+
+def add_latency(function):
+    """Wrap a DynamoDB helper method with the latency of the network call."""
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        time.sleep(SIMULATED_LATENCY_SECONDS)
+        return function(*args, **kwargs)
+
+    return wrapper
+
+
+def create_table_and_recipe() -> str:
+    """Create the mocked table with a single RECIPE item and return its ULID."""
+    boto3.resource("dynamodb").create_table(
+        TableName=os.environ["DYNAMODB_TABLE"],
+        KeySchema=[
+            {"AttributeName": "PK", "KeyType": "HASH"},
+            {"AttributeName": "SK", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "PK", "AttributeType": "S"},
+            {"AttributeName": "SK", "AttributeType": "S"},
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    recipe = Recipes(user_email=USER_EMAIL).create_recipe(
+        {"user_email": USER_EMAIL, "recipe_title": "Pasta", "recipe_date": "2024-08-14"}
+    )
+    return recipe.SK.split("#", 1)[1]
+
+
+async def run_clients(asgi_app: FastAPI, ulid: str, clients: int) -> float:
+    """Send <TOTAL_REQUESTS> from concurrent clients and return the requests/s."""
+    transport = httpx.ASGITransport(app=asgi_app)
+    url = f"/api/v1/recipes/{ulid}"
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+
+        async def client() -> None:
+            for _ in range(TOTAL_REQUESTS // clients):
+                response = await http.get(url, params={"user_email": USER_EMAIL})
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(clients)))
+        return (TOTAL_REQUESTS // clients * clients) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    with mock_dynamodb():
+        ulid = create_table_and_recipe()
+        helper = recipes_access_pattern.dynamodb_helper
+        helper.get_item_by_pk_and_sk = add_latency(helper.get_item_by_pk_and_sk)
+
+        for name, asgi_app in (
+            ("blocking (boto3 on the event loop)", blocking_app),
+            ("async (bounded thread pool)", app),
+        ):
+            for clients in CONCURRENT_CLIENTS:
+                throughput = asyncio.run(run_clients(asgi_app, ulid, clients))
+                print(f"{name} with {clients} clients: {throughput:.0f} requests/s")
@@ -0,0 +1,124 @@
+################################################################################
+# Benchmark for the init time and the call latency of the boto3 clients.
+# Usage: python tests/benchmarks/bench_aws_clients.py
+################################################################################
+
+# Built-in imports
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+# Environment required before creating the clients (no real AWS calls)
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+# External imports
+import boto3  # noqa: E402
+
+# Own imports
+from helpers import aws_clients  # noqa: E402
+from helpers.dynamodb_helper import DynamoDBHelper  # noqa: E402
+
+HELPERS_PER_CONTAINER = 3  # e.g. recipes, imports and META items
+CONCURRENT_CALLERS = 16
+CALLS_PER_CALLER = 50
+
+# Service time of the local DynamoDB-like endpoint
+SERVER_LATENCY_SECONDS = 0.02
+
+
+class DynamoDBHandler(BaseHTTPRequestHandler):
+    """Answers every DynamoDB call with an empty result (keep-alive enabled)."""
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self) -> None:
+        DynamoDBHandler.connections += 1
+        super().setup()
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(SERVER_LATENCY_SECONDS)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-amz-json-1.0")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def legacy_clients(endpoint_url: str) -> list:
+    """Previous helpers: default client and resource (plus Table) per helper."""
+    boto3.DEFAULT_SESSION = None
+    clients = []
+    for _ in range(HELPERS_PER_CONTAINER):
+        client = boto3.client("dynamodb", endpoint_url=endpoint_url)
+        boto3.resource("dynamodb", endpoint_url=endpoint_url).Table("recipes")
+        clients.append(client)
+    return clients
+
+
+def factory_clients(endpoint_url: str) -> list:
+    """Helpers with the shared client factory (only the used client is created)."""
+    aws_clients._session = None
+    aws_clients._clients.clear()
+    aws_clients._resources.clear()
+    helpers = [
+        DynamoDBHelper("recipes", endpoint_url) for _ in range(HELPERS_PER_CONTAINER)
+    ]
+    return [helper.dynamodb_client for helper in helpers]
+
+
+def measure_latencies(client) -> list[float]:
+    """Call "GetItem" from concurrent threads and return each call latency."""
+
+    def caller() -> list[float]:
+        latencies = []
+        for _ in range(CALLS_PER_CALLER):
+            start = time.perf_counter()
+            client.get_item(
+                TableName="recipes",
+                Key={"PK": {"S": "USER#rick@example.com"}, "SK": {"S": "RECIPE#1"}},
+            )
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    with ThreadPoolExecutor(max_workers=CONCURRENT_CALLERS) as executor:
+        futures = [executor.submit(caller) for _ in range(CONCURRENT_CALLERS)]
+        return [latency for future in futures for latency in future.result()]
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DynamoDBHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint_url = f"http://127.0.0.1:{server.server_port}"
+
+    for name, create_clients in (
+        ("legacy (client + resource per helper)", legacy_clients),
+        ("factory (shared session, tuned config)", factory_clients),
+    ):
+        DynamoDBHandler.connections = 0
+        start = time.perf_counter()
+        clients = create_clients(endpoint_url)
+        init_ms = (time.perf_counter() - start) * 1000
+
+        latencies = measure_latencies(clients[0])
+        p50_ms = statistics.median(latencies) * 1000
+        p99_ms = statistics.quantiles(latencies, n=100)[98] * 1000
+        print(
+            f"{name}: init {init_ms:.0f} ms, GetItem p50 {p50_ms:.1f} ms, "
+            f"p99 {p99_ms:.1f} ms, {DynamoDBHandler.connections} TCP connections "
+            f"opened ({CONCURRENT_CALLERS} concurrent callers)"
+        )
+
+    server.shutdown()
@@ -0,0 +1,137 @@
+################################################################################
+# Benchmark for the per-invocation overhead and the cold start of the native
+# handler compared to the FastAPI app (Mangum) for the same API-GW events.
+# Usage: python tests/benchmarks/bench_native_handler.py
+################################################################################
+
+# Built-in imports
+import importlib.util
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.insert(0, os.path.join(ROOT_DIR, "backend"))
+
+# Environment required before importing the backend modules (no real AWS calls)
+os.environ.setdefault("DYNAMODB_TABLE", "recipes-table-bench")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+# External imports
+import boto3  # noqa: E402
+from moto import mock_dynamodb  # noqa: E402
+
+# Own imports
+from access_patterns.recipes import Recipes  # noqa: E402
+from api.v1 import native_handler  # noqa: E402
+from api.v1.main import handler as fastapi_handler  # noqa: E402
+
+INVOCATIONS = 500
+USER_EMAIL = "rick@example.com"
+
+logging.getLogger("recipe-app").setLevel("CRITICAL")  # Avoid measuring logging I/O
+
+spec = importlib.util.spec_from_file_location(
+    "cold_start_profiler", os.path.join(ROOT_DIR, "tools", "cold_start_profiler.py")
+)
+cold_start_profiler = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(cold_start_profiler)
+
+
+def build_event(method: str, resource: str, recipe_id: str = "", body=None) -> dict:
+    """Build an API-GW proxy event (REST API) for the RECIPE endpoints."""
+    path_parameters = {"recipe_id": recipe_id} if recipe_id else None
+    path = resource.format(**(path_parameters or {}))
+    query = {"user_email": USER_EMAIL}
+    return {
+        "resource": resource,
+        "path": path,
+        "httpMethod": method,
+        "headers": {"Accept": "application/json"},
+        "multiValueHeaders": {"Accept": ["application/json"]},
+        "queryStringParameters": query,
+        "multiValueQueryStringParameters": {"user_email": [USER_EMAIL]},
+        "pathParameters": path_parameters,
+        "requestContext": {"resourcePath": resource, "httpMethod": method},
+        "body": json.dumps(body) if body is not None else None,
+        "isBase64Encoded": False,
+    }
+
+
+def create_table_and_recipes(count: int = 20) -> str:
+    """Create the mocked table with RECIPE items and return the ULID of one."""
+    boto3.resource("dynamodb").create_table(
+        TableName=os.environ["DYNAMODB_TABLE"],
+        KeySchema=[
+            {"AttributeName": "PK", "KeyType": "HASH"},
+            {"AttributeName": "SK", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "PK", "AttributeType": "S"},
+            {"AttributeName": "SK", "AttributeType": "S"},
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    recipes = Recipes(user_email=USER_EMAIL)
+    for index in range(count):
+        recipe = recipes.create_recipe(
+            {
+                "user_email": USER_EMAIL,
+                "recipe_title": f"Pasta {index}",
+                "recipe_date": "2024-08-14",
+            }
+        )
+    return recipe.SK.split("#", 1)[1]
+
+
+def measure_invocations(handler, event: dict) -> list[float]:
+    """Invoke a handler <INVOCATIONS> times and return each latency (seconds)."""
+    latencies = []
+    for _ in range(INVOCATIONS):
+        start = time.perf_counter()
+        response = handler(event, None)
+        latencies.append(time.perf_counter() - start)
+        assert response["statusCode"] == 200, response
+    return latencies
+
+
+if __name__ == "__main__":
+    with mock_dynamodb():
+        ulid = create_table_and_recipes()
+        events = {
+            "GET /recipes/{recipe_id}": build_event(
+                "GET", "/api/v1/recipes/{recipe_id}", ulid
+            ),
+            "GET /recipes": build_event("GET", "/api/v1/recipes"),
+            "PATCH /recipes/{recipe_id}": build_event(
+                "PATCH", "/api/v1/recipes/{recipe_id}", ulid, {"recipe_title": "Pasta"}
+            ),
+        }
+        for name, event in events.items():
+            results = {}
+            for handler_name, handler in (
+                ("fastapi", fastapi_handler),
+                ("native", native_handler.handler),
+            ):
+                handler(event, None)  # Warm up (imports, schemas and clients)
+                results[handler_name] = statistics.median(
+                    measure_invocations(handler, event)
+                )
+            overhead_ms = (results["fastapi"] - results["native"]) * 1000
+            print(
+                f"{name}: fastapi p50 {results['fastapi'] * 1000:.2f} ms, "
+                f"native p50 {results['native'] * 1000:.2f} ms "
+                f"({overhead_ms:.2f} ms less per invocation)"
+            )
+
+    for entry_point in ("backend-api", "backend-api-native"):
+        profile = cold_start_profiler.profile_entry_point(entry_point)
+        print(
+            f"{entry_point} cold start: init {profile.init_ms:.0f} ms "
+            f"({len(profile.modules)} modules imported)"
+        )
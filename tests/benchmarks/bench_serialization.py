@@ -0,0 +1,93 @@
+################################################################################
+# Benchmark for the serialization time of the responses, through the real
+# routes of the FastAPI app (so the "jsonable_encoder" of FastAPI is included
+# whenever a route returns an object instead of a response).
+# Usage: python tests/benchmarks/bench_serialization.py
+################################################################################
+
+# Built-in imports
+import io
+import logging
+import os
+import sys
+import timeit
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+# Environment required before importing the backend modules (no real AWS calls)
+os.environ.setdefault("DYNAMODB_TABLE", "recipes-table-bench")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+# External imports
+from fastapi.testclient import TestClient  # noqa: E402
+
+# Own imports
+from access_patterns.async_recipes import AsyncRecipes  # noqa: E402
+from api.v1.main import app  # noqa: E402
+from api.v1.routers import recipes as recipes_router  # noqa: E402
+from models.recipes import RecipeBatchCreateResultModel  # noqa: E402
+
+RECIPE_COUNTS = (10, 100, 1_000)
+USER_EMAIL = "rick@example.com"
+
+logging.getLogger("recipe-app").setLevel("CRITICAL")  # Avoid measuring logging I/O
+
+
+def build_payload(count: int) -> dict:
+    """Payload of the "POST /recipes:batchCreate" route."""
+    return {
+        "user_email": USER_EMAIL,
+        "recipes": [
+            {
+                "recipe_title": f"Recipe {index}",
+                "recipe_details": "Boil water and add the pasta. " * 8,
+                "recipe_date": "2024-08-14",
+            }
+            for index in range(count)
+        ],
+    }
+
+
+async def create_recipes(self, recipes_data: list[dict], validated: bool = False):
+    """Access pattern without DynamoDB (only the response path is measured)."""
+    return [
+        RecipeBatchCreateResultModel(
+            index=index,
+            status_code=201,
+            recipe_id=f"01J5BQ9ZKX8T3M7C2V4N6P{index:06d}",
+        )
+        for index in range(len(recipes_data))
+    ]
+
+
+def return_content(content):
+    """Previous implementation: the routes returned the objects (encoded by FastAPI)."""
+    return content
+
+
+if __name__ == "__main__":
+    client = TestClient(app)
+    with mock.patch.object(AsyncRecipes, "create_recipes", create_recipes):
+        for count in RECIPE_COUNTS:
+            payload = build_payload(count)
+            number = max(1, 1_000 // count)
+            print(f"--> POST /api/v1/recipes:batchCreate with {count} recipes")
+            for name, response_class in (
+                ("object (jsonable_encoder + FastJSONResponse)", return_content),
+                ("FastJSONResponse(content)", recipes_router.FastJSONResponse),
+            ):
+                # The EMF records of the latency metrics are printed to stdout
+                with mock.patch.object(
+                    recipes_router, "FastJSONResponse", response_class
+                ), redirect_stdout(io.StringIO()):
+                    seconds = timeit.timeit(
+                        lambda: client.post(
+                            "/api/v1/recipes:batchCreate", json=payload
+                        ),
+                        number=number,
+                    )
+                print(f"{name}: {seconds / number * 1e3:.3f} ms")
@@ -0,0 +1,58 @@
+################################################################################
+# Microbenchmark for the per-request validation cost of the RECIPES payloads.
+# Usage: python tests/benchmarks/bench_validation.py
+################################################################################
+
+# Built-in imports
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+# Own imports
+from api.v1.schemas.schema import Schema  # noqa: E402
+from api.v1.services.validator import validate_json, validate_payload  # noqa: E402
+from common.enums import JSONSchemaType  # noqa: E402
+from common.logger import custom_logger  # noqa: E402
+from models.recipes import RecipeModel  # noqa: E402
+
+ITERATIONS = 2000
+PAYLOAD = {
+    "user_email": "rick@example.com",
+    "recipe_title": "Pasta",
+    "recipe_details": "Boil water and add the pasta",
+    "recipe_date": "2024-08-14",
+}
+MODEL_DATA = {
+    **PAYLOAD,
+    "PK": "USER#rick@example.com",
+    "SK": "RECIPE#01J5BQ9ZKX8T3M7C2V4N6P8R0S",
+    "created_at": "2024-08-14T10:00:00",
+    "updated_at": "2024-08-14T10:00:00",
+}
+logger = custom_logger()
+logger.setLevel("CRITICAL")  # Avoid measuring the logging I/O
+
+
+def legacy_validation() -> None:
+    """Validation as previously done on every POST request."""
+    recipes_schema = Schema(JSONSchemaType.RECIPES, logger=logger).get_schema()
+    validate_json(data=PAYLOAD, json_schema=recipes_schema, logger=logger)
+    RecipeModel(**MODEL_DATA)
+
+
+def registry_validation() -> None:
+    """Validation with the precompiled validator registry (single pass)."""
+    validate_payload(PAYLOAD, JSONSchemaType.RECIPES, logger=logger)
+    RecipeModel.model_construct(**MODEL_DATA)
+
+
+if __name__ == "__main__":
+    for name, function in (
+        ("legacy (schema load + jsonschema.validate + pydantic)", legacy_validation),
+        ("registry (precompiled validator, single pass)", registry_validation),
+    ):
+        function()  # Warm-up (loads and compiles the cached objects)
+        seconds = timeit.timeit(function, number=ITERATIONS)
+        print(f"{name}: {seconds / ITERATIONS * 1e6:.1f} us/request")
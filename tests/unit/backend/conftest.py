@@ -0,0 +1,67 @@
+# Built-in imports
+import os
+
+# External imports
+import boto3
+import pytest
+from moto import mock_dynamodb, mock_s3
+
+# Environment required before importing the backend modules (no real AWS calls)
+TABLE_NAME = "recipes-table-test"
+BUCKET_NAME = "recipes-imports-test"
+os.environ["DYNAMODB_TABLE"] = TABLE_NAME
+os.environ["IMPORTS_BUCKET"] = BUCKET_NAME
+os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+os.environ["AWS_SECURITY_TOKEN"] = "testing"
+os.environ["AWS_SESSION_TOKEN"] = "testing"
+
+
+@pytest.fixture
+def dynamodb_table():
+    """Create a mocked DynamoDB table with the same keys as the backend table."""
+    with mock_dynamodb():
+        dynamodb_resource = boto3.resource("dynamodb")
+        table = dynamodb_resource.create_table(
+            TableName=TABLE_NAME,
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+                {"AttributeName": "updated_at", "AttributeType": "S"},
+                {"AttributeName": "recipe_date", "AttributeType": "S"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "GSI-UpdatedAt",
+                    "KeySchema": [
+                        {"AttributeName": "PK", "KeyType": "HASH"},
+                        {"AttributeName": "updated_at", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                },
+                {
+                    "IndexName": "GSI-RecipeDate",
+                    "KeySchema": [
+                        {"AttributeName": "PK", "KeyType": "HASH"},
+                        {"AttributeName": "recipe_date", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                },
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield table
+
+
+@pytest.fixture
+def imports_bucket():
+    """Create a mocked S3 bucket for the uploaded RECIPE import files."""
+    with mock_s3():
+        s3_resource = boto3.resource("s3")
+        bucket = s3_resource.create_bucket(Bucket=BUCKET_NAME)
+        yield bucket
@@ -0,0 +1,60 @@
+# Built-in imports
+import asyncio
+import contextvars
+import threading
+import time
+
+# Own imports
+from access_patterns.async_recipes import AsyncRecipes
+from helpers.async_dynamodb_helper import run_in_executor
+
+USER_EMAIL = "rick@example.com"
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def test_blocking_calls_do_not_block_the_event_loop():
+    def blocking_call() -> tuple:
+        time.sleep(0.2)
+        return request_id.get(), threading.current_thread().name
+
+    async def handle_request(index: int) -> tuple:
+        request_id.set(index)
+        return await run_in_executor(blocking_call)
+
+    async def main() -> tuple:
+        start = time.perf_counter()
+        results = await asyncio.gather(*(handle_request(index) for index in range(5)))
+        return results, time.perf_counter() - start
+
+    results, elapsed = asyncio.run(main())
+
+    # The calls overlap, and each one sees the context of its own request
+    assert elapsed < 0.6
+    assert [result[0] for result in results] == list(range(5))
+    assert all(result[1].startswith("blocking-io") for result in results)
+
+
+def test_async_recipes_access_pattern(dynamodb_table):
+    recipes = AsyncRecipes(user_email=USER_EMAIL)
+
+    async def main() -> tuple:
+        created = await asyncio.gather(
+            *(
+                recipes.create_recipe(
+                    {
+                        "user_email": USER_EMAIL,
+                        "recipe_title": title,
+                        "recipe_date": "2024-01-01",
+                    }
+                )
+                for title in ("Arepas", "Pasta")
+            )
+        )
+        ulid = created[0].SK.split("#", 1)[1]
+        await recipes.patch_recipe(ulid, {"recipe_title": "Arepas!"})
+        return await recipes.get_recipe_by_ulid(ulid), await recipes.get_all_recipes()
+
+    recipe, all_recipes = asyncio.run(main())
+    assert recipe.recipe_title == "Arepas!"
+    assert sorted(item.recipe_title for item in all_recipes) == ["Arepas!", "Pasta"]
@@ -0,0 +1,43 @@
+# External imports
+from botocore.config import Config
+
+# Own imports
+from helpers import aws_clients
+from helpers.aws_clients import LazyClient, get_client, get_resource
+from helpers.dynamodb_helper import DynamoDBHelper
+
+LONG_READS_CONFIG = Config(read_timeout=60)
+
+
+def test_clients_are_shared_and_tuned():
+    client = get_client("dynamodb")
+    assert get_client("dynamodb") is client
+    assert DynamoDBHelper("any-table").dynamodb_client is client
+
+    config = client.meta.config
+    assert config.max_pool_connections == aws_clients.MAX_POOL_CONNECTIONS
+    assert config.tcp_keepalive is True
+    assert config.retries == {"mode": "adaptive", "total_max_attempts": 3}
+
+    # Resources use the same settings (and the same session)
+    resource_config = get_resource("dynamodb").meta.client.meta.config
+    assert resource_config.connect_timeout == aws_clients.CONNECT_TIMEOUT_SECONDS
+
+
+def test_lazy_clients_are_created_on_first_use(mocker):
+    mocker.patch.object(aws_clients, "_clients", {})
+    lazy_client = LazyClient("stepfunctions", config=LONG_READS_CONFIG)
+    assert aws_clients._clients == {}
+
+    assert lazy_client.meta.service_model.service_name == "stepfunctions"
+    assert lazy_client.meta.config.read_timeout == 60
+    assert lazy_client.meta.config.tcp_keepalive is True
+    assert len(aws_clients._clients) == 1
+
+
+def test_configs_with_the_same_settings_share_the_client(mocker):
+    mocker.patch.object(aws_clients, "_clients", {})
+    client = get_client("stepfunctions", config=LONG_READS_CONFIG)
+    assert get_client("stepfunctions", config=Config(read_timeout=60)) is client
+    assert get_client("stepfunctions", config=Config(read_timeout=30)) is not client
+    assert len(aws_clients._clients) == 2
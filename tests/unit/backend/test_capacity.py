@@ -0,0 +1,120 @@
+# Built-in imports
+import asyncio
+import json
+
+# External imports
+import pytest
+
+# Own imports
+from access_patterns.async_recipes import AsyncRecipes
+from access_patterns.recipes import Recipes
+from api.v1 import native_handler
+from common import capacity
+
+USER_EMAIL = "rick@example.com"
+
+
+@pytest.fixture
+def recipes(dynamodb_table) -> Recipes:
+    return Recipes(user_email=USER_EMAIL, use_cache=False)
+
+
+def read_capacity_records(output: str) -> list[dict]:
+    """Get the capacity EMF records from the stdout (the logs are also printed there)."""
+    records = [json.loads(line) for line in output.splitlines() if '"_aws"' in line]
+    return [record for record in records if "access_pattern" in record]
+
+
+def test_capacity_is_accounted_per_access_pattern(recipes, capsys):
+    with capacity.capacity_accounting():
+        results = recipes.create_recipes(
+            [
+                {
+                    "user_email": USER_EMAIL,
+                    "recipe_title": f"Pasta {index}",
+                    "recipe_date": "2024-08-14",
+                }
+                for index in range(30)
+            ]
+        )
+        recipes.get_all_recipes()
+        pages = list(recipes.iter_recipe_pages())
+        recipes.patch_recipe(
+            ulid=results[0].recipe_id, recipe_data={"recipe_title": "Arepas"}
+        )
+        asyncio.run(AsyncRecipes(user_email=USER_EMAIL).get_all_recipes())
+        usage = capacity.get_capacity_usage()
+
+    assert set(usage) == {
+        "create_recipes",
+        "get_all_recipes",
+        "iter_recipe_pages",
+        "patch_recipe",
+    }
+    # Batch writes (2 chunks) and the META item update are in the same pattern
+    assert usage["create_recipes"].items == 31
+    assert usage["create_recipes"].write_capacity_units > 0
+    # The RECIPE item update (returns the new item) and the META item update
+    assert usage["patch_recipe"].items == 2
+    assert usage["patch_recipe"].requests == 2
+    # The sync and the async reads (and the streamed pages) are accounted
+    assert usage["get_all_recipes"].items == 60
+    assert usage["get_all_recipes"].pages == 2
+    assert usage["get_all_recipes"].read_capacity_units > 0
+    assert usage["iter_recipe_pages"].pages == len(pages)
+
+    # The metrics are emitted at the end of the invocation (and not kept after it)
+    records = read_capacity_records(capsys.readouterr().out)
+    assert {record["access_pattern"] for record in records} == set(usage)
+    assert capacity.get_capacity_usage() == {}
+
+
+def test_calls_outside_of_access_patterns_use_the_operation(recipes):
+    with capacity.capacity_accounting():
+        recipes.get_collection_etag()
+        with capacity.access_pattern("outer"):
+            recipes.get_recipe_by_ulid("missing")
+        capacity.record_consumed_capacity(
+            "put_item",
+            {"ConsumedCapacity": {"CapacityUnits": 1.0}},
+            items=1,
+            write=True,
+        )
+        usage = capacity.get_capacity_usage()
+
+    assert usage["get_collection_etag"].requests == 1
+    assert usage["outer"].items == 0
+    assert usage["put_item"].write_capacity_units == 1.0
+
+
+def test_calls_outside_of_an_invocation_are_not_recorded(recipes):
+    recipes.get_collection_etag()
+    assert capacity.get_capacity_usage() == {}
+
+
+def test_delegated_requests_emit_the_capacity_metrics_once(dynamodb_table, capsys):
+    event = {
+        "resource": "/api/v1/recipes",
+        "path": "/api/v1/recipes",
+        "httpMethod": "GET",
+        "headers": {},
+        "multiValueHeaders": {},
+        # The descending order is not supported natively (delegated to FastAPI)
+        "queryStringParameters": {"user_email": USER_EMAIL, "order": "desc"},
+        "multiValueQueryStringParameters": {},
+        "pathParameters": None,
+        "requestContext": {"resourcePath": "/api/v1/recipes", "httpMethod": "GET"},
+        "body": None,
+        "isBase64Encoded": False,
+    }
+    asyncio.set_event_loop(asyncio.new_event_loop())  # Used by Mangum
+    response = native_handler.handler(event, None)
+    assert response["statusCode"] == 200
+
+    # One record per access pattern, for the whole invocation
+    access_patterns = [
+        record["access_pattern"]
+        for record in read_capacity_records(capsys.readouterr().out)
+    ]
+    assert access_patterns
+    assert len(access_patterns) == len(set(access_patterns))
@@ -0,0 +1,49 @@
+# Built-in imports
+import importlib.util
+import os
+
+# External imports
+import pytest
+
+TOOL_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "tools", "cold_start_profiler.py"
+)
+spec = importlib.util.spec_from_file_location("cold_start_profiler", TOOL_PATH)
+cold_start_profiler = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(cold_start_profiler)
+
+# Generous budget for the init phase (CI runners are slower than Lambda)
+MAX_INIT_MS = 5000
+
+
+def test_parse_importtime_builds_the_tree():
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:        10 |         10 |     b.c",
+            "import time:        20 |         30 |   b",
+            "import time:         5 |         35 | a",
+        ]
+    )
+    (root,) = cold_start_profiler.parse_importtime(output)
+    assert (root.name, root.cumulative_us) == ("a", 35)
+    assert root.children[0].name == "b"
+    assert root.children[0].children[0].name == "b.c"
+
+
+@pytest.mark.parametrize(
+    "entry_point, deferred_modules",
+    [
+        ("backend-api", {"jsonschema"}),
+        ("backend-api-native", {"fastapi", "mangum", "jsonschema"}),
+        ("backend-imports", {"fastapi", "jsonschema"}),
+        ("chatbot-state-machine", {"requests", "boto3"}),
+        ("chatbot-fetch-recipes", {"fastapi"}),
+    ],
+)
+def test_entry_points_defer_heavy_imports_and_io(entry_point, deferred_modules):
+    profile = cold_start_profiler.profile_entry_point(entry_point)
+    assert profile.error is None
+    assert profile.network_io == []
+    assert not deferred_modules & profile.modules
+    assert profile.init_ms < MAX_INIT_MS
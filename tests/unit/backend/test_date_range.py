@@ -0,0 +1,96 @@
+# External imports
+import pytest
+from fastapi.testclient import TestClient
+
+# Own imports
+from access_patterns import recipes as recipes_access_pattern
+from api.v1.main import app
+
+USER_EMAIL = "rick@example.com"
+PARAMS = {"user_email": USER_EMAIL}
+RECIPE_DATES = ["2024-01-15", "2024-02-01", "2024-02-20", "2024-03-05"]
+
+
+@pytest.fixture
+def client(dynamodb_table):
+    client = TestClient(app)
+    for recipe_date in RECIPE_DATES:
+        client.post(
+            "/api/v1/recipes",
+            json={
+                "user_email": USER_EMAIL,
+                "recipe_title": f"Recipe {recipe_date}",
+                "recipe_date": recipe_date,
+            },
+        )
+    return client
+
+
+def get_recipe_dates(response) -> list[str]:
+    return [item["recipe_date"] for item in response.json()["items"]]
+
+
+def test_date_range_is_inclusive(client):
+    response = client.get(
+        "/api/v1/recipes",
+        params={**PARAMS, "date_from": "2024-02-01", "date_to": "2024-02-29"},
+    )
+    assert get_recipe_dates(response) == ["2024-02-01", "2024-02-20"]
+    assert response.json()["next_token"] is None
+
+
+def test_date_range_is_paginated(client):
+    params = {**PARAMS, "date_from": "2024-01-01", "limit": 2}
+
+    response = client.get("/api/v1/recipes", params=params)
+    assert get_recipe_dates(response) == ["2024-01-15", "2024-02-01"]
+
+    response = client.get(
+        "/api/v1/recipes",
+        params={**params, "next_token": response.json()["next_token"]},
+    )
+    assert get_recipe_dates(response) == ["2024-02-20", "2024-03-05"]
+
+
+def test_next_tokens_are_not_interchangeable_between_queries(client):
+    date_params = {**PARAMS, "date_from": "2024-01-01", "limit": 2}
+    date_token = client.get("/api/v1/recipes", params=date_params).json()
+    list_token = client.get("/api/v1/recipes", params={**PARAMS, "limit": 2}).json()
+
+    response = client.get(
+        "/api/v1/recipes",
+        params={**PARAMS, "limit": 2, "next_token": date_token["next_token"]},
+    )
+    assert response.status_code == 400
+    response = client.get(
+        "/api/v1/recipes",
+        params={**date_params, "next_token": list_token["next_token"]},
+    )
+    assert response.status_code == 400
+
+
+def test_latest_recipes_are_sorted_in_descending_order(client):
+    # Note: moto 4 applies "Limit" before "ScanIndexForward" on indexes, so the
+    # limit is not part of this test (DynamoDB reads the latest items first)
+    response = client.get(
+        "/api/v1/recipes", params={**PARAMS, "order": "desc", "limit": 10}
+    )
+    assert get_recipe_dates(response) == RECIPE_DATES[::-1]
+
+
+def test_date_range_rejects_invalid_ranges(client):
+    response = client.get(
+        "/api/v1/recipes",
+        params={**PARAMS, "date_from": "2024-03-01", "date_to": "2024-02-01"},
+    )
+    assert response.status_code == 400
+
+    response = client.get("/api/v1/recipes", params={**PARAMS, "date_to": "03/2024"})
+    assert response.status_code == 422
+
+
+def test_date_range_requires_the_recipe_date_index(client, monkeypatch):
+    monkeypatch.setattr(recipes_access_pattern, "RECIPE_DATE_INDEX_ENABLED", False)
+    response = client.get("/api/v1/recipes", params={**PARAMS, "order": "desc"})
+    assert response.status_code == 501
+    assert client.get("/api/v1/recipes", params=PARAMS).status_code == 200
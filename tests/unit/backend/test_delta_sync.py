@@ -0,0 +1,83 @@
+# Built-in imports
+import time
+from datetime import datetime, timedelta, timezone
+
+# External imports
+import pytest
+from fastapi.testclient import TestClient
+
+# Own imports
+from access_patterns import recipes as recipes_access_pattern
+from api.v1.main import app
+
+USER_EMAIL = "rick@example.com"
+PARAMS = {"user_email": USER_EMAIL}
+
+
+@pytest.fixture
+def client(dynamodb_table, mocker):
+    mocker.patch.object(
+        recipes_access_pattern, "SYNC_SAFETY_WINDOW", timedelta(seconds=0)
+    )
+    return TestClient(app)
+
+
+def create_recipe(client, title: str) -> str:
+    response = client.post(
+        "/api/v1/recipes",
+        json={
+            "user_email": USER_EMAIL,
+            "recipe_title": title,
+            "recipe_date": "2024-01-01",
+        },
+    )
+    return response.json()["SK"].split("#", 1)[1]
+
+
+def iso_days_ago(days: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+
+
+def test_delta_sync_returns_changes_and_tombstones(client, dynamodb_table):
+    arepas_ulid = create_recipe(client, "Arepas")
+
+    response = client.get(
+        "/api/v1/recipes", params={**PARAMS, "updated_since": iso_days_ago(1)}
+    )
+    delta = response.json()
+    assert [item["recipe_title"] for item in delta["items"]] == ["Arepas"]
+    assert delta["deleted"] == []
+    assert delta["full_sync_required"] is False
+
+    pasta_ulid = create_recipe(client, "Pasta")
+    client.delete(f"/api/v1/recipes/{arepas_ulid}", params=PARAMS)
+
+    response = client.get(
+        "/api/v1/recipes", params={**PARAMS, "updated_since": delta["sync_token"]}
+    )
+    delta = response.json()
+    assert [item["SK"] for item in delta["items"]] == [f"RECIPE#{pasta_ulid}"]
+    assert delta["deleted"] == [arepas_ulid]
+
+    tombstone = dynamodb_table.get_item(
+        Key={"PK": f"USER#{USER_EMAIL}", "SK": f"TOMBSTONE#{arepas_ulid}"}
+    )["Item"]
+    assert tombstone["ttl"] > time.time()
+
+
+def test_delta_sync_requires_full_sync_after_retention(client):
+    create_recipe(client, "Arepas")
+
+    response = client.get(
+        "/api/v1/recipes", params={**PARAMS, "updated_since": iso_days_ago(60)}
+    )
+    delta = response.json()
+    assert delta["full_sync_required"] is True
+    assert [item["recipe_title"] for item in delta["items"]] == ["Arepas"]
+
+
+def test_delta_sync_rejects_invalid_timestamps(client):
+    response = client.get(
+        "/api/v1/recipes", params={**PARAMS, "updated_since": "yesterday"}
+    )
+    assert response.status_code == 400
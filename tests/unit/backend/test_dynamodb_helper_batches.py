@@ -0,0 +1,135 @@
+# External imports
+import pytest
+
+# Own imports
+from common.exceptions import UnprocessedKeysError
+from helpers.dynamodb_helper import DynamoDBHelper
+from conftest import TABLE_NAME
+
+PARTITION_KEY = "USER#rick@example.com"
+
+
+@pytest.fixture
+def dynamodb_helper(dynamodb_table, mocker):
+    for index in range(3):
+        dynamodb_table.put_item(
+            Item={"PK": PARTITION_KEY, "SK": f"RECIPE#{index}", "title": str(index)},
+        )
+    mocker.patch.object(DynamoDBHelper, "_sleep_with_backoff")
+    return DynamoDBHelper(TABLE_NAME)
+
+
+def recipe_key(index) -> dict:
+    return {"PK": PARTITION_KEY, "SK": f"RECIPE#{index}"}
+
+
+def test_batch_get_items_keeps_input_order(dynamodb_helper):
+    items = dynamodb_helper.batch_get_items(
+        keys=[recipe_key(2), recipe_key("missing"), recipe_key(0), recipe_key(2)],
+        projection=["title"],
+    )
+    assert [item and item["title"] for item in items] == ["2", None, "0", "2"]
+
+
+def test_batch_get_items_retries_unprocessed_keys(dynamodb_helper, mocker):
+    original_batch_get_item = dynamodb_helper.dynamodb_resource.batch_get_item
+    responses = [
+        {
+            "Responses": {TABLE_NAME: []},
+            "UnprocessedKeys": {TABLE_NAME: {"Keys": [recipe_key(1)]}},
+        }
+    ]
+
+    def flaky_batch_get_item(RequestItems, **kwargs):
+        return (
+            responses.pop()
+            if responses
+            else original_batch_get_item(RequestItems=RequestItems, **kwargs)
+        )
+
+    mocker.patch.object(
+        dynamodb_helper.dynamodb_resource,
+        "batch_get_item",
+        side_effect=flaky_batch_get_item,
+    )
+    items = dynamodb_helper.batch_get_items(keys=[recipe_key(1)])
+    assert items[0]["title"] == "1"
+    assert dynamodb_helper.dynamodb_resource.batch_get_item.call_count == 2
+    DynamoDBHelper._sleep_with_backoff.assert_called_once_with(0)
+
+
+def low_level_item(index) -> dict:
+    return {
+        "PK": {"S": PARTITION_KEY},
+        "SK": {"S": f"RECIPE#new-{index}"},
+        "title": {"S": f"new-{index}"},
+    }
+
+
+def test_batch_write_items_writes_all_chunks(dynamodb_helper, dynamodb_table):
+    errors = dynamodb_helper.batch_write_items(
+        [low_level_item(index) for index in range(60)], max_workers=3
+    )
+    assert errors == [None] * 60
+    assert dynamodb_table.scan(Select="COUNT")["Count"] == 63
+
+
+def test_batch_write_items_retries_unprocessed_items(dynamodb_helper, mocker):
+    original_batch_write_item = dynamodb_helper.dynamodb_client.batch_write_item
+    responses = [
+        {
+            "UnprocessedItems": {
+                TABLE_NAME: [{"PutRequest": {"Item": low_level_item(1)}}]
+            }
+        }
+    ]
+
+    def flaky_batch_write_item(RequestItems, **kwargs):
+        original_batch_write_item(RequestItems=RequestItems, **kwargs)
+        return responses.pop() if responses else {}
+
+    mocker.patch.object(
+        dynamodb_helper.dynamodb_client,
+        "batch_write_item",
+        side_effect=flaky_batch_write_item,
+    )
+    errors = dynamodb_helper.batch_write_items([low_level_item(0), low_level_item(1)])
+    assert errors == [None, None]
+    retried_requests = dynamodb_helper.dynamodb_client.batch_write_item.call_args[1]
+    assert retried_requests["RequestItems"][TABLE_NAME] == [
+        {"PutRequest": {"Item": low_level_item(1)}}
+    ]
+    DynamoDBHelper._sleep_with_backoff.assert_called_once_with(0)
+
+
+def test_batch_write_items_reports_items_never_processed(dynamodb_helper, mocker):
+    mocker.patch.object(
+        dynamodb_helper.dynamodb_client,
+        "batch_write_item",
+        return_value={
+            "UnprocessedItems": {
+                TABLE_NAME: [{"PutRequest": {"Item": low_level_item(1)}}]
+            }
+        },
+    )
+    errors = dynamodb_helper.batch_write_items(
+        [low_level_item(0), low_level_item(1)], max_attempts=2
+    )
+    assert errors == [None, "Item not processed after 2 attempts"]
+    DynamoDBHelper._sleep_with_backoff.assert_called_once_with(0)
+
+
+def test_batch_get_items_raises_keys_never_processed(dynamodb_helper, mocker):
+    mocker.patch.object(
+        dynamodb_helper.dynamodb_resource,
+        "batch_get_item",
+        return_value={
+            "Responses": {TABLE_NAME: []},
+            "UnprocessedKeys": {TABLE_NAME: {"Keys": [recipe_key(1)]}},
+        },
+    )
+    with pytest.raises(UnprocessedKeysError) as error:
+        dynamodb_helper.batch_get_items(keys=[recipe_key(1)], max_attempts=2)
+    assert error.value.keys == [recipe_key(1)]
+    # There is no backoff after the last attempt
+    DynamoDBHelper._sleep_with_backoff.assert_called_once_with(0)
@@ -0,0 +1,119 @@
+# External imports
+import pytest
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+# Own imports
+from helpers.dynamodb_helper import DynamoDBHelper
+from helpers.expression_builder import build_update_params
+from conftest import TABLE_NAME
+
+PARTITION_KEY = "USER#rick@example.com"
+SORT_KEY = "RECIPE#01"
+
+
+@pytest.fixture
+def dynamodb_helper(dynamodb_table):
+    dynamodb_table.put_item(
+        Item={
+            "PK": PARTITION_KEY,
+            "SK": SORT_KEY,
+            "recipe_title": "Pasta",
+            "recipe_details": "Boil water",
+            "views": 1,
+            "tags": ["italian"],
+        }
+    )
+    return DynamoDBHelper(TABLE_NAME)
+
+
+def get_item(dynamodb_table) -> dict:
+    return dynamodb_table.get_item(Key={"PK": PARTITION_KEY, "SK": SORT_KEY})["Item"]
+
+
+def test_build_update_params_uses_placeholders():
+    update_params = build_update_params(
+        set_attributes={"name": "Pasta", "date": None},
+        add_attributes={"views": 1},
+        append_attributes={"tags": ["quick"]},
+    )
+    assert update_params["UpdateExpression"] == (
+        "SET #attr0 = :val0, "
+        "#attr2 = list_append(if_not_exists(#attr2, :val1), :val2) "
+        "REMOVE #attr1 ADD #attr3 :val3"
+    )
+    assert update_params["ExpressionAttributeNames"] == {
+        "#attr0": "name",
+        "#attr1": "date",
+        "#attr2": "tags",
+        "#attr3": "views",
+    }
+    assert update_params["ExpressionAttributeValues"] == {
+        ":val0": "Pasta",
+        ":val1": [],
+        ":val2": ["quick"],
+        ":val3": 1,
+    }
+
+
+def test_build_update_params_rejects_invalid_input():
+    with pytest.raises(ValueError):
+        build_update_params()
+    with pytest.raises(ValueError):
+        build_update_params(add_attributes={"views": "1"})
+    with pytest.raises(ValueError):
+        build_update_params(append_attributes={"tags": "quick"})
+
+
+def test_update_item_with_reserved_words_and_remove(dynamodb_helper, dynamodb_table):
+    dynamodb_helper.update_item(
+        partition_key=PARTITION_KEY,
+        sort_key=SORT_KEY,
+        data_attributes_only={"name": "Pasta", "status": "ok", "recipe_details": None},
+    )
+    item = get_item(dynamodb_table)
+    assert item["name"] == "Pasta"
+    assert item["status"] == "ok"
+    assert "recipe_details" not in item
+
+
+def test_update_item_with_counters_and_appends(dynamodb_helper, dynamodb_table):
+    response = dynamodb_helper.update_item(
+        partition_key=PARTITION_KEY,
+        sort_key=SORT_KEY,
+        increments={"views": 2, "likes": 1},
+        appends={"tags": ["quick"], "comments": ["Great"]},
+        return_values="ALL_NEW",
+    )
+    assert response["Attributes"]["views"] == 3
+    assert response["Attributes"]["likes"] == 1
+    assert get_item(dynamodb_table)["tags"] == ["italian", "quick"]
+    assert get_item(dynamodb_table)["comments"] == ["Great"]
+
+
+def test_update_item_with_conditions(dynamodb_helper):
+    dynamodb_helper.update_item(
+        partition_key=PARTITION_KEY,
+        sort_key=SORT_KEY,
+        data_attributes_only={"recipe_title": "Pizza"},
+        must_exist=True,
+        condition=Attr("views").eq(1),
+    )
+
+    with pytest.raises(ClientError) as error:
+        dynamodb_helper.update_item(
+            partition_key=PARTITION_KEY,
+            sort_key=SORT_KEY,
+            data_attributes_only={"recipe_title": "Salad"},
+            condition=Attr("views").eq(5),
+        )
+    assert dynamodb_helper.is_conditional_check_failed(error.value)
+
+    with pytest.raises(ClientError) as error:
+        dynamodb_helper.update_item(
+            partition_key=PARTITION_KEY,
+            sort_key="RECIPE#MISSING",
+            data_attributes_only={"recipe_title": "Salad"},
+            must_exist=True,
+        )
+    assert dynamodb_helper.is_conditional_check_failed(error.value)
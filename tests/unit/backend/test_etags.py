@@ -0,0 +1,225 @@
+# External imports
+import pytest
+from botocore.exceptions import ClientError
+from fastapi.testclient import TestClient
+
+# Own imports
+from access_patterns.recipes import dynamodb_helper
+from api.v1.main import app
+from helpers.etag_helper import build_etag, etag_matches
+
+USER_EMAIL = "rick@example.com"
+
+
+@pytest.fixture
+def client(dynamodb_table):
+    return TestClient(app)
+
+
+def create_recipe(client, title: str) -> str:
+    response = client.post(
+        "/api/v1/recipes",
+        json={
+            "user_email": USER_EMAIL,
+            "recipe_title": title,
+            "recipe_date": "2024-01-01",
+        },
+    )
+    return response.json()["SK"].split("#", 1)[1]
+
+
+def test_etag_matches():
+    etag = build_etag("USER#rick@example.com", 1)
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(build_etag("USER#rick@example.com", 2), etag)
+
+
+def test_collection_etag_changes_on_writes(client, dynamodb_table):
+    create_recipe(client, "Arepas")
+    params = {"user_email": USER_EMAIL}
+
+    response = client.get("/api/v1/recipes", params=params)
+    etag = response.headers["ETag"]
+    assert response.status_code == 200
+
+    response = client.get(
+        "/api/v1/recipes", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # Other representations of the collection have their own ETag
+    response = client.get(
+        "/api/v1/recipes",
+        params={**params, "fields": "recipe_title"},
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 200
+
+    create_recipe(client, "Pasta")
+    response = client.get(
+        "/api/v1/recipes", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    assert response.headers["ETag"] != etag
+
+
+def test_collection_etag_without_meta_item(client, dynamodb_table):
+    dynamodb_table.put_item(
+        Item={
+            "PK": f"USER#{USER_EMAIL}",
+            "SK": "RECIPE#01J9Z3Q4X0000000000000LGCY",
+            "recipe_title": "Legacy",
+            "recipe_date": "2024-01-01",
+        }
+    )
+    params = {"user_email": USER_EMAIL}
+
+    etag = client.get("/api/v1/recipes", params=params).headers["ETag"]
+    response = client.get(
+        "/api/v1/recipes", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+
+def test_item_etag_changes_on_patch(client, dynamodb_table):
+    ulid = create_recipe(client, "Arepas")
+    params = {"user_email": USER_EMAIL}
+
+    response = client.get(f"/api/v1/recipes/{ulid}", params=params)
+    etag = response.headers["ETag"]
+    assert response.json()["recipe_title"] == "Arepas"
+
+    response = client.get(
+        f"/api/v1/recipes/{ulid}", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    # Sparse fieldsets do not leak the "updated_at" used by the ETag
+    response = client.get(
+        f"/api/v1/recipes/{ulid}", params={**params, "fields": "recipe_title"}
+    )
+    assert response.json() == {"recipe_title": "Arepas"}
+
+    client.patch(
+        f"/api/v1/recipes/{ulid}", params=params, json={"recipe_title": "Arepas!"}
+    )
+    response = client.get(
+        f"/api/v1/recipes/{ulid}", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["recipe_title"] == "Arepas!"
+
+
+def test_sparse_fieldsets_only_return_the_requested_keys(client, dynamodb_table):
+    ulid = create_recipe(client, "Arepas")
+    missing_ulid = "01J9Z3Q4X0000000000000MSNG"
+    params = {"user_email": USER_EMAIL, "fields": "recipe_title"}
+
+    response = client.get("/api/v1/recipes", params=params)
+    assert response.json() == [{"recipe_title": "Arepas"}]
+    response = client.get("/api/v1/recipes", params={**params, "limit": 10})
+    assert response.json()["items"] == [{"recipe_title": "Arepas"}]
+    response = client.get(
+        "/api/v1/recipes", params=params, headers={"Accept": "application/x-ndjson"}
+    )
+    assert response.text == '{"recipe_title":"Arepas"}\n'
+    response = client.post(
+        "/api/v1/recipes:batchGet",
+        params={"fields": "recipe_title"},
+        json={"user_email": USER_EMAIL, "recipe_ids": [ulid, missing_ulid]},
+    )
+    assert response.json() == {
+        "items": [{"recipe_title": "Arepas"}],
+        "not_found": [missing_ulid],
+    }
+
+    # Requested keys are returned
+    response = client.get(
+        f"/api/v1/recipes/{ulid}", params={**params, "fields": "PK,SK"}
+    )
+    assert response.json() == {"PK": f"USER#{USER_EMAIL}", "SK": f"RECIPE#{ulid}"}
+
+
+def test_writes_are_single_conditional_calls_plus_the_version_bump(
+    client, dynamodb_table, mocker
+):
+    ulid = create_recipe(client, "Arepas")
+    update_item = mocker.spy(dynamodb_helper, "update_item")
+    delete_item = mocker.spy(dynamodb_helper, "delete_item")
+    get_item = mocker.spy(dynamodb_helper, "get_item_by_pk_and_sk")
+    params = {"user_email": USER_EMAIL}
+
+    response = client.patch(
+        f"/api/v1/recipes/{ulid}", params=params, json={"recipe_title": "Pasta"}
+    )
+    assert response.json()["recipe_title"] == "Pasta"
+    response = client.delete(f"/api/v1/recipes/{ulid}", params=params)
+    assert response.json()["recipe_title"] == "Pasta"
+
+    # The PATCH and its version bump (the new item is returned by the write)
+    assert update_item.call_count == 3
+    assert update_item.call_args_list[0].kwargs["return_values"] == "ALL_NEW"
+    assert delete_item.call_args.kwargs["return_values"] == "ALL_OLD"
+    assert get_item.call_count == 0
+    meta = dynamodb_table.get_item(
+        Key={"PK": f"USER#{USER_EMAIL}", "SK": "META#RECIPES"}
+    )
+    assert meta["Item"]["recipes_version"] == 3
+    assert meta["Item"]["recipes_count"] == 0
+
+    # Nothing is written when the RECIPE item does not exist
+    response = client.patch(
+        f"/api/v1/recipes/{ulid}", params=params, json={"recipe_title": "Pasta"}
+    )
+    assert response.status_code == 400
+    meta = dynamodb_table.get_item(
+        Key={"PK": f"USER#{USER_EMAIL}", "SK": "META#RECIPES"}
+    )
+    assert meta["Item"]["recipes_version"] == 3
+
+
+def test_failed_version_bumps_fail_the_request(client, dynamodb_table, mocker):
+    ulid = create_recipe(client, "Arepas")
+    patched_update_item = dynamodb_helper.update_item
+
+    def update_item(**kwargs):
+        if kwargs["sort_key"] == "META#RECIPES":
+            raise ClientError({"Error": {"Code": "InternalServerError"}}, "UpdateItem")
+        return patched_update_item(**kwargs)
+
+    mocker.patch.object(dynamodb_helper, "update_item", side_effect=update_item)
+    # Not a 200 with a stale collection ETag (the PATCH can be retried)
+    with pytest.raises(ClientError):
+        client.patch(
+            f"/api/v1/recipes/{ulid}",
+            params={"user_email": USER_EMAIL},
+            json={"recipe_title": "Pasta"},
+        )
+
+
+def test_write_responses_skip_the_jsonable_encoder(client, dynamodb_table, mocker):
+    jsonable_encoder = mocker.patch(
+        "fastapi.routing.jsonable_encoder", side_effect=AssertionError
+    )
+    ulid = create_recipe(client, "Arepas")
+    params = {"user_email": USER_EMAIL}
+    response = client.patch(
+        f"/api/v1/recipes/{ulid}", params=params, json={"recipe_title": "Pasta"}
+    )
+    assert response.json()["recipe_title"] == "Pasta"
+    response = client.post(
+        "/api/v1/recipes:batchCreate",
+        json={
+            "user_email": USER_EMAIL,
+            "recipes": [{"recipe_title": "Soup", "recipe_date": "2024-01-01"}],
+        },
+    )
+    assert response.json()["created"] == 1
+    assert client.delete(f"/api/v1/recipes/{ulid}", params=params).status_code == 200
+    jsonable_encoder.assert_not_called()
@@ -0,0 +1,174 @@
+# Built-in imports
+import asyncio
+import json
+from typing import Optional
+
+# External imports
+import pytest
+
+# Own imports
+from api.v1 import native_handler
+from api.v1.main import handler as fastapi_handler
+
+USER_EMAIL = "rick+test@example.com"
+
+
+def build_event(
+    method: str,
+    resource: str,
+    path_parameters: Optional[dict] = None,
+    query: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    body: Optional[dict] = None,
+) -> dict:
+    """Build an API-GW proxy event (REST API) as the ones sent to the handlers."""
+    path = resource.format(**(path_parameters or {}))
+    return {
+        "resource": resource,
+        "path": path,
+        "httpMethod": method,
+        "headers": headers or {},
+        "multiValueHeaders": {key: [value] for key, value in (headers or {}).items()},
+        "queryStringParameters": query,
+        "multiValueQueryStringParameters": query
+        and {key: [value] for key, value in query.items()},
+        "pathParameters": path_parameters,
+        "requestContext": {
+            "resourcePath": resource,
+            "httpMethod": method,
+            "path": path,
+        },
+        "body": json.dumps(body) if body is not None else None,
+        "isBase64Encoded": False,
+    }
+
+
+def invoke_both(event: dict) -> tuple[dict, dict]:
+    """Invoke the native and the FastAPI handlers with the same event."""
+    return native_handler.handler(event, None), fastapi_handler(event, None)
+
+
+def assert_same_response(native_response: dict, fastapi_response: dict) -> None:
+    native_headers = native_response["headers"]
+    fastapi_headers = {
+        key.lower(): value for key, value in fastapi_response["headers"].items()
+    }
+    assert native_response["statusCode"] == fastapi_response["statusCode"]
+    assert native_headers.get("ETag") == fastapi_headers.get("etag")
+    if native_response["statusCode"] != 304:
+        assert json.loads(native_response["body"]) == json.loads(
+            fastapi_response["body"]
+        )
+
+
+@pytest.fixture(autouse=True)
+def event_loop_for_mangum():
+    """Mangum uses the current event loop (closed by "asyncio.run" in other tests)."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield
+    asyncio.set_event_loop(None)
+    loop.close()
+
+
+@pytest.fixture
+def recipe_id(dynamodb_table) -> str:
+    event = build_event(
+        "POST",
+        "/api/v1/recipes",
+        body={
+            "user_email": USER_EMAIL,
+            "recipe_title": "Arepas",
+            "recipe_date": "2024-01-01",
+        },
+    )
+    response = native_handler.handler(event, None)
+    assert response["statusCode"] == 200
+    return json.loads(response["body"])["SK"].split("#", 1)[1]
+
+
+def test_reads_have_the_same_contract_as_fastapi(recipe_id):
+    query = {"user_email": USER_EMAIL.replace("+", " ")}
+    for resource, path_parameters, extra_query in (
+        ("/api/v1/recipes", None, {}),
+        ("/api/v1/recipes", None, {"fields": "recipe_title"}),
+        ("/api/v1/recipes", None, {"limit": "1"}),
+        ("/api/v1/recipes", None, {"fields": "unknown"}),
+        ("/api/v1/recipes/{recipe_id}", {"recipe_id": recipe_id}, {}),
+        ("/api/v1/recipes/{recipe_id}", {"recipe_id": recipe_id}, {"fields": "SK"}),
+        ("/api/v1/recipes/{recipe_id}", {"recipe_id": "missing"}, {}),
+    ):
+        event = build_event(
+            "GET", resource, path_parameters, query={**query, **extra_query}
+        )
+        native_response, fastapi_response = invoke_both(event)
+        assert_same_response(native_response, fastapi_response)
+
+        # Conditional requests with the ETag of the other handler
+        etag = native_response["headers"].get("ETag")
+        if etag:
+            event["headers"] = {"If-None-Match": etag}
+            native_response, fastapi_response = invoke_both(event)
+            assert native_response["statusCode"] == 304
+            assert_same_response(native_response, fastapi_response)
+
+
+def test_writes_have_the_same_contract_as_fastapi(recipe_id):
+    path_parameters = {"recipe_id": recipe_id}
+    query = {"user_email": USER_EMAIL}
+
+    # Validation errors
+    for method, resource, body in (
+        ("POST", "/api/v1/recipes", {"user_email": USER_EMAIL}),
+        ("PATCH", "/api/v1/recipes/{recipe_id}", {"recipe_title": 1}),
+    ):
+        event = build_event(method, resource, path_parameters, query, body=body)
+        native_response, fastapi_response = invoke_both(event)
+        assert native_response["statusCode"] == 400
+        assert_same_response(native_response, fastapi_response)
+
+    event = build_event(
+        "PATCH",
+        "/api/v1/recipes/{recipe_id}",
+        path_parameters,
+        query,
+        body={"recipe_title": "Arepas con queso"},
+    )
+    response = native_handler.handler(event, None)
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["recipe_title"] == "Arepas con queso"
+
+    event = build_event("DELETE", "/api/v1/recipes/{recipe_id}", path_parameters, query)
+    response = native_handler.handler(event, None)
+    assert response["statusCode"] == 200
+    event = build_event("GET", "/api/v1/recipes/{recipe_id}", path_parameters, query)
+    assert_same_response(*invoke_both(event))
+
+
+def test_unsupported_requests_are_delegated_to_fastapi(recipe_id):
+    for event in (
+        build_event("GET", "/api/v1/recipes", query={"user_email": USER_EMAIL})
+        | {"headers": {"Accept": "application/x-ndjson"}},
+        build_event("GET", "/api/v1/recipes", query={"limit": "1"}),
+        build_event("GET", "/api/v1/recipes", query={"limit": "1000"}),
+        build_event("POST", "/api/v1/recipes:batchGet", body={"ulids": [recipe_id]}),
+    ):
+        native_response, fastapi_response = invoke_both(event)
+        assert native_response["statusCode"] == fastapi_response["statusCode"]
+        assert native_response["body"] == fastapi_response["body"]
+
+
+def test_cors_headers(recipe_id):
+    event = build_event(
+        "GET",
+        "/api/v1/recipes",
+        query={"user_email": USER_EMAIL},
+        headers={"Origin": "https://recipes.example.com"},
+    )
+    native_response, fastapi_response = invoke_both(event)
+    fastapi_headers = {
+        key.lower(): value for key, value in fastapi_response["headers"].items()
+    }
+    for name, value in native_response["headers"].items():
+        if name.startswith("access-control-"):
+            assert fastapi_headers[name] == value
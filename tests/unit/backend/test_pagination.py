@@ -0,0 +1,71 @@
+# External imports
+import pytest
+
+# Own imports
+from helpers.dynamodb_helper import DynamoDBHelper
+from helpers.pagination_helper import decode_next_token, encode_next_token
+from conftest import TABLE_NAME
+
+PARTITION_KEY = "USER#rick@example.com"
+
+
+@pytest.fixture
+def dynamodb_helper(dynamodb_table):
+    for index in range(5):
+        dynamodb_table.put_item(
+            Item={"PK": PARTITION_KEY, "SK": f"RECIPE#{index:02d}"},
+        )
+    dynamodb_table.put_item(Item={"PK": PARTITION_KEY, "SK": "OTHER#01"})
+    return DynamoDBHelper(TABLE_NAME)
+
+
+def test_next_token_round_trip():
+    last_evaluated_key = {"PK": PARTITION_KEY, "SK": "RECIPE#01"}
+    next_token = encode_next_token(last_evaluated_key)
+    assert "=" not in next_token
+    assert decode_next_token(next_token) == last_evaluated_key
+    assert encode_next_token(None) is None
+    assert decode_next_token(None) is None
+
+
+@pytest.mark.parametrize("next_token", ["not-base64!", "W10=", "eyJQSyI6IDF9"])
+def test_decode_next_token_rejects_invalid_tokens(next_token):
+    with pytest.raises(ValueError):
+        decode_next_token(next_token)
+
+
+def test_query_page_returns_last_evaluated_key(dynamodb_helper):
+    items, last_evaluated_key = dynamodb_helper.query_page_by_pk_and_sk_begins_with(
+        partition_key=PARTITION_KEY,
+        sort_key_portion="RECIPE#",
+        limit=2,
+    )
+    assert [item["SK"] for item in items] == ["RECIPE#00", "RECIPE#01"]
+    assert last_evaluated_key == {"PK": PARTITION_KEY, "SK": "RECIPE#01"}
+
+    items, _ = dynamodb_helper.query_page_by_pk_and_sk_begins_with(
+        partition_key=PARTITION_KEY,
+        sort_key_portion="RECIPE#",
+        limit=2,
+        exclusive_start_key=last_evaluated_key,
+    )
+    assert [item["SK"] for item in items] == ["RECIPE#02", "RECIPE#03"]
+
+
+def test_iter_pages_is_lazy_and_complete(dynamodb_helper):
+    pages = dynamodb_helper.iter_pages_by_pk_and_sk_begins_with(
+        partition_key=PARTITION_KEY,
+        sort_key_portion="RECIPE#",
+        limit=2,
+    )
+    first_items, _ = next(pages)
+    assert len(first_items) == 2
+
+    remaining_items = [item for items, _ in pages for item in items]
+    assert len(remaining_items) == 3
+
+    all_items = dynamodb_helper.query_by_pk_and_sk_begins_with(
+        partition_key=PARTITION_KEY,
+        sort_key_portion="RECIPE#",
+    )
+    assert len(all_items) == 5
@@ -0,0 +1,121 @@
+# Built-in imports
+import json
+import time
+from types import SimpleNamespace
+
+# External imports
+import pytest
+from fastapi.testclient import TestClient
+
+# Own imports
+from api.v1.main import app
+from common import profiler
+from conftest import BUCKET_NAME
+
+USER_EMAIL = "rick@example.com"
+
+
+@pytest.fixture
+def profiling(monkeypatch, tmp_path):
+    """Profile all the invocations, saving the profiles to a temporary directory."""
+    monkeypatch.setattr(profiler, "PROFILING_ENABLED", True)
+    monkeypatch.setattr(profiler, "PROFILING_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(profiler, "PROFILING_INTERVAL_MS", 1.0)
+    monkeypatch.setattr(profiler, "PROFILING_OUTPUT", str(tmp_path))
+    return tmp_path
+
+
+def busy_wait(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_requests_are_profiled_with_their_correlation_id(dynamodb_table, profiling):
+    client = TestClient(app)
+    response = client.get(
+        "/api/v1/recipes",
+        params={"user_email": USER_EMAIL},
+        headers={"correlation-id": "abc-123"},
+    )
+    assert response.status_code == 200
+
+    (profile_path,) = profiling.glob("GET_api_v1_recipes/*-abc-123.speedscope.json")
+    speedscope = json.loads(profile_path.read_text())
+    assert speedscope["name"] == "GET /api/v1/recipes (correlation_id: abc-123)"
+    for profile in speedscope["profiles"]:
+        assert profile["type"] == "sampled"
+        assert len(profile["samples"]) == len(profile["weights"])
+        for sample in profile["samples"]:
+            assert max(sample) < len(speedscope["shared"]["frames"])
+
+
+def test_requests_are_profiled_by_route_template(dynamodb_table, profiling):
+    client = TestClient(app)
+    for recipe_id in ("01J5EXAMPLE0000000000000001", "01J5EXAMPLE0000000000000002"):
+        client.get(f"/api/v1/recipes/{recipe_id}", params={"user_email": USER_EMAIL})
+
+    assert [path.name for path in profiling.iterdir()] == [
+        "GET_api_v1_recipes_recipe_id"
+    ]
+    assert len(list(profiling.glob("GET_api_v1_recipes_recipe_id/*.json"))) == 2
+
+
+def test_profiles_that_fail_to_be_saved_do_not_fail_the_requests(
+    dynamodb_table, profiling, monkeypatch, caplog
+):
+    monkeypatch.setattr(profiler, "PROFILING_OUTPUT", "s3://missing-bucket/profiles")
+
+    @profiler.profile_handler()
+    def lambda_handler(event, context):
+        return "done"
+
+    assert lambda_handler({}, SimpleNamespace(aws_request_id="request-1")) == "done"
+    response = TestClient(app).get(
+        "/api/v1/recipes",
+        params={"user_email": USER_EMAIL},
+        headers={"correlation-id": "abc-123"},
+    )
+    assert response.status_code == 200
+
+    errors = [record for record in caplog.records if record.levelname == "ERROR"]
+    assert len(errors) == 2
+    assert errors[1].message.startswith(
+        "Error saving the profile of GET /api/v1/recipes"
+    )
+
+
+def test_handlers_are_profiled_to_s3(imports_bucket, profiling, monkeypatch):
+    monkeypatch.setattr(profiler, "PROFILING_OUTPUT", f"s3://{BUCKET_NAME}/profiles")
+    monkeypatch.setattr(profiler, "PROFILING_FORMAT", "collapsed")
+
+    @profiler.profile_handler(lambda event: event.get("correlation_id"))
+    def lambda_handler(event, context):
+        busy_wait(0.05)
+        return "done"
+
+    context = SimpleNamespace(aws_request_id="request-1")
+    assert lambda_handler({"correlation_id": "abc-123"}, context) == "done"
+    assert lambda_handler({}, context) == "done"
+
+    objects = {
+        obj.key: obj for obj in imports_bucket.objects.filter(Prefix="profiles/")
+    }
+    assert len(objects) == 2
+    (key,) = [key for key in objects if key.endswith("-abc-123.collapsed.txt")]
+    assert key.startswith("profiles/test_profiler/")
+    assert any(key.endswith("-request-1.collapsed.txt") for key in objects)
+
+    s3_client = imports_bucket.meta.client
+    tags = s3_client.get_object_tagging(Bucket=BUCKET_NAME, Key=key)["TagSet"]
+    assert tags == [{"Key": "correlation-id", "Value": "abc-123"}]
+    collapsed = objects[key].get()["Body"].read().decode("utf-8")
+    assert "busy_wait" in collapsed
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed.splitlines())
+
+
+def test_profiling_is_disabled_by_default(monkeypatch):
+    assert profiler.should_profile() is False
+    monkeypatch.setattr(profiler, "PROFILING_ENABLED", True)
+    monkeypatch.setattr(profiler, "PROFILING_SAMPLE_RATE", 0.0)
+    assert profiler.should_profile() is False
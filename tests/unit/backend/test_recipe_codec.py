@@ -0,0 +1,82 @@
+# Built-in imports
+import json
+from decimal import Decimal
+
+# External imports
+import pytest
+from pydantic import ValidationError
+from ulid import ULID
+
+# Own imports
+from common.serialization import dumps
+from models.recipes import RecipeCodec, RecipeModel, deserialize_item
+
+DYNAMODB_ITEM = {
+    "PK": {"S": "USER#rick@example.com"},
+    "SK": {"S": "RECIPE#01J5BQ9ZKX8T3M7C2V4N6P8R0S"},
+    "recipe_title": {"S": "Pasta"},
+    "recipe_date": {"S": "2024-08-14"},
+    "created_at": {"S": "2024-08-14T10:00:00"},
+    "updated_at": {"S": "2024-08-14T10:00:00"},
+}
+
+
+def test_deserialize_item_supports_all_attribute_types():
+    item = deserialize_item(
+        {
+            "text": {"S": "a"},
+            "number": {"N": "1.5"},
+            "flag": {"BOOL": True},
+            "empty": {"NULL": True},
+            "raw": {"B": b"bytes"},
+            "list": {"L": [{"N": "1"}, {"S": "b"}]},
+            "map": {"M": {"nested": {"BOOL": False}}},
+            "strings": {"SS": ["x", "y"]},
+            "numbers": {"NS": ["2"]},
+        }
+    )
+    assert item == {
+        "text": "a",
+        "number": Decimal("1.5"),
+        "flag": True,
+        "empty": None,
+        "raw": b"bytes",
+        "list": [Decimal("1"), "b"],
+        "map": {"nested": False},
+        "strings": {"x", "y"},
+        "numbers": {Decimal("2")},
+    }
+
+
+def test_from_dynamodb_items_round_trip():
+    (recipe,) = RecipeCodec.from_dynamodb_items([DYNAMODB_ITEM])
+    assert isinstance(recipe, RecipeModel)
+    assert recipe.recipe_details is None
+    assert recipe.to_dynamodb_dict() == DYNAMODB_ITEM
+
+
+def test_untrusted_items_are_validated():
+    item = {**deserialize_item(DYNAMODB_ITEM), "PK": "USER#not-an-email"}
+    assert RecipeCodec.from_items([item], trusted=True)[0].PK == "USER#not-an-email"
+    with pytest.raises(ValidationError):
+        RecipeCodec.from_items([item], trusted=False)
+
+
+def test_dump_json_serializes_page():
+    recipes = RecipeCodec.from_dynamodb_items([DYNAMODB_ITEM, DYNAMODB_ITEM])
+    assert json.loads(RecipeCodec.dump_json(recipes)) == [
+        recipe.model_dump() for recipe in recipes
+    ]
+
+
+def test_dumps_supports_the_types_of_the_resource_reads():
+    content = {
+        "ulid": ULID.from_str("01J5BQ9ZKX8T3M7C2V4N6P8R0S"),
+        "numbers": [Decimal("2"), Decimal("1.5"), Decimal("NaN"), Decimal("Infinity")],
+        "tags": {"pasta"},
+    }
+    assert json.loads(dumps(content)) == {
+        "ulid": "01J5BQ9ZKX8T3M7C2V4N6P8R0S",
+        "numbers": [2, 1.5, None, None],
+        "tags": ["pasta"],
+    }
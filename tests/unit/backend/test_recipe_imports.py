@@ -0,0 +1,192 @@
+# Built-in imports
+from types import SimpleNamespace
+
+# External imports
+import pytest
+from boto3.dynamodb.conditions import Key
+
+# Own imports
+from access_patterns.recipe_imports import RecipeImports, build_import_key
+from common.enums import ImportFileFormat, ImportStatus
+from helpers.s3_helper import S3Helper
+from imports import import_handler
+from conftest import BUCKET_NAME
+
+USER_EMAIL = "rick+imports@example.com"
+IMPORT_ID = "01J9Z3Q4X000000000000000MP"
+
+CSV_FILE = (
+    b"\xef\xbb\xbfrecipe_title,recipe_details,recipe_date\n"
+    b"Arepas,Corn dough,2024-01-01\r\n"
+    b'"Pasta, red",,2024-01-02\n'
+    b"Broken,row\n"
+    b"Soup,Hot,2024-01-04"
+)
+
+
+@pytest.fixture
+def lambda_context():
+    return SimpleNamespace(
+        function_name="recipe-book-imports-test",
+        memory_limit_in_mb=1024,
+        invoked_function_arn="arn:aws:lambda:us-east-1:123456789012:function:test",
+        aws_request_id="test-request-id",
+        get_remaining_time_in_millis=lambda: 900 * 1000,
+    )
+
+
+def upload_import_file(bucket, file_format: str, body: bytes) -> str:
+    key = build_import_key(USER_EMAIL, IMPORT_ID, file_format)
+    bucket.put_object(Key=key, Body=body)
+    return key
+
+
+def s3_event(key: str) -> dict:
+    return {
+        "Records": [
+            {
+                "eventSource": "aws:s3",
+                "eventName": "ObjectCreated:Put",
+                "s3": {
+                    "bucket": {"name": BUCKET_NAME},
+                    "object": {"key": key.replace("+", "%2B")},
+                },
+            }
+        ]
+    }
+
+
+def get_recipe_titles(dynamodb_table) -> list[str]:
+    items = dynamodb_table.scan()["Items"]
+    return sorted(
+        item["recipe_title"] for item in items if item["SK"].startswith("RECIPE#")
+    )
+
+
+def test_iter_lines_streams_ranged_reads(imports_bucket):
+    imports_bucket.put_object(Key="lines.txt", Body=b"a\r\nbb\n\nccc")
+    s3_helper = S3Helper(BUCKET_NAME)
+
+    assert list(s3_helper.iter_lines("lines.txt", chunk_size=3)) == [
+        (b"a", 3),
+        (b"bb", 6),
+        (b"", 7),
+        (b"ccc", 10),
+    ]
+    assert list(s3_helper.iter_lines("lines.txt", start_offset=3, chunk_size=2))[0] == (
+        b"bb",
+        6,
+    )
+
+
+def test_import_jsonl_file(dynamodb_table, imports_bucket, lambda_context):
+    jsonl_file = (
+        b'{"recipe_title": "Arepas", "recipe_date": "2024-01-01"}\n'
+        b"not json\n"
+        b'{"recipe_title": "Pasta", "recipe_date": "2024-13-01"}\n'
+        b'{"recipe_title": "Soup", "recipe_date": "2024-01-04"}\n'
+    )
+    key = upload_import_file(imports_bucket, "jsonl", jsonl_file)
+
+    import_handler.lambda_handler(s3_event(key), lambda_context)
+
+    assert get_recipe_titles(dynamodb_table) == ["Arepas", "Soup"]
+    checkpoint = RecipeImports(USER_EMAIL).get_checkpoint(IMPORT_ID)
+    assert checkpoint["import_status"] == ImportStatus.COMPLETED.value
+    assert checkpoint["rows_imported"] == 2
+    assert checkpoint["rows_failed"] == 2
+    assert [error["offset"] for error in checkpoint["errors"]] == [
+        jsonl_file.index(b"not json"),
+        jsonl_file.index(b'{"recipe_title": "Pasta"'),
+    ]
+
+    # The IMPORT items are not in the index of the delta syncs
+    indexed_items = dynamodb_table.query(
+        IndexName="GSI-UpdatedAt",
+        KeyConditionExpression=Key("PK").eq(f"USER#{USER_EMAIL}"),
+    )["Items"]
+    assert {item["SK"].split("#", 1)[0] for item in indexed_items} == {"RECIPE"}
+
+
+def test_import_csv_file_resumes_from_checkpoint(dynamodb_table, imports_bucket):
+    key = upload_import_file(imports_bucket, "csv", CSV_FILE)
+    resume_offset = CSV_FILE.index(b'"Pasta')
+    RecipeImports(USER_EMAIL).save_checkpoint(
+        import_id=IMPORT_ID,
+        import_status=ImportStatus.IN_PROGRESS,
+        next_offset=resume_offset,
+        header=["recipe_title", "recipe_details", "recipe_date"],
+        rows_imported=1,
+    )
+
+    importer = import_handler.RecipesImporter(
+        USER_EMAIL, IMPORT_ID, ImportFileFormat.CSV, key
+    )
+    assert importer.run() is True
+
+    assert get_recipe_titles(dynamodb_table) == ["Pasta, red", "Soup"]
+    checkpoint = RecipeImports(USER_EMAIL).get_checkpoint(IMPORT_ID)
+    assert checkpoint["rows_imported"] == 3
+    assert checkpoint["rows_failed"] == 1
+    assert checkpoint["next_offset"] == len(CSV_FILE)
+
+
+def test_import_stops_and_chains_before_timeout(
+    dynamodb_table, imports_bucket, lambda_context, mocker
+):
+    key = upload_import_file(imports_bucket, "csv", CSV_FILE)
+    mocker.patch.object(import_handler, "IMPORT_BATCH_SIZE", 1)
+    lambda_context.get_remaining_time_in_millis = lambda: 1000
+    continue_import = mocker.patch.object(import_handler, "continue_import")
+
+    import_handler.lambda_handler(s3_event(key), lambda_context)
+
+    assert get_recipe_titles(dynamodb_table) == ["Arepas"]
+    checkpoint = RecipeImports(USER_EMAIL).get_checkpoint(IMPORT_ID)
+    assert checkpoint["import_status"] == ImportStatus.IN_PROGRESS.value
+    assert checkpoint["next_offset"] == CSV_FILE.index(b'"Pasta')
+    assert checkpoint["header"] == ["recipe_title", "recipe_details", "recipe_date"]
+    chained_records = continue_import.call_args[0][0]
+    assert [record.raw_event for record in chained_records] == (
+        s3_event(key)["Records"]
+    )
+
+
+def test_import_chains_the_remaining_files_before_timeout(
+    dynamodb_table, imports_bucket, lambda_context, mocker
+):
+    key = upload_import_file(imports_bucket, "csv", CSV_FILE)
+    other_key = build_import_key(USER_EMAIL, "01J9Z3Q4X000000000000000MQ", "jsonl")
+    imports_bucket.put_object(Key=other_key, Body=b'{"recipe_title": "Tacos"}\n')
+    event = {"Records": s3_event(key)["Records"] + s3_event(other_key)["Records"]}
+    # The first (small) file is completed with less than the minimum time left
+    lambda_context.get_remaining_time_in_millis = lambda: 1000
+    continue_import = mocker.patch.object(import_handler, "continue_import")
+
+    import_handler.lambda_handler(event, lambda_context)
+
+    assert get_recipe_titles(dynamodb_table) == ["Arepas", "Pasta, red", "Soup"]
+    continue_import.assert_called_once()
+    chained_records = continue_import.call_args[0][0]
+    assert [record.raw_event for record in chained_records] == event["Records"][1:]
+
+
+def test_replayed_import_batches_do_not_duplicate_recipes(
+    dynamodb_table, imports_bucket
+):
+    key = upload_import_file(imports_bucket, "csv", CSV_FILE)
+    importer = import_handler.RecipesImporter(
+        USER_EMAIL, IMPORT_ID, ImportFileFormat.CSV, key
+    )
+    assert importer.run() is True
+
+    # A crash before the last checkpoint was saved replays the whole file
+    RecipeImports(USER_EMAIL).save_checkpoint(
+        import_id=IMPORT_ID, import_status=ImportStatus.IN_PROGRESS, next_offset=0
+    )
+    importer = import_handler.RecipesImporter(
+        USER_EMAIL, IMPORT_ID, ImportFileFormat.CSV, key
+    )
+    assert importer.run() is True
+
+    assert get_recipe_titles(dynamodb_table) == ["Arepas", "Pasta, red", "Soup"]
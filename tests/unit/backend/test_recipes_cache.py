@@ -0,0 +1,128 @@
+# External imports
+import pytest
+from fastapi.testclient import TestClient
+
+# Own imports
+from access_patterns import recipes as recipes_access_pattern
+from api.v1.main import app
+from helpers.cache_helper import LRUTTLCache, MemoryCacheBackend
+
+USER_EMAIL = "rick@example.com"
+PARAMS = {"user_email": USER_EMAIL}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_ttl_cache_evicts_and_expires_entries():
+    clock = FakeClock()
+    cache = LRUTTLCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.set(("USER#a", "item", 1), "one")
+    cache.set(("USER#a", "item", 2), "two")
+    assert cache.get(("USER#a", "item", 1)) == "one"
+
+    # The least recently used entry is evicted
+    cache.set(("USER#b", "item", 3), "three")
+    assert cache.get(("USER#a", "item", 2)) is None
+
+    clock.now = 10
+    assert cache.get(("USER#a", "item", 1)) is None
+    assert cache.stats() == {
+        "cache_hits": 1,
+        "cache_misses": 2,
+        "cache_evictions": 1,
+        "cache_expirations": 1,
+        "cache_size": 1,
+    }
+
+
+def test_lru_ttl_cache_invalidates_namespaces():
+    cache = LRUTTLCache()
+    cache.set(("USER#a", "item", 1), "one")
+    cache.set(("USER#a", "list"), ["one"])
+    cache.set(("USER#b", "list"), ["two"])
+
+    assert cache.invalidate("USER#a") == 2
+    assert cache.get(("USER#b", "list")) == ["two"]
+
+
+def test_memory_cache_versions_are_bounded():
+    cache = MemoryCacheBackend(max_size=2)
+    version = cache.get_version("recipes:v:USER#a")
+    assert cache.get_version("recipes:v:USER#a") == version
+    assert cache.bump_version("recipes:v:USER#a") != version
+
+    cache.get_version("recipes:v:USER#b")
+    cache.get_version("recipes:v:USER#c")
+    assert len(cache._versions._entries) == 2
+
+
+@pytest.fixture
+def client(dynamodb_table, mocker):
+    mocker.patch.object(recipes_access_pattern, "recipes_cache", MemoryCacheBackend())
+    mocker.spy(recipes_access_pattern.dynamodb_helper, "get_item_by_pk_and_sk")
+    return TestClient(app)
+
+
+def test_recipe_reads_are_cached_until_a_write(client):
+    get_item = recipes_access_pattern.dynamodb_helper.get_item_by_pk_and_sk
+    response = client.post(
+        "/api/v1/recipes",
+        json={
+            "user_email": USER_EMAIL,
+            "recipe_title": "Arepas",
+            "recipe_date": "2024-01-01",
+        },
+    )
+    ulid = response.json()["SK"].split("#", 1)[1]
+
+    client.get(f"/api/v1/recipes/{ulid}", params=PARAMS)
+    client.get(f"/api/v1/recipes/{ulid}", params=PARAMS)
+    assert get_item.call_count == 1
+
+    # The cache can be bypassed per request
+    client.get(
+        f"/api/v1/recipes/{ulid}", params=PARAMS, headers={"Cache-Control": "no-cache"}
+    )
+    assert get_item.call_count == 2
+
+    client.patch(
+        f"/api/v1/recipes/{ulid}", params=PARAMS, json={"recipe_title": "Arepas!"}
+    )
+    response = client.get(f"/api/v1/recipes/{ulid}", params=PARAMS)
+    assert response.json()["recipe_title"] == "Arepas!"
+    assert get_item.call_count == 3
+
+
+def test_recipe_lists_follow_the_collection_version(client):
+    client.post(
+        "/api/v1/recipes",
+        json={
+            "user_email": USER_EMAIL,
+            "recipe_title": "Arepas",
+            "recipe_date": "2024-01-01",
+        },
+    )
+    assert len(client.get("/api/v1/recipes", params=PARAMS).json()) == 1
+
+    # Writes from other containers only bump the META item (no local invalidation)
+    recipes_access_pattern.dynamodb_helper.table.put_item(
+        Item={
+            "PK": f"USER#{USER_EMAIL}",
+            "SK": "RECIPE#01J9Z3Q4X0000000000000OTHR",
+            "recipe_title": "Pasta",
+            "recipe_date": "2024-01-02",
+        }
+    )
+    assert len(client.get("/api/v1/recipes", params=PARAMS).json()) == 1
+    recipes_access_pattern.dynamodb_helper.update_item(
+        partition_key=f"USER#{USER_EMAIL}",
+        sort_key="META#RECIPES",
+        increments={"recipes_version": 1},
+    )
+    assert len(client.get("/api/v1/recipes", params=PARAMS).json()) == 2
@@ -0,0 +1,92 @@
+# External imports
+import pytest
+from fastapi.testclient import TestClient
+
+# Redis is only needed when the shared cache backend is configured
+fakeredis = pytest.importorskip("fakeredis")
+from redis.exceptions import ConnectionError
+
+# Own imports
+from access_patterns import recipes as recipes_access_pattern
+from api.v1.main import app
+from helpers.cache_helper import RedisCacheBackend
+
+USER_EMAIL = "rick@example.com"
+PARAMS = {"user_email": USER_EMAIL}
+NAMESPACE = f"recipes:v:USER#{USER_EMAIL}"
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis()
+
+
+def test_redis_cache_keeps_json_values_with_ttl(redis_client):
+    cache = RedisCacheBackend(client=redis_client)
+    cache.set("recipes:key", [{"SK": "RECIPE#1", "servings": 2}], ttl_seconds=30)
+
+    assert cache.get("recipes:key") == [{"SK": "RECIPE#1", "servings": 2}]
+    assert cache.get("recipes:missing") is None
+    assert 0 < redis_client.pttl("recipes:key") <= 30 * 1000
+    assert cache.stats() == {"cache_hits": 1, "cache_misses": 1, "cache_errors": 0}
+
+
+def test_redis_cache_versions_are_shared_and_bumped(redis_client):
+    cache = RedisCacheBackend(client=redis_client)
+    other_container_cache = RedisCacheBackend(client=redis_client)
+
+    version = cache.get_version(NAMESPACE)
+    assert other_container_cache.get_version(NAMESPACE) == version
+
+    # A stale reader can only write to the old version, which is never read again
+    new_version = other_container_cache.bump_version(NAMESPACE)
+    cache.set(f"recipes:{version}:list", ["stale"], ttl_seconds=30)
+    assert new_version != version
+    assert cache.get_version(NAMESPACE) == new_version
+
+
+def test_redis_cache_errors_are_cache_misses(mocker):
+    redis_client = mocker.Mock()
+    redis_client.get.side_effect = ConnectionError("Redis is down")
+    cache = RedisCacheBackend(client=redis_client)
+
+    assert cache.get("recipes:key") is None
+    assert cache.get_version(NAMESPACE) != cache.get_version(NAMESPACE)
+    assert cache.stats()["cache_errors"] == 3
+
+
+def test_recipe_reads_are_shared_between_containers(
+    dynamodb_table, redis_client, mocker
+):
+    mocker.patch.object(
+        recipes_access_pattern,
+        "recipes_cache",
+        RedisCacheBackend(client=redis_client),
+    )
+    get_item = mocker.spy(
+        recipes_access_pattern.dynamodb_helper, "get_item_by_pk_and_sk"
+    )
+    client = TestClient(app)
+    response = client.post(
+        "/api/v1/recipes",
+        json={
+            "user_email": USER_EMAIL,
+            "recipe_title": "Arepas",
+            "recipe_date": "2024-01-01",
+        },
+    )
+    ulid = response.json()["SK"].split("#", 1)[1]
+    client.get(f"/api/v1/recipes/{ulid}", params=PARAMS)
+
+    # A new container (empty process state) starts with a warm cache
+    mocker.patch.object(
+        recipes_access_pattern,
+        "recipes_cache",
+        RedisCacheBackend(client=redis_client),
+    )
+    response = client.get(f"/api/v1/recipes/{ulid}", params=PARAMS)
+    assert response.json()["recipe_title"] == "Arepas"
+    assert get_item.call_count == 1
+
+    client.delete(f"/api/v1/recipes/{ulid}", params=PARAMS)
+    assert client.get(f"/api/v1/recipes/{ulid}", params=PARAMS).json() == {}
@@ -0,0 +1,70 @@
+# Built-in imports
+import importlib.util
+import random
+import sys
+import types
+
+# Own imports
+from access_patterns import recipe_imports  # noqa: F401 (registers its hooks)
+from access_patterns.recipes import dynamodb_helper
+from api.v1.services.validator import get_validator
+from common import runtime_hooks
+from common.enums import JSONSchemaType
+from helpers import aws_clients
+
+
+def test_snapshot_and_restore_cycle(dynamodb_table):
+    get_validator.cache_clear()
+
+    # Init phase + "before snapshot" hooks (pre-warmed state is in the snapshot)
+    runtime_hooks.run_before_snapshot()
+    assert get_validator.cache_info().currsize == 2 * len(JSONSchemaType)
+    assert "jsonschema" in sys.modules
+    assert {("dynamodb", None, None), ("s3", None, None)} <= set(aws_clients._clients)
+
+    # Clients created before the snapshot (stale connections after a restore)
+    snapshot_client = aws_clients.get_client("dynamodb")
+    snapshot_table = dynamodb_helper.table
+
+    # Two environments restored from the same snapshot
+    snapshot_random_state = random.getstate()
+    restored_numbers = []
+    for _ in range(2):
+        random.setstate(snapshot_random_state)
+        runtime_hooks.run_after_restore()
+        restored_numbers.append(random.random())
+
+    assert restored_numbers[0] != restored_numbers[1]
+    restored_client = aws_clients.get_client("dynamodb")
+    assert restored_client is not snapshot_client
+    assert aws_clients.get_client("dynamodb") is restored_client
+    assert dynamodb_helper.table is not snapshot_table
+    assert dynamodb_helper.table.meta.client is (
+        aws_clients.get_resource("dynamodb").meta.client
+    )
+
+
+def test_hooks_are_registered_in_the_snapstart_runtime(monkeypatch):
+    runtime_registry = {}
+    snapshot_restore_py = types.ModuleType("snapshot_restore_py")
+    snapshot_restore_py.register_before_snapshot = (
+        lambda function: runtime_registry.setdefault("before_snapshot", function)
+    )
+    snapshot_restore_py.register_after_restore = (
+        lambda function: runtime_registry.setdefault("after_restore", function)
+    )
+    monkeypatch.setitem(sys.modules, "snapshot_restore_py", snapshot_restore_py)
+
+    # Fresh copy of the module (the one of the other modules keeps its hooks)
+    spec = importlib.util.find_spec("common.runtime_hooks")
+    hooks = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(hooks)
+
+    calls = []
+    hooks.before_snapshot(lambda: calls.append("first"))
+    hooks.before_snapshot(lambda: calls.append("second"))
+    hooks.preload("json")
+
+    runtime_registry["before_snapshot"]()
+    assert calls == ["first", "second"]
+    assert runtime_registry["after_restore"] == hooks.run_after_restore
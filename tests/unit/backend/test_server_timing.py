@@ -0,0 +1,127 @@
+# Built-in imports
+import asyncio
+import json
+
+# External imports
+import pytest
+from fastapi.testclient import TestClient
+
+# Own imports
+from api.v1 import native_handler
+from api.v1.main import app
+from api.v1.main import handler as fastapi_handler
+from common import timing
+
+USER_EMAIL = "rick@example.com"
+
+
+def build_event(method: str, resource: str, body=None) -> dict:
+    """Build an API-GW proxy event (REST API) for the RECIPE endpoints."""
+    query = {"user_email": USER_EMAIL}
+    return {
+        "resource": resource,
+        "path": resource,
+        "httpMethod": method,
+        "headers": {},
+        "multiValueHeaders": {},
+        "queryStringParameters": query,
+        "multiValueQueryStringParameters": {"user_email": [USER_EMAIL]},
+        "pathParameters": None,
+        "requestContext": {"resourcePath": resource, "httpMethod": method},
+        "body": json.dumps(body) if body is not None else None,
+        "isBase64Encoded": False,
+    }
+
+
+def read_emf_records(output: str) -> list[dict]:
+    """Get the latency EMF records from the stdout (the logs are also printed there)."""
+    records = [json.loads(line) for line in output.splitlines() if '"_aws"' in line]
+    return [record for record in records if "_aws" in record and "route" in record]
+
+
+def parse_server_timing(header: str) -> dict[str, float]:
+    stages = {}
+    for metric in header.split(", "):
+        name, duration = metric.split(";dur=")
+        stages[name] = float(duration)
+    return stages
+
+
+@pytest.fixture(autouse=True)
+def event_loop_for_mangum():
+    """Mangum uses the current event loop (closed by "asyncio.run" in other tests)."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield
+    asyncio.set_event_loop(None)
+    loop.close()
+
+
+def test_fastapi_responses_have_the_latency_breakdown(dynamodb_table, capsys):
+    event = build_event(
+        "POST",
+        "/api/v1/recipes:batchCreate",
+        body={
+            "user_email": USER_EMAIL,
+            "recipes": [{"recipe_title": "Arepas", "recipe_date": "2024-01-01"}],
+        },
+    )
+    response = fastapi_handler(event, None)
+    assert response["statusCode"] == 200
+
+    stages = parse_server_timing(response["headers"]["server-timing"])
+    assert {"validation", "dynamodb", "serialization", "app", "total"} <= set(stages)
+    assert stages["total"] >= stages["app"] >= stages["dynamodb"]
+
+    (record,) = read_emf_records(capsys.readouterr().out)
+    assert record["route"] == "POST /api/v1/recipes:batchCreate"
+    assert record["start"] in ("cold", "warm")
+    directive = record["_aws"]["CloudWatchMetrics"][0]
+    assert directive["Dimensions"] == [["route", "start", "service"]]
+    metric_names = {metric["Name"] for metric in directive["Metrics"]}
+    assert {"mangum_latency", "dynamodb_latency", "total_latency"} <= metric_names
+
+
+def test_native_responses_emit_a_single_record_when_delegating(dynamodb_table, capsys):
+    event = build_event("GET", "/api/v1/recipes")
+    response = native_handler.handler(event, None)
+    assert "dynamodb" in parse_server_timing(response["headers"]["server-timing"])
+    (native_record,) = read_emf_records(capsys.readouterr().out)
+    assert "mangum_latency" not in native_record
+
+    # The delegated request is measured (and emitted) once, by the outer timer
+    event["queryStringParameters"] = {"user_email": USER_EMAIL, "order": "desc"}
+    response = native_handler.handler(event, None)
+    assert response["statusCode"] == 200
+    assert "app" in parse_server_timing(response["headers"]["server-timing"])
+    (delegated_record,) = read_emf_records(capsys.readouterr().out)
+    assert delegated_record["route"] == "GET /api/v1/recipes"
+    assert delegated_record["start"] == "warm"
+    assert "mangum_latency" in delegated_record
+
+
+def test_metrics_are_tagged_with_the_route_template(dynamodb_table, capsys):
+    client = TestClient(app)
+    params = {"user_email": USER_EMAIL}
+    for recipe_id in ("01J5EXAMPLE0000000000000001", "01J5EXAMPLE0000000000000002"):
+        client.get(f"/api/v1/recipes/{recipe_id}", params=params)
+    client.get("/api/v1/unknown/01J5EXAMPLE0000000000000001", params=params)
+
+    records = read_emf_records(capsys.readouterr().out)
+    assert [record["route"] for record in records] == [
+        "GET /api/v1/recipes/{recipe_id}",
+        "GET /api/v1/recipes/{recipe_id}",
+        "GET unmatched",
+    ]
+
+
+def test_stages_are_not_measured_outside_of_a_request():
+    with timing.timed("dynamodb"):
+        assert timing.get_timer() is None
+
+    with timing.request_timer("GET /test") as timer:
+        with timing.timed("dynamodb"):
+            pass
+        with timing.timed("dynamodb"):
+            pass
+    assert list(timer.stages) == ["dynamodb"]
@@ -0,0 +1,144 @@
+# Built-in imports
+import os
+import sys
+
+# External imports
+import pytest
+
+# Own imports
+from bundling.lambda_bundler import BundleError, build_lambda_bundle
+
+
+def write_file(path: str, content: str = "") -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        file.write(content)
+
+
+def write_distribution(dependencies_dir: str, name: str) -> None:
+    """Install a fake distribution (package and metadata) in a directory."""
+    write_file(os.path.join(dependencies_dir, name, "__init__.py"), "VALUE = 1\n")
+    dist_info = f"{name}-1.0.dist-info"
+    write_file(
+        os.path.join(dependencies_dir, dist_info, "METADATA"),
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n",
+    )
+    write_file(
+        os.path.join(dependencies_dir, dist_info, "RECORD"),
+        f"{name}/__init__.py,,\n{dist_info}/METADATA,,\n{dist_info}/RECORD,,\n",
+    )
+
+
+def create_project(tmp_path) -> tuple[str, str]:
+    code_dir, dependencies_dir = str(tmp_path / "code"), str(tmp_path / "deps")
+    # Handler in a namespace package (no "__init__.py"), with a lazy import
+    write_file(
+        os.path.join(code_dir, "handlers", "main.py"),
+        "import json\n"
+        "from shared import used\n\n"
+        "def handler(event, context):\n"
+        "    import lazy_module\n"
+        "    return lazy_module.VALUE\n",
+    )
+    write_file(os.path.join(code_dir, "shared", "__init__.py"))
+    write_file(os.path.join(code_dir, "shared", "used.py"), "import usedpkg\n")
+    write_file(os.path.join(code_dir, "shared", "unused.py"), "import unusedpkg\n")
+    write_file(os.path.join(code_dir, "shared", "schema.json"), "{}")
+    write_file(os.path.join(code_dir, "lazy_module.py"), "VALUE = 1\n")
+    write_file(os.path.join(code_dir, "plugins", "plugin.py"), "import boto3\n")
+    write_distribution(dependencies_dir, "usedpkg")
+    write_distribution(dependencies_dir, "unusedpkg")
+    return code_dir, dependencies_dir
+
+
+def test_bundle_only_contains_the_import_closure(tmp_path):
+    code_dir, dependencies_dir = create_project(tmp_path)
+    bundle = build_lambda_bundle(
+        name="Lambda-Test",
+        code_dir=code_dir,
+        handler="handlers/main.handler",
+        output_dir=str(tmp_path / "bundles"),
+        dependencies_dir=dependencies_dir,
+        extra_modules=["plugins.plugin"],
+        precompile=True,
+        measure=True,
+    )
+
+    bundled_files = {
+        os.path.relpath(os.path.join(directory, file_name), bundle.path)
+        for directory, _, file_names in os.walk(bundle.path)
+        for file_name in file_names
+        if not file_name.endswith(".pyc")
+    }
+    assert bundled_files == {
+        "handlers/main.py",
+        "shared/__init__.py",
+        "shared/used.py",
+        "shared/schema.json",
+        "lazy_module.py",
+        "plugins/plugin.py",
+        "usedpkg/__init__.py",
+        "usedpkg-1.0.dist-info/METADATA",
+        "usedpkg-1.0.dist-info/RECORD",
+    }
+    assert bundle.distributions == ["usedpkg"]
+    assert bundle.size_bytes > 0
+    assert bundle.precompiled == (sys.version_info[:2] == (3, 11))
+
+    # The handler is imported with only the bundle (and the provided boto3)
+    assert bundle.import_error is None
+    assert bundle.import_ms > 0
+
+
+def test_bundle_is_only_rebuilt_when_its_inputs_change(tmp_path):
+    code_dir, dependencies_dir = create_project(tmp_path)
+    options = dict(
+        name="Lambda-Test",
+        code_dir=code_dir,
+        handler="handlers/main.handler",
+        output_dir=str(tmp_path / "bundles"),
+        dependencies_dir=dependencies_dir,
+    )
+    bundle = build_lambda_bundle(**options)
+    assert bundle.rebuilt is True
+    assert bundle.import_ms is None
+    assert "import not measured" in bundle.summary()
+
+    unchanged_bundle = build_lambda_bundle(**options)
+    assert unchanged_bundle.rebuilt is False
+    assert unchanged_bundle.size_bytes == bundle.size_bytes
+    assert "(unchanged)" in unchanged_bundle.summary()
+    assert build_lambda_bundle(**options, rebuild=True).rebuilt is True
+
+    write_file(os.path.join(code_dir, "lazy_module.py"), "VALUE = 2\n")
+    changed_bundle = build_lambda_bundle(**options)
+    assert changed_bundle.rebuilt is True
+    assert changed_bundle.fingerprint != bundle.fingerprint
+
+
+def test_bundle_fails_on_missing_modules(tmp_path):
+    code_dir, _ = create_project(tmp_path)
+    with pytest.raises(BundleError, match="modules not found.*: usedpkg$"):
+        build_lambda_bundle(
+            name="Lambda-Test",
+            code_dir=code_dir,
+            handler="handlers/main.handler",
+            output_dir=str(tmp_path / "bundles"),
+        )
+
+
+def test_bundle_fails_on_import_errors(tmp_path):
+    code_dir, dependencies_dir = create_project(tmp_path)
+    write_file(
+        os.path.join(code_dir, "handlers", "broken.py"),
+        "import os\n\nTABLE_NAME = os.environ['TABLE_NAME']\n",
+    )
+    with pytest.raises(BundleError, match="fails to import: KeyError"):
+        build_lambda_bundle(
+            name="Lambda-Test",
+            code_dir=code_dir,
+            handler="handlers/broken.handler",
+            output_dir=str(tmp_path / "bundles"),
+            dependencies_dir=dependencies_dir,
+            measure=True,
+        )
@@ -0,0 +1,268 @@
+################################################################################
+# Cold start profiler for the Lambda entry points. Each entry point is loaded
+# in a fresh interpreter (like the Lambda init phase) to record:
+#  - The import time of each module, as a tree (based on "-X importtime").
+#  - The I/O done during the init phase (network connections and file reads).
+# Usage: python tools/cold_start_profiler.py [ENTRY_POINT ...] [--min-ms 5]
+#        [--max-init-ms 1500] [--no-init-network] [--json]
+# Entry points are the names of <ENTRY_POINTS> or "<code_dir>:<handler>" specs
+# with the same handler format of the CDK stacks (e.g. "backend:api/v1/main.handler").
+################################################################################
+
+# Built-in imports
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Optional
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Handlers of the Lambda Functions (as configured in the CDK stacks)
+ENTRY_POINTS = {
+    "backend-api": "backend:api/v1/main.handler",
+    "backend-api-native": "backend:api/v1/native_handler.handler",
+    "backend-imports": "backend:imports/import_handler.lambda_handler",
+    "chatbot-webhook": "chatbot:whatsapp_webhook/api/v1/main.handler",
+    "chatbot-trigger": "chatbot:trigger/trigger_handler.lambda_handler",
+    "chatbot-state-machine": "chatbot:state_machine/state_machine_handler.lambda_handler",
+    "chatbot-fetch-recipes": "chatbot:bedrock_agent/lambda_function.lambda_handler",
+}
+
+# Placeholders for the environment variables required at import time (only set
+# when missing, so the real values can be used to profile against AWS)
+DEFAULT_ENVIRONMENT = {
+    "AWS_DEFAULT_REGION": "us-east-1",
+    "DYNAMODB_TABLE": "cold-start-profiler",
+    "TABLE_NAME": "cold-start-profiler",
+    "IMPORTS_BUCKET": "cold-start-profiler",
+    "SECRET_NAME": "cold-start-profiler",
+}
+
+# Files read by the import system itself (not reported as init I/O)
+IMPORT_SYSTEM_SUFFIXES = (".py", ".pyc", ".so", ".pth", ".typed", "__pycache__")
+
+# Code that runs in the fresh interpreter: audits the I/O and loads the handler
+BOOTSTRAP = """
+import importlib, json, sys, time
+start, io_events = time.perf_counter(), []
+def audit_io(event, args):
+    if event in ("socket.connect", "socket.getaddrinfo"):
+        target = args[1] if event == "socket.connect" else args[:2]
+        io_events.append({"event": event, "target": repr(target)})
+    elif event == "open" and isinstance(args[0], str) and args[0][:1] == "/":
+        if not args[0].endswith(%(suffixes)r) and "/." not in args[0]:
+            io_events.append({"event": event, "target": args[0]})
+sys.addaudithook(audit_io)
+error = None
+try:
+    getattr(importlib.import_module(sys.argv[1]), sys.argv[2])
+except BaseException as exc:
+    error = f"{type(exc).__name__}: {exc}"
+init_ms = (time.perf_counter() - start) * 1000
+print(%(marker)r + json.dumps({"init_ms": init_ms, "io": io_events, "error": error}))
+"""
+RESULT_MARKER = "COLD_START_PROFILER_RESULT="
+
+
+@dataclass
+class ImportNode:
+    """Module import with its own time and the time of its nested imports."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: list["ImportNode"] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "self_us": self.self_us,
+            "cumulative_us": self.cumulative_us,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+@dataclass
+class ColdStartProfile:
+    """Result of loading an entry point in a fresh interpreter."""
+
+    entry_point: str
+    init_ms: float
+    imports: list[ImportNode]
+    io: list[dict]
+    error: Optional[str] = None
+
+    @property
+    def modules(self) -> set[str]:
+        """Names of all the modules imported during the init phase."""
+        names, pending = set(), list(self.imports)
+        while pending:
+            node = pending.pop()
+            names.add(node.name)
+            pending.extend(node.children)
+        return names
+
+    @property
+    def network_io(self) -> list[dict]:
+        """Network I/O done during the init phase (e.g. AWS calls at import time)."""
+        return [event for event in self.io if event["event"].startswith("socket.")]
+
+    def to_dict(self) -> dict:
+        return {
+            "entry_point": self.entry_point,
+            "init_ms": round(self.init_ms, 1),
+            "error": self.error,
+            "io": self.io,
+            "imports": [node.to_dict() for node in self.imports],
+        }
+
+
+def parse_importtime(output: str) -> list[ImportNode]:
+    """
+    Build the tree of imports from the "-X importtime" output, where the nested
+    imports are reported (indented) before the module that imported them.
+    :param output (str): Standard error of the interpreter with "-X importtime".
+    """
+    pending: dict[int, list[ImportNode]] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, raw_name = line[len("import time:") :].split("|")
+        name = raw_name.rstrip()[1:]
+        level = (len(name) - len(name.lstrip())) // 2
+        node = ImportNode(
+            name=name.strip(),
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            children=pending.pop(level + 1, []),
+        )
+        pending.setdefault(level, []).append(node)
+    return pending.get(0, [])
+
+
+def profile_entry_point(entry_point: str) -> ColdStartProfile:
+    """
+    Load the handler of an entry point in a fresh interpreter and profile it.
+    :param entry_point (str): Name of <ENTRY_POINTS> or "<code_dir>:<handler>".
+    """
+    spec = ENTRY_POINTS.get(entry_point, entry_point)
+    code_dir, handler = spec.split(":", 1)
+    module_path, handler_name = handler.rsplit(".", 1)
+    module_name = module_path.replace("/", ".")
+    code_dir = os.path.join(ROOT_DIR, code_dir)
+
+    environment = {**DEFAULT_ENVIRONMENT, **os.environ, "PYTHONPATH": code_dir}
+    if not ({"AWS_ACCESS_KEY_ID", "AWS_PROFILE"} & set(environment)):
+        # Lambda provides the credentials in the environment (no IMDS lookups)
+        environment.update(AWS_ACCESS_KEY_ID="profiler", AWS_SECRET_ACCESS_KEY="x")
+    bootstrap = BOOTSTRAP % {
+        "suffixes": IMPORT_SYSTEM_SUFFIXES,
+        "marker": RESULT_MARKER,
+    }
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", bootstrap]
+        + [module_name, handler_name],
+        cwd=code_dir,
+        env=environment,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    result_lines = [
+        line for line in process.stdout.splitlines() if line.startswith(RESULT_MARKER)
+    ]
+    if not result_lines:
+        raise RuntimeError(f"Profiling of {entry_point} failed: {process.stderr}")
+
+    result = json.loads(result_lines[-1][len(RESULT_MARKER) :])
+    return ColdStartProfile(
+        entry_point=entry_point,
+        init_ms=result["init_ms"],
+        imports=parse_importtime(process.stderr),
+        io=result["io"],
+        error=result["error"],
+    )
+
+
+def format_tree(nodes: list[ImportNode], min_ms: float, depth: int = 0) -> list[str]:
+    """
+    Render the imports slower than a threshold (slowest first) as a tree.
+    :param nodes (list[ImportNode]): Imports of the same level.
+    :param min_ms (float): Minimum cumulative time of the imports to render.
+    :param depth (int): Level of the imports (indentation).
+    """
+    lines = []
+    for node in sorted(nodes, key=lambda node: node.cumulative_us, reverse=True):
+        if node.cumulative_us / 1000 < min_ms:
+            break
+        lines.append(
+            f"{node.cumulative_us / 1000:9.1f} ms {node.self_us / 1000:8.1f} ms  "
+            f"{'  ' * depth}{node.name}"
+        )
+        lines.extend(format_tree(node.children, min_ms, depth + 1))
+    return lines
+
+
+def format_profile(profile: ColdStartProfile, min_ms: float) -> str:
+    """
+    Render the report of an entry point.
+    :param profile (ColdStartProfile): Profile of the entry point.
+    :param min_ms (float): Minimum cumulative time of the imports to render.
+    """
+    lines = [
+        f"== {profile.entry_point}: init {profile.init_ms:.0f} ms "
+        f"({len(profile.modules)} modules imported)",
+        f"{'cumulative':>12} {'self':>11}  module",
+        *format_tree(profile.imports, min_ms),
+    ]
+    if profile.error:
+        lines.append(f"!! init failed: {profile.error}")
+
+    file_reads = [event for event in profile.io if event["event"] == "open"]
+    lines.append(
+        f"Init I/O: {len(profile.network_io)} network events, "
+        f"{len(file_reads)} file reads"
+    )
+    lines.extend(f"  {event['event']} {event['target']}" for event in profile.io)
+    return "\n".join(lines)
+
+
+def main(arguments: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("entry_points", nargs="*", default=list(ENTRY_POINTS))
+    parser.add_argument("--min-ms", type=float, default=5, help="tree threshold")
+    parser.add_argument("--max-init-ms", type=float, help="fail above this init")
+    parser.add_argument(
+        "--no-init-network", action="store_true", help="fail on init network I/O"
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON reports")
+    arguments = parser.parse_args(arguments)
+
+    profiles = [profile_entry_point(name) for name in arguments.entry_points]
+    if arguments.json:
+        print(json.dumps([profile.to_dict() for profile in profiles], indent=2))
+    else:
+        print("\n\n".join(format_profile(p, arguments.min_ms) for p in profiles))
+
+    # Regression checks (non-zero exit code, so they can gate the CI)
+    failures = []
+    for profile in profiles:
+        if profile.error:
+            failures.append(f"{profile.entry_point} failed to load")
+        if arguments.max_init_ms and profile.init_ms > arguments.max_init_ms:
+            failures.append(
+                f"{profile.entry_point} init took {profile.init_ms:.0f} ms "
+                f"(max: {arguments.max_init_ms:.0f} ms)"
+            )
+        if arguments.no_init_network and profile.network_io:
+            failures.append(f"{profile.entry_point} does network I/O at init")
+    for failure in failures:
+        print(f"FAILED: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())